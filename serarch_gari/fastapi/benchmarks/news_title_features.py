@@ -0,0 +1,78 @@
+"""
+제목 simhash / keyphrase 일괄 계산 벤치마크
+
+이전 구현(토큰마다 파이썬 루프)과 simhash64_batch / generate_keyphrases_batch 의
+속도와 결과 동일 여부를 비교한다.
+
+    python -m benchmarks.news_title_features [제목 수]
+"""
+from __future__ import annotations
+import re
+import sys
+import time
+import random
+import hashlib
+from typing import List
+
+from munci.news_es.utils import generate_keyphrases_batch, simhash64_batch
+
+
+def simhash64_loop(text: str) -> str:
+    """이전 구현 (토큰마다 64비트 파이썬 루프)"""
+    tokens = re.findall(r"[A-Za-z0-9가-힣]{2,}", (text or "").lower())
+    v = [0] * 64
+    for tok in tokens:
+        h = int.from_bytes(hashlib.blake2b(tok.encode("utf-8"), digest_size=8).digest(), "big")
+        for i in range(64):
+            v[i] += 1 if (h >> i) & 1 else -1
+    res = 0
+    for i in range(64):
+        if v[i] > 0:
+            res |= (1 << i)
+    return hex(res)
+
+
+def generate_keyphrases_loop(title: str, max_n: int = 32) -> List[str]:
+    """이전 구현"""
+    toks = re.findall(r"[A-Za-z0-9가-힣]{2,}", (title or "").lower())
+    phrases = set()
+    for i in range(len(toks)):
+        phrases.add(toks[i])
+        if i + 1 < len(toks):
+            bi = f"{toks[i]} {toks[i + 1]}"; phrases.add(bi); phrases.add(bi.replace(" ", ""))
+        if i + 2 < len(toks):
+            tri = f"{toks[i]} {toks[i + 1]} {toks[i + 2]}"; phrases.add(tri); phrases.add(tri.replace(" ", ""))
+    out = list(phrases); out.sort()
+    return out[:max_n]
+
+
+def benchmark(n_titles: int = 5000, seed: int = 0, repeat: int = 3):
+    rng = random.Random(seed)
+    words = ["삼성전자", "SK하이닉스", "LG에너지솔루션", "현대차", "카카오", "실적", "발표", "영업이익",
+             "증가", "감소", "주가", "급등", "급락", "반도체", "배터리", "수주", "계약", "체결", "분기",
+             "최대", "AI", "HBM", "공급", "확대", "전망", "목표가", "상향", "하향", "2024", "3Q"]
+    words += [f"w{i}" for i in range(2000)]  # 드문 토큰 (캐시 적중률 현실화)
+    titles = [" ".join(rng.choice(words) for _ in range(rng.randint(4, 14))) for _ in range(n_titles)]
+    titles.append("")
+
+    for label, fn in [
+        ("simhash64_batch", simhash64_batch),
+        ("simhash64 (loop)", lambda ts: [simhash64_loop(t) for t in ts]),
+        ("keyphrases_batch", generate_keyphrases_batch),
+        ("keyphrases (loop)", lambda ts: [generate_keyphrases_loop(t) for t in ts]),
+    ]:
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn(titles)
+            best = min(best, time.perf_counter() - started)
+        print(f"{label:>18}: {len(titles)} titles, {best * 1000:.1f} ms ({len(titles) / best:,.0f}/s)")
+
+    same_hash = simhash64_batch(titles) == [simhash64_loop(t) for t in titles]
+    same_kp = generate_keyphrases_batch(titles) == [generate_keyphrases_loop(t) for t in titles]
+    print(f"결과 동일: simhash={same_hash}, keyphrases={same_kp}")
+
+
+if __name__ == "__main__":
+    for n in ([int(sys.argv[1])] if len(sys.argv) > 1 else [1000, 5000, 20000]):
+        benchmark(n)
@@ -0,0 +1,70 @@
+"""
+회사명 매칭 겹침 해소 벤치마크
+
+이전 구현(채택 목록 전체와 쌍별 비교)과 _resolve_overlapping_matches(정렬 후 1회 순회)의
+속도와 결과 동일 여부를 비교한다.
+
+    python -m benchmarks.overlap_resolution [매칭 수]
+"""
+from __future__ import annotations
+import sys
+import time
+import random
+
+from munci.lastsa.company_extractor.modules.patterns import _match_priority, _resolve_overlapping_matches
+
+
+def resolve_overlapping_matches_pairwise(matches):
+    """이전 구현 (채택 목록 전체와 쌍별 비교)"""
+    if not matches:
+        return []
+
+    sorted_matches = sorted(matches, key=lambda x: (x[0], -x[3], -len(x[2])))
+    result = []
+
+    for current in sorted_matches:
+        cstart, cend = current[0], current[1]
+        overlapping = [e for e in result if not (cend <= e[0] or cstart >= e[1])]
+
+        if not overlapping:
+            result.append(current)
+        else:
+            best = max(overlapping + [current], key=_match_priority)
+            for ov in overlapping:
+                if ov in result:
+                    result.remove(ov)
+            result.append(best)
+
+    return result
+
+
+def benchmark(n_matches: int = 20000, seed: int = 0, repeat: int = 3):
+    rng = random.Random(seed)
+    names = ["삼성전자", "삼성", "SK하이닉스", "하이닉스", "LG에너지솔루션", "LG", "현대자동차", "현대차", "카카오"]
+    text_len = n_matches * 4
+
+    matches = []
+    for _ in range(n_matches):
+        cname = rng.choice(names)
+        alias = cname if rng.random() < 0.5 else cname[:max(2, len(cname) - 2)]
+        start = rng.randrange(text_len)
+        matches.append((start, start + len(alias), cname, rng.choice([0.7, 0.8, 0.85, 0.95]), alias))
+
+    for label, fn in [
+        ("sweep", lambda m: _resolve_overlapping_matches(None, m)),
+        ("pairwise", resolve_overlapping_matches_pairwise),
+    ]:
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            out = fn(matches)
+            best = min(best, time.perf_counter() - started)
+        print(f"{label:>9}: {n_matches} matches -> {len(out)} kept, {best * 1000:.1f} ms")
+
+    same = _resolve_overlapping_matches(None, matches) == resolve_overlapping_matches_pairwise(matches)
+    print(f"결과 동일: {same}")
+
+
+if __name__ == "__main__":
+    for n in ([int(sys.argv[1])] if len(sys.argv) > 1 else [1000, 5000, 10000]):
+        benchmark(n)
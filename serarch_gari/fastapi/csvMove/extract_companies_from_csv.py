@@ -33,10 +33,11 @@ except ImportError as e:
 class CompanyExtractorFromCSV:
     """CSV에서 회사명과 종목코드 추출"""
     
-    def __init__(self, db_config: Optional[Dict] = None):
+    def __init__(self, db_config: Optional[Dict] = None, cache_path: Optional[str] = None):
         """
         Args:
             db_config: DB 설정 (선택사항)
+            cache_path: 추출 결과 공유 캐시(SQLite) 경로 (선택사항, 재실행 시 재사용)
         """
         print("=" * 70)
         print("회사명 및 종목코드 추출기 초기화 중...")
@@ -48,7 +49,8 @@ class CompanyExtractorFromCSV:
         
         self.extractor = FinalCompanyExtractor(
             data_path=str(sysm_path),
-            db_config=db_config
+            db_config=db_config,
+            cache_path=cache_path
         )
         
         print("\n✅ 초기화 완료!\n")
@@ -93,12 +95,40 @@ class CompanyExtractorFromCSV:
                 'tickers': []
             }
     
+    def extract_companies_from_titles(self, titles: List[str]) -> List[Dict[str, List[str]]]:
+        """
+        여러 제목 일괄 추출 (HyperCLOVA 호출 동시 처리, 입력 순서 유지)
+        
+        Args:
+            titles: 뉴스 제목 목록
+            
+        Returns:
+            extract_companies_from_title 과 같은 형식의 결과 리스트
+        """
+        try:
+            results = self.extractor.extract_companies_batch(titles, verbose=False)
+        except Exception as e:
+            print(f"  ⚠️ 일괄 추출 실패 → 건별 처리: {e}")
+            return [self.extract_companies_from_title(title) for title in titles]
+        
+        outputs = []
+        for result in results:
+            companies = result.companies
+            tickers = [
+                result.company_details[company].stock_code
+                for company in companies
+                if company in result.company_details and result.company_details[company].stock_code
+            ]
+            outputs.append({'companies': companies, 'tickers': tickers})
+        return outputs
+    
     def process_csv(
         self,
         input_csv: str,
         output_csv: str,
         encoding: str = 'utf-8',
-        verbose: bool = True
+        verbose: bool = True,
+        batch_size: int = 100
     ):
         """
         CSV 파일 처리
@@ -108,6 +138,7 @@ class CompanyExtractorFromCSV:
             output_csv: 출력 CSV 파일 경로
             encoding: 파일 인코딩
             verbose: 진행 상황 출력
+            batch_size: 한 번에 추출할 행 수 (HyperCLOVA 동시 호출 단위)
         """
         print("=" * 70)
         print(f"CSV 처리 시작")
@@ -178,47 +209,63 @@ class CompanyExtractorFromCSV:
                 writer = csv.DictWriter(outfile, fieldnames=output_fieldnames)
                 writer.writeheader()
                 
-                # 각 행 처리
-                for idx, row in enumerate(reader, start=1):
-                    total_rows += 1
+                # batch_size 행씩 모아 일괄 추출 후 원래 순서대로 기록
+                batch = []
+                
+                def flush_batch():
+                    nonlocal success_rows, error_rows
+                    if not batch:
+                        return
                     
-                    try:
-                        title = row.get('제목', '')
-                        
-                        if not title or title.strip() == '':
-                            if verbose:
-                                print(f"  [{idx}] ⚠️ 제목 없음")
+                    results = self.extract_companies_from_titles([title for _, _, title in batch])
+                    
+                    for (idx, row, title), result in zip(batch, results):
+                        try:
+                            companies = result['companies']
+                            tickers = result['tickers']
+                            
+                            # 쉼표로 구분하여 저장
+                            row['회사명'] = ','.join(companies) if companies else ''
+                            row['종목코드'] = ','.join(tickers) if tickers else ''
+                            
+                            writer.writerow(row)
+                            success_rows += 1
+                            
+                            if verbose and (idx % 10 == 0 or companies):
+                                company_info = f"{companies}" if companies else "없음"
+                                ticker_info = f"{tickers}" if tickers else "없음"
+                                print(f"  [{idx}/{total_rows}] {title[:40]}... → 회사: {company_info}, 코드: {ticker_info}")
+                            
+                        except Exception as e:
+                            print(f"  ❌ [{idx}] 처리 실패: {e}")
                             row['회사명'] = ''
                             row['종목코드'] = ''
                             writer.writerow(row)
                             error_rows += 1
-                            continue
-                        
-                        # 회사명 추출
-                        result = self.extract_companies_from_title(title, verbose=False)
-                        
-                        companies = result['companies']
-                        tickers = result['tickers']
-                        
-                        # 쉼표로 구분하여 저장
-                        row['회사명'] = ','.join(companies) if companies else ''
-                        row['종목코드'] = ','.join(tickers) if tickers else ''
-                        
-                        writer.writerow(row)
-                        success_rows += 1
-                        
-                        if verbose and (idx % 10 == 0 or companies):
-                            company_info = f"{companies}" if companies else "없음"
-                            ticker_info = f"{tickers}" if tickers else "없음"
-                            print(f"  [{idx}/{total_rows}] {title[:40]}... → 회사: {company_info}, 코드: {ticker_info}")
-                        
-                    except Exception as e:
-                        print(f"  ❌ [{idx}] 처리 실패: {e}")
+                    
+                    batch.clear()
+                
+                for idx, row in enumerate(reader, start=1):
+                    total_rows += 1
+                    
+                    title = row.get('제목', '')
+                    
+                    if not title or title.strip() == '':
+                        # 앞선 행 순서 유지를 위해 먼저 기록
+                        flush_batch()
+                        if verbose:
+                            print(f"  [{idx}] ⚠️ 제목 없음")
                         row['회사명'] = ''
                         row['종목코드'] = ''
                         writer.writerow(row)
                         error_rows += 1
                         continue
+                    
+                    batch.append((idx, row, title))
+                    if len(batch) >= batch_size:
+                        flush_batch()
+                
+                flush_batch()
             
         finally:
             if input_file:
@@ -235,6 +282,9 @@ class CompanyExtractorFromCSV:
         print(f"  실패/빈값: {error_rows}개")
         print(f"  소요 시간: {elapsed:.1f}초 ({total_rows/elapsed:.1f}행/초)")
         print(f"  출력 파일: {output_csv}")
+        cache_stats = self.extractor.get_cache_stats()
+        print(f"  캐시: 적중 {cache_stats['hits']}건 / 미스 {cache_stats['misses']}건 "
+              f"(적중률 {cache_stats['hit_rate'] * 100:.1f}%)")
         print("=" * 70)
     
     def process_folder(
@@ -346,6 +396,12 @@ def main():
         help='DB 연결 사용 (종목코드 조회)'
     )
     
+    parser.add_argument(
+        '--cache-path',
+        default=os.getenv('EXTRACTION_CACHE_PATH'),
+        help='추출 결과 공유 캐시(SQLite) 경로 (재실행/다른 작업과 결과 재사용)'
+    )
+    
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -366,7 +422,7 @@ def main():
         }
     
     # 추출기 초기화
-    extractor = CompanyExtractorFromCSV(db_config=db_config)
+    extractor = CompanyExtractorFromCSV(db_config=db_config, cache_path=args.cache_path)
     
     # 단일 파일 처리
     if args.input_file and args.output_file:
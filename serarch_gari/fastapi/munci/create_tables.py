@@ -155,6 +155,63 @@ def create_news_returns_table():
         if conn:
             conn.close()
 
+def create_event_expectation_stats_table():
+    """event_expectation_stats 테이블 생성 (이벤트별 기대효과 사전 집계)"""
+    
+    create_table_sql = """
+    CREATE TABLE IF NOT EXISTS event_expectation_stats (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        
+        -- 집계 키
+        event_code VARCHAR(100) NOT NULL COMMENT '이벤트 분류 코드',
+        horizon INT NOT NULL COMMENT '수익률 기간 (거래일)',
+        lookback_days INT NOT NULL COMMENT '집계 윈도우 (일)',
+        as_of_date DATE NOT NULL COMMENT '집계 기준일',
+        
+        -- 통계
+        mean_return DECIMAL(12, 8) NOT NULL COMMENT '평균 로그수익률',
+        median_return DECIMAL(12, 8) NOT NULL COMMENT '중앙값',
+        std_return DECIMAL(12, 8) NOT NULL COMMENT '표본 표준편차',
+        q25 DECIMAL(12, 8) NOT NULL COMMENT '25% 분위수',
+        q75 DECIMAL(12, 8) NOT NULL COMMENT '75% 분위수',
+        iqr DECIMAL(12, 8) NOT NULL COMMENT 'q75 - q25',
+        sample_count INT NOT NULL COMMENT '샘플 수',
+        
+        -- 증분 갱신용 워터마크 (event_returns_history.updated_at 최대값)
+        source_updated_at TIMESTAMP NULL COMMENT '집계 시점 원본 워터마크',
+        
+        -- 메타 정보
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        
+        -- 인덱스
+        INDEX idx_as_of (as_of_date, lookback_days),
+        UNIQUE KEY unique_stats (event_code, horizon, lookback_days, as_of_date)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    COMMENT='이벤트별 기대효과 사전 집계 테이블'
+    """
+    
+    conn = None
+    try:
+        conn = pymysql.connect(**db_config)
+        
+        with conn.cursor() as cursor:
+            cursor.execute(create_table_sql)
+            # 증분 갱신 시 변경 이벤트 탐색용
+            cursor.execute("SHOW INDEX FROM event_returns_history WHERE Key_name = 'idx_updated_at'")
+            if not cursor.fetchone():
+                cursor.execute("ALTER TABLE event_returns_history ADD INDEX idx_updated_at (updated_at)")
+            conn.commit()
+            print(" event_expectation_stats 테이블 생성 완료")
+                
+    except Exception as e:
+        print(f" 에러 발생: {e}")
+        if conn:
+            conn.rollback()
+    finally:
+        if conn:
+            conn.close()
+
 def check_existing_data():
     """기존 데이터 확인"""
     conn = None
@@ -7,6 +7,7 @@ from collections import defaultdict
 
 from .models import ExtractionResult, CompanyInfo
 from .modules import utils, data, aliases, patterns, validation, ensemble, hcx
+from .modules.cache import ExtractionCache
 
 
 class FinalCompanyExtractor:
@@ -42,12 +43,17 @@ class FinalCompanyExtractor:
 
     HYPERCLOVA_MAX_RETRIES = 2
     HYPERCLOVA_RETRY_DELAY = 2
+    HYPERCLOVA_MAX_CONCURRENCY = int(os.getenv('HCX_MAX_CONCURRENCY', '4'))
     DEFAULT_CONFIDENCE_THRESHOLD = 0.55
     MIN_CONSENSUS_METHODS = 1
-    MAX_PATTERN_COUNT = 1000
+    MIN_ALIAS_LENGTH = 2
     CACHE_MAX_SIZE = 1000
+    CACHE_TTL_SECONDS = int(os.getenv('EXTRACTION_CACHE_TTL', '86400'))
 
-    def __init__(self, data_path: Optional[str] = None, db_config: Optional[Dict] = None) -> None:
+    def __init__(self, data_path: Optional[str] = None, db_config: Optional[Dict] = None,
+                 cache_path: Optional[str] = None) -> None:
+        # cache_path(SQLite) 지정 시 워커/배치 작업 간 추출 결과 공유
+        self.cache_path = cache_path or os.getenv('EXTRACTION_CACHE_PATH') or None
         self.DATA_PATH = self._get_data_path(data_path)
         self._print_init_info()
         self._setup_environment()
@@ -136,7 +142,7 @@ class FinalCompanyExtractor:
 
         self._merge_aliases()
         self.company_aliases = aliases._build_enhanced_company_aliases(self)
-        self.company_patterns = patterns._build_advanced_patterns(self)
+        self.company_matcher = patterns._build_company_matcher(self)
 
     def _merge_aliases(self):
         try:
@@ -159,7 +165,11 @@ class FinalCompanyExtractor:
             'total_processed': 0,
             'false_negative_recovery': 0
         }
-        self.extraction_cache: Dict[str, Any] = {}
+        self.extraction_cache = ExtractionCache(
+            max_size=self.CACHE_MAX_SIZE,
+            ttl=self.CACHE_TTL_SECONDS,
+            sqlite_path=self.cache_path
+        )
 
     def _get_company_codes_from_db(self, company_name: str) -> Optional[Dict[str, str]]:
         """DB에서 stock_code, corp_code 조회"""
@@ -230,6 +240,48 @@ class FinalCompanyExtractor:
 
         return self._perform_extraction(text, context, verbose)
 
+    def extract_companies_batch(self, texts: List[str],
+                                exclude_analyst_reports: bool = True,
+                                verbose: bool = False,
+                                max_workers: Optional[int] = None) -> List[ExtractionResult]:
+        """여러 텍스트 일괄 추출 (입력 순서 유지)
+
+        캐시에 없는 텍스트의 HyperCLOVA 호출만 동시에 수행하고(API 키 공용 속도 제한),
+        나머지 단계는 텍스트별로 기존과 동일하게 처리한다.
+        """
+        results: List[Optional[ExtractionResult]] = [None] * len(texts)
+        pending: List[int] = []
+
+        for idx, text in enumerate(texts):
+            if not self._is_valid_text(text):
+                results[idx] = ExtractionResult([], {}, {}, {})
+            elif self._should_filter_analyst_report(text, None, exclude_analyst_reports, verbose):
+                results[idx] = ExtractionResult([], {}, {}, {'filtered_reason': 'analyst_report'})
+            else:
+                results[idx] = self._get_cached_result(text, None, verbose)
+                if results[idx] is None:
+                    pending.append(idx)
+
+        hyperclova_results: Dict[str, Optional[List[str]]] = {}
+        if pending and self.clova_api_key:
+            unique_texts = list(dict.fromkeys(texts[idx] for idx in pending))
+            outputs = hcx._extract_with_hyperclova_batch(self, unique_texts, max_workers)
+            hyperclova_results = dict(zip(unique_texts, outputs))
+
+        for idx in pending:
+            text = texts[idx]
+            # 같은 텍스트가 배치 안에 반복되면 앞서 저장된 결과 재사용
+            cached = self._get_cached_result(text, None, verbose)
+            if cached is not None:
+                results[idx] = cached
+                continue
+            # 배치 호출 실패 항목은 패턴 매칭 결과만 사용
+            results[idx] = self._perform_extraction(
+                text, None, verbose, hyperclova_result=hyperclova_results.get(text) or []
+            )
+
+        return results
+
     def _is_valid_text(self, text: str) -> bool:
         return bool(text and len(text.strip()) >= 5)
 
@@ -244,19 +296,19 @@ class FinalCompanyExtractor:
     def _get_cached_result(self, text: str, context: Optional[Dict],
                            verbose: bool) -> Optional[ExtractionResult]:
         cache_key = utils._generate_cache_key(text, context)
-        if cache_key in self.extraction_cache:
-            if verbose:
-                print("   [캐시] 캐시에서 결과 반환")
-            return self.extraction_cache[cache_key]
-        return None
+        cached = self.extraction_cache.get(cache_key)
+        if cached is not None and verbose:
+            print("   [캐시] 캐시에서 결과 반환")
+        return cached
 
     def _perform_extraction(self, text: str, context: Optional[Dict],
-                            verbose: bool) -> ExtractionResult:
+                            verbose: bool,
+                            hyperclova_result: Optional[List[str]] = None) -> ExtractionResult:
         start = time.time()
         if verbose:
             print(f"[시작] 초정밀 추출: {text[:50]}...")
 
-        extraction_results = self._run_extraction_methods(text, verbose)
+        extraction_results = self._run_extraction_methods(text, verbose, hyperclova_result)
         ens = ensemble._ensemble_integration(self, extraction_results, text, context)
         validated = validation._validate_candidates(self, ens, text, context)
         final = ensemble._candidate_recovery_and_refinement(self, validated, text, context, verbose)
@@ -270,10 +322,16 @@ class FinalCompanyExtractor:
 
         return final
 
-    def _run_extraction_methods(self, text: str, verbose: bool) -> Dict[str, List[str]]:
+    def _run_extraction_methods(self, text: str, verbose: bool,
+                                hyperclova_result: Optional[List[str]] = None) -> Dict[str, List[str]]:
         results: Dict[str, List[str]] = {}
         results.update(self._run_pattern_matching(text, verbose))
-        results.update(self._run_hyperclova(text, verbose))
+        if hyperclova_result is not None:
+            # 배치 경로에서 미리 받아 둔 HyperCLOVA 결과
+            if self.clova_api_key:
+                results['hyperclova_x'] = hyperclova_result
+        else:
+            results.update(self._run_hyperclova(text, verbose))
         return results
 
     def _run_pattern_matching(self, text: str, verbose: bool) -> Dict[str, List[str]]:
@@ -302,9 +360,13 @@ class FinalCompanyExtractor:
     def _update_cache_and_stats(self, text: str, context: Optional[Dict],
                                 result: ExtractionResult):
         cache_key = utils._generate_cache_key(text, context)
-        self.extraction_cache[cache_key] = result
+        self.extraction_cache.set(cache_key, result)
         self.extraction_stats['total_processed'] += 1
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """추출 캐시 적중/미스/제거 통계"""
+        return self.extraction_cache.stats()
+
     def _print_extraction_result(self, result: ExtractionResult, start_time: float,
                                  verbose: bool):
         if verbose and result.companies:
@@ -326,7 +388,9 @@ class FinalCompanyExtractor:
         return aliases._find_similar_companies(self, company, threshold)
 
     def __del__(self):
-        """소멸자 - DB 연결 정리"""
+        """소멸자 - DB 연결 / 캐시 정리"""
+        if hasattr(self, 'extraction_cache'):
+            self.extraction_cache.close()
         if hasattr(self, 'db_conn') and self.db_conn:
             try:
                 self.db_conn.close()
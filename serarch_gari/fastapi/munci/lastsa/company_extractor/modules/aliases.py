@@ -1,39 +1,19 @@
 from __future__ import annotations
 from collections import defaultdict
 from typing import Dict, List, Set, Optional
-from . import utils, error_handler
+from munci.main_utils.alias_index import get_alias_index
+from . import utils
 
 
 def _merge_krx_aliases(extractor, path: str) -> None:
 
-
-    krx_data = error_handler.safe_json_load(path)
-    if not krx_data:
+    # 스캐너와 공유하는 컴파일된 별칭 인덱스 (프로세스당 1회 파싱)
+    index = get_alias_index(path)
+    if not index:
         return
 
-    for official_name, aliases_list in krx_data.items():
-        if not isinstance(aliases_list, list) or len(aliases_list) == 0:
-            continue
-
-        ticker, aliases = _parse_krx_aliases(aliases_list)
-
-        _register_company(extractor, official_name, ticker, aliases)
-
-
-def _parse_krx_aliases(aliases_list: List[str]) -> tuple[Optional[str], List[str]]:
-
-    ticker = None
-    aliases = []
-
-    for item in aliases_list:
-        if item.isdigit() and len(item) == 6:
-            # 숫자 6자리 → 종목코드
-            ticker = item
-        else:
-            # 나머지 → 별칭
-            aliases.append(item)
-
-    return ticker, aliases
+    for official_name, aliases in index.official_aliases.items():
+        _register_company(extractor, official_name, index.official_to_code[official_name], aliases)
 
 
 def _register_company(extractor, official_name: str, ticker: Optional[str], aliases: List[str]) -> None:
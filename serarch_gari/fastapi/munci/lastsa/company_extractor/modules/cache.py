@@ -0,0 +1,171 @@
+from __future__ import annotations
+import os
+import time
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class ExtractionCache:
+    """추출 결과 캐시 (LRU + TTL)
+
+    - 메모리: max_size 초과 시 가장 오래 사용하지 않은 항목부터 제거
+    - ttl 초가 지난 항목은 조회 시 만료 처리 (ttl <= 0 이면 만료 없음)
+    - sqlite_path 지정 시 디스크 공유 백엔드 사용 → 워커/배치 작업 간 결과 재사용
+    """
+
+    PURGE_EVERY = 500  # 디스크 만료 항목 정리 주기 (쓰기 횟수)
+
+    def __init__(self, max_size: int = 1000, ttl: float = 86400, sqlite_path: Optional[str] = None):
+        self.max_size = max(1, max_size)
+        self.ttl = ttl
+        self._items: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'disk_hits': 0, 'evictions': 0, 'expired': 0}
+
+        self._db: Optional[sqlite3.Connection] = None
+        self._writes = 0
+        if sqlite_path:
+            self._open_disk(sqlite_path)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, count=False) is not None
+
+    # --------------------------- public API ---------------------------
+
+    def get(self, key: str, count: bool = True) -> Optional[Any]:
+        now = time.time()
+
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                if self._is_expired(item[0], now):
+                    del self._items[key]
+                    self._counters['expired'] += 1
+                else:
+                    self._items.move_to_end(key)
+                    if count:
+                        self._counters['hits'] += 1
+                    return item[1]
+
+        value = self._disk_get(key, now)
+        if value is not None:
+            with self._lock:
+                self._put_memory(key, value[0], value[1])
+                if count:
+                    self._counters['hits'] += 1
+                    self._counters['disk_hits'] += 1
+            return value[1]
+
+        if count:
+            with self._lock:
+                self._counters['misses'] += 1
+        return None
+
+    def set(self, key: str, value: Any):
+        created_at = time.time()
+        with self._lock:
+            self._put_memory(key, created_at, value)
+        self._disk_set(key, created_at, value)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM extraction_cache")
+                self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._counters['hits'] + self._counters['misses']
+            return {
+                **self._counters,
+                'size': len(self._items),
+                'max_size': self.max_size,
+                'hit_rate': self._counters['hits'] / total if total else 0.0,
+                'disk': self._db is not None,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # --------------------------- memory ---------------------------
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl > 0 and now - created_at > self.ttl
+
+    def _put_memory(self, key: str, created_at: float, value: Any):
+        self._items[key] = (created_at, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+            self._counters['evictions'] += 1
+
+    # --------------------------- disk (sqlite) ---------------------------
+
+    def _open_disk(self, path: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        # 여러 프로세스가 동시에 읽고 쓰므로 WAL + busy timeout
+        self._db = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS extraction_cache (
+                cache_key  TEXT PRIMARY KEY,
+                created_at REAL NOT NULL,
+                value      BLOB NOT NULL
+            )
+        """)
+        self._db.commit()
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[float, Any]]:
+        if self._db is None:
+            return None
+
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT created_at, value FROM extraction_cache WHERE cache_key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"[WARNING] 캐시 조회 실패: {e}")
+            return None
+
+        if row is None or self._is_expired(row[0], now):
+            return None
+
+        try:
+            return row[0], pickle.loads(row[1])
+        except Exception:
+            # 모델 구조 변경 등으로 복원 불가 → 미스로 처리
+            return None
+
+    def _disk_set(self, key: str, created_at: float, value: Any):
+        if self._db is None:
+            return
+
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO extraction_cache (cache_key, created_at, value) VALUES (?, ?, ?)",
+                    (key, created_at, blob)
+                )
+                self._writes += 1
+                if self.ttl > 0 and self._writes % self.PURGE_EVERY == 0:
+                    self._db.execute(
+                        "DELETE FROM extraction_cache WHERE created_at < ?", (created_at - self.ttl,)
+                    )
+                self._db.commit()
+        except Exception as e:
+            print(f"[WARNING] 캐시 저장 실패: {e}")
@@ -1,17 +1,25 @@
 from __future__ import annotations
 import re
-from typing import List, Tuple
+from typing import Set
 
 # 그룹명 단독 사용 제외 설정
 EXCLUDE_GROUPS = ["현대", "삼성", "LG", "SK"]
 EXCLUDE_PARTICLES = ["에는", "는", "에서", "의", "에게", "에", "으로", "로", "만", "도"]
 
 
+_PARTICLES_PATTERN = "|".join(map(re.escape, EXCLUDE_PARTICLES))
+_GROUP_PATTERNS = {
+    group: re.compile(rf'{re.escape(group)}(?:{_PARTICLES_PATTERN})')
+    for group in EXCLUDE_GROUPS
+}
+
+
 def should_exclude_group_mention(company: str, text: str) -> bool:
 
-    if company not in EXCLUDE_GROUPS:
-        return False
+    pattern = _GROUP_PATTERNS.get(company)
+    return bool(pattern and pattern.search(text))
+
 
-    particles_pattern = "|".join(map(re.escape, EXCLUDE_PARTICLES))
-    pattern = rf'{re.escape(company)}(?:{particles_pattern})'
-    return bool(re.search(pattern, text))
+def excluded_group_mentions(text: str) -> Set[str]:
+    """본문에서 '그룹명 + 조사' 형태로 단독 사용된 그룹명 집합"""
+    return {group for group, pattern in _GROUP_PATTERNS.items() if pattern.search(text)}
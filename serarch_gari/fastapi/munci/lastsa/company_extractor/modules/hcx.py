@@ -1,9 +1,44 @@
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import time
 import json as json_lib
 import http.client
 
+from munci.lastsa.event_extractor.hcx_client import MinIntervalLimiter, get_hcx_limiter
+
+HCX_HOST = "clovastudio.stream.ntruss.com"
+HCX_PATH = "/v3/chat-completions/HCX-007"
+
+
+# 스레드별 keep-alive 연결 (http.client 연결은 스레드 간 공유 불가)
+_local = threading.local()
+
+
+def _get_connection() -> http.client.HTTPSConnection:
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = http.client.HTTPSConnection(HCX_HOST, timeout=30)
+        _local.conn = conn
+    return conn
+
+
+def _drop_connection():
+    conn = getattr(_local, "conn", None)
+    _local.conn = None
+    if conn is not None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def _get_rate_limiter(extractor) -> MinIntervalLimiter:
+    """API 키 단위 공용 제한기 (이벤트 분류기와 같은 한도 공유, 단건/배치 호출 공통)"""
+    return get_hcx_limiter(extractor.clova_api_key)
+
+
 def _retry(extractor, fn, max_retries=None, delay=None):
     """재시도 로직"""
     max_retries = max_retries or extractor.HYPERCLOVA_MAX_RETRIES
@@ -27,7 +62,39 @@ def _retry(extractor, fn, max_retries=None, delay=None):
 
 def _extract_with_hyperclova(extractor, text: str) -> List[str]:
     """HyperCLOVA X를 사용하여 회사명 추출"""
-    user_prompt = f"""
+    user_prompt = _build_user_prompt(text)
+    response = _retry(extractor, lambda: _call_hyperclova_x(extractor, user_prompt))
+    _raise_for_error(response)
+
+    if response and response.get("content"):
+        return _parse_company_list_from_llm(response["content"])
+    return []
+
+
+def _extract_with_hyperclova_batch(extractor, texts: List[str],
+                                   max_workers: Optional[int] = None) -> List[Optional[List[str]]]:
+    """여러 텍스트를 동시에 HyperCLOVA X 로 추출 (입력 순서 유지, 실패 항목은 None)
+
+    동시 요청 수는 max_workers, 요청 속도는 토큰 버킷으로 제한한다.
+    """
+    if not texts:
+        return []
+
+    max_workers = max(1, min(max_workers or extractor.HYPERCLOVA_MAX_CONCURRENCY, len(texts)))
+
+    def _one(text: str) -> Optional[List[str]]:
+        try:
+            return _extract_with_hyperclova(extractor, text)
+        except Exception as e:
+            extractor.logger.error(f"HyperCLOVA 배치 추출 실패: {text[:30]}... - {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hcx") as executor:
+        return list(executor.map(_one, texts))
+
+
+def _build_user_prompt(text: str) -> str:
+    return f"""
         [작업]
         - 아래 텍스트에서 회사명을 모두 추출하고, 제공된 정규화 사전을 우선 적용해 **canonicalName**으로 통일한다.
         - 사전에 없거나 애매하면 '모호한 그룹 키워드 귀속' 규칙을 문맥에 맞게 적용한다.
@@ -53,7 +120,9 @@ def _extract_with_hyperclova(extractor, text: str) -> List[str]:
         - "현대에는 현대차와 기아가 전기차 시장에서 경쟁하고 있다."
           → {{"entities":["현대자동차","기아"]}}
     """
-    response = _retry(extractor, lambda: _call_hyperclova_x(extractor, user_prompt))
+
+
+def _raise_for_error(response: Dict[str, Any]):
     if response and response.get("error"):
         et = response.get("error", "unknown")
         emap = {
@@ -77,19 +146,12 @@ def _extract_with_hyperclova(extractor, text: str) -> List[str]:
         else:
             raise Exception(f"HyperCLOVA API unknown error: {et}")
 
-    if response and response.get("content"):
-        return _parse_company_list_from_llm(response["content"])
-    return []
-
 def _call_hyperclova_x(extractor, user_text: str) -> Dict[str, Any]:
     """HyperCLOVA X API 호출"""
     if not extractor.clova_api_key:
         extractor.logger.warning("CLOVA API 키가 설정되지 않았습니다.")
         return {"status": 0, "error": "no_api_key"}
 
-    host = "clovastudio.stream.ntruss.com"
-    path = "/v3/chat-completions/HCX-007"
-
     headers = {
         "Authorization": f"Bearer {extractor.clova_api_key}",
         "Content-Type": "application/json"
@@ -109,12 +171,10 @@ def _call_hyperclova_x(extractor, user_text: str) -> Dict[str, Any]:
         "includeAiFilters": False
     }
 
+    _get_rate_limiter(extractor).acquire()
+
     try:
-        conn = http.client.HTTPSConnection(host, timeout=30)
-        conn.request("POST", path, json_lib.dumps(body), headers)
-        resp = conn.getresponse()
-        data = resp.read().decode("utf-8", errors="ignore")
-        conn.close()
+        resp, data = _post(json_lib.dumps(body), headers)
 
         if resp.status == 429:
             extractor.logger.warning("API 요청 한도 초과 (429)")
@@ -161,6 +221,28 @@ def _call_hyperclova_x(extractor, user_text: str) -> Dict[str, Any]:
         extractor.logger.error(f"HCX-007 호출 중 예외 발생: {e}")
         return {"error": str(e)}
 
+def _post(payload: str, headers: Dict[str, str]):
+    """keep-alive 연결로 POST (서버가 유휴 연결을 끊었으면 새 연결로 1회 재시도)"""
+    for attempt in range(2):
+        reused = getattr(_local, "conn", None) is not None
+        conn = _get_connection()
+        try:
+            conn.request("POST", HCX_PATH, payload, headers)
+            resp = conn.getresponse()
+            data = resp.read().decode("utf-8", errors="ignore")
+            if resp.will_close:
+                _drop_connection()
+            return resp, data
+        except (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                ConnectionResetError, BrokenPipeError):
+            _drop_connection()
+            if not reused or attempt == 1:
+                raise
+        except Exception:
+            _drop_connection()
+            raise
+
+
 def _parse_company_list_from_llm(content: str):
     """LLM 응답에서 회사명 리스트 파싱"""
     try:
@@ -1,78 +1,94 @@
 from __future__ import annotations
-import re
 from typing import List, Tuple
-from . import filters, error_handler
+from . import filters
+from munci.main_utils.automaton import AhoCorasickMatcher
 
 
-def _build_advanced_patterns(extractor) -> List[Tuple[re.Pattern, str, float]]:
+def _company_base_weight(company_name: str, info: dict) -> float:
 
-    patterns = []
-    companies_to_process = []
+    base_weight = 0.7
+    if info.get("verified"):
+        base_weight += 0.1
+    if info.get("type") == "listed":
+        base_weight += 0.1
+    if len(company_name) >= 4:
+        base_weight += 0.05
+    if info.get("sector") in ["전자", "자동차", "IT", "반도체"]:
+        base_weight += 0.05
+    return base_weight
 
-    # 처리할 회사 선정
-    for company_name in extractor.company_master.keys():
-        if len(companies_to_process) < extractor.MAX_PATTERN_COUNT:
-            companies_to_process.append(company_name)
 
-    # 각 회사의 패턴 생성
-    for company_name in companies_to_process:
-        info = error_handler.safe_dict_get(extractor.company_master, company_name)
+def _build_company_matcher(extractor) -> AhoCorasickMatcher:
+    """전체 회사명 + 별칭으로 Aho-Corasick 자동자 구성 (회사 수 제한 없음)"""
+    matcher = AhoCorasickMatcher()
+    entries = []
+
+    for company_name, info in extractor.company_master.items():
         if not info:
             continue
 
         # 기본 가중치 계산
-        base_weight = 0.7
-        if info.get("verified"):
-            base_weight += 0.1
-        if info.get("type") == "listed":
-            base_weight += 0.1
-        if len(company_name) >= 4:
-            base_weight += 0.05
-        if info.get("sector") in ["전자", "자동차", "IT", "반도체"]:
-            base_weight += 0.05
-
-        # 사용할 별칭 목록 (본명 + 주요 별칭 2개)
-        aliases_to_use = [company_name]
-        if company_name in extractor.company_aliases:
-            main_aliases = [a for a in extractor.company_aliases[company_name] if a != company_name]
-            aliases_to_use.extend(main_aliases[:2])
-
-        # 각 별칭에 대해 패턴 생성
+        base_weight = _company_base_weight(company_name, info)
+
+        # 본명 + 전체 별칭 (1글자 별칭은 오탐이 많아 제외)
+        aliases_to_use = {company_name}
+        aliases_to_use.update(
+            a for a in extractor.company_aliases.get(company_name, [])
+            if a and len(a) >= extractor.MIN_ALIAS_LENGTH
+        )
+
         for alias in aliases_to_use:
-            pattern = error_handler.safe_compile_pattern(alias)
-            if pattern:
-                weight = base_weight * (
-                    1.0 if alias == company_name else
-                    (0.95 if len(alias) >= len(company_name) else 0.85)
-                )
-                patterns.append((pattern, company_name, weight))
+            weight = base_weight * (
+                1.0 if alias == company_name else
+                (0.95 if len(alias) >= len(company_name) else 0.85)
+            )
+            entries.append((alias, company_name, weight))
 
-    # 가중치 순으로 정렬
-    patterns.sort(key=lambda x: (-x[2], -len(x[1])))
-    print(f"[OK] Total {len(patterns)} patterns generated")
-    return patterns
+    # 같은 키워드의 후보 순서 고정 (가중치 → 회사명 길이 → 이름)
+    entries.sort(key=lambda x: (-x[2], -len(x[1]), x[1], x[0]))
+    for alias, company_name, weight in entries:
+        matcher.add(alias, (company_name, weight))
 
+    matcher.build()
+    print(f"[OK] Total {len(matcher)} keywords compiled into matcher ({len(entries)} entries)")
+    return matcher
 
-def _extract_with_patterns(extractor, text: str) -> List[str]:
 
-    found = []
+def _find_company_matches(extractor, text: str) -> List[Tuple[int, int, str, float, str]]:
+    """본문 1회 스캔으로 (start, end, 회사명, 신뢰도, 원문 표기) 목록 생성"""
+    # 그룹명 단독 사용 여부는 본문당 한 번만 판정
+    excluded = filters.excluded_group_mentions(text)
 
-    for pat, cname, conf in extractor.company_patterns:
-        matches = error_handler.safe_pattern_finditer(pat, text)
+    return [
+        (start, end, cname, conf, text[start:end])
+        for start, end, (cname, conf) in extractor.company_matcher.find_all(text)
+        if cname not in excluded
+    ]
 
-        for m in matches:
-            # 그룹명 단독 사용인지 체크
-            if filters.should_exclude_group_mention(cname, text):
-                continue
 
-            found.append((m.start(), m.end(), cname, conf, m.group()))
+def _extract_with_patterns(extractor, text: str) -> List[str]:
 
+    found = _find_company_matches(extractor, text)
     resolved = _resolve_overlapping_matches(extractor, found)
     return [m[2] for m in resolved]
 
 
+def _match_priority(match) -> Tuple[float, int, float]:
+    """겹침 해소 우선순위: 신뢰도 → 회사명 길이 → 본명 여부"""
+    return (
+        match[3],  # 신뢰도
+        len(match[2]),  # 회사명 길이
+        1.0 if match[4] == match[2] else 0.8  # 본명 여부
+    )
+
+
 def _resolve_overlapping_matches(extractor, matches):
+    """시작 위치 순 스윕으로 겹치는 매칭 해소 (정렬 O(n log n) + 스캔 O(n))
 
+    채택된 구간은 항상 서로 겹치지 않고 시작 위치 순이므로, 새 매칭과 겹칠 수 있는
+    구간은 마지막으로 채택된 하나뿐이다. 둘 중 우선순위가 높은 쪽을 남기며,
+    동률이면 먼저 채택된 쪽을 유지한다.
+    """
     if not matches:
         return []
 
@@ -80,27 +96,10 @@ def _resolve_overlapping_matches(extractor, matches):
     result = []
 
     for current in sorted_matches:
-        cstart, cend, cname, cconf, calias = current
-        overlapping = []
-
-        for existing in result:
-            estart, eend = existing[0], existing[1]
-            if not (cend <= estart or cstart >= eend):
-                overlapping.append(existing)
-
-        if not overlapping:
-            result.append(current)
+        if result and current[0] < result[-1][1]:
+            if _match_priority(current) > _match_priority(result[-1]):
+                result[-1] = current
         else:
-            allc = overlapping + [current]
-            best = max(allc, key=lambda x: (
-                x[3],  # 신뢰도
-                len(x[2]),  # 회사명 길이
-                1.0 if x[4] == x[2] else 0.8  # 본명 여부
-            ))
-
-            for ov in overlapping:
-                if ov in result:
-                    result.remove(ov)
-            result.append(best)
+            result.append(current)
 
     return result
@@ -23,9 +23,10 @@ def setup_logging(DATA_PATH: str) -> logging.Logger:
 
 def _generate_cache_key(text: str, context: Optional[Dict[str, Any]] = None) -> str:
 
-    content = (text or '')[:500]
+    # 앞부분만 같은 본문끼리 충돌하지 않도록 전체 본문 기준 (디스크 캐시 공유 시 특히 중요)
+    content = text or ''
     if context:
-        content += str(context.get('title', ''))
+        content += '\x00' + str(context.get('title', ''))
     return hashlib.md5(content.encode('utf-8')).hexdigest()
 
 def _calculate_string_similarity(s1: str, s2: str) -> float:
@@ -144,11 +144,11 @@ def _get_company_related_keywords(extractor, company: str) -> List[str]:
 
 def _validate_pattern_match(extractor, company: str, text: str) -> Dict[str, Any]:
     """패턴 매칭 검증"""
-    for pat, p_company, p_conf in extractor.company_patterns:
-        if p_company == company:
-            matches = list(pat.finditer(text))
-            if matches:
-                return {'valid': True, 'confidence': min(p_conf + 0.1, 1.0), 'match_count': len(matches)}
+    # 추출 단계에서 스캔한 결과를 자동자가 재사용
+    confs = [conf for _, _, (p_company, conf) in extractor.company_matcher.find_all(text)
+             if p_company == company]
+    if confs:
+        return {'valid': True, 'confidence': min(max(confs) + 0.1, 1.0), 'match_count': len(confs)}
     return {'valid': False, 'confidence': 0.3}
 
 def _is_obviously_invalid(company: str) -> bool:
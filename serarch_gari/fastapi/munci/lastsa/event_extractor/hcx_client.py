@@ -0,0 +1,81 @@
+from __future__ import annotations
+import os
+import time
+import asyncio
+import threading
+from typing import Dict
+
+
+class MinIntervalLimiter:
+    """최소 호출 간격 제한기 (스레드/이벤트 루프 공통)
+
+    호출마다 다음 발송 시각(slot)을 예약하고 대기 시간을 돌려준다.
+    예약은 락 안에서만 이뤄지므로 여러 스레드와 코루틴이 섞여 있어도 간격이 지켜진다.
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = max(0.0, min_interval)
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+            return slot - now
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_limiters: Dict[str, MinIntervalLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_shared_limiter(key: str, min_interval: float) -> MinIntervalLimiter:
+    """프로세스 공용 제한기 (같은 key 를 쓰는 분류기 인스턴스끼리 간격 공유)"""
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = MinIntervalLimiter(min_interval)
+            _limiters[key] = limiter
+        return limiter
+
+
+def hcx_min_interval() -> float:
+    """CLOVA_RATE_LIMIT_PER_MIN (API 키당 분당 호출 수) → 최소 호출 간격(초)"""
+    rate_per_min = float(os.getenv("CLOVA_RATE_LIMIT_PER_MIN", "15"))
+    return 60.0 / rate_per_min if rate_per_min > 0 else 3.0
+
+
+def get_hcx_limiter(api_key: str) -> MinIntervalLimiter:
+    """HyperCLOVA API 키 단위 공용 제한기 (이벤트 분류/회사명 추출이 같은 한도를 나눠 씀)"""
+    return get_shared_limiter(f"hcx:{api_key}", hcx_min_interval())
+
+
+ASYNC_IDLE_TIMEOUT = 50.0  # 서버 keep-alive 만료 전에 먼저 버림
+
+
+def create_async_client(host: str, max_connections: int = 4, timeout: float = 30.0,
+                        use_ssl: bool = True):
+    """이벤트 루프 1개 전용 httpx.AsyncClient (keep-alive 연결 풀, 루프마다 별도 생성)
+
+    httpx 는 POST 를 자동 재전송하지 않으므로 실패 시 재시도는 호출자(_handle_response)가 판단한다.
+    """
+    import httpx
+
+    limits = httpx.Limits(
+        max_connections=max(1, max_connections),
+        max_keepalive_connections=max(1, max_connections),
+        keepalive_expiry=ASYNC_IDLE_TIMEOUT,
+    )
+    scheme = "https" if use_ssl else "http"
+    return httpx.AsyncClient(base_url=f"{scheme}://{host}", limits=limits, timeout=timeout)
@@ -0,0 +1,340 @@
+from __future__ import annotations
+import os
+import json
+import hashlib
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from munci.news_es.utils import normalize_title, simhash64
+
+logger = logging.getLogger(__name__)
+
+# off | sqlite | mysql
+LABEL_CACHE_BACKEND = (os.getenv("EVENT_LABEL_CACHE", "sqlite") or "off").strip().lower()
+LABEL_CACHE_PATH = os.getenv(
+    "EVENT_LABEL_CACHE_PATH",
+    str(Path(__file__).parents[3] / "cache" / "event_label_cache.sqlite3")
+)
+LABEL_CACHE_MAX_DISTANCE = int(os.getenv("EVENT_LABEL_CACHE_SIMHASH_DISTANCE", "3"))
+
+TABLE = "event_label_cache"
+_BANDS = 4  # 64bit simhash → 16bit 4구간 (해밍거리 3 이하면 최소 1구간은 일치)
+
+_MYSQL_DDL = f"""
+    CREATE TABLE IF NOT EXISTS {TABLE} (
+        namespace  VARCHAR(16) NOT NULL,
+        version    VARCHAR(16) NOT NULL,
+        key_hash   CHAR(40) NOT NULL,
+        title_norm VARCHAR(512) NOT NULL,
+        simhash    BIGINT NOT NULL,
+        band0      INT NOT NULL,
+        band1      INT NOT NULL,
+        band2      INT NOT NULL,
+        band3      INT NOT NULL,
+        value      TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (namespace, version, key_hash),
+        INDEX idx_band0 (namespace, version, band0),
+        INDEX idx_band1 (namespace, version, band1),
+        INDEX idx_band2 (namespace, version, band2),
+        INDEX idx_band3 (namespace, version, band3)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    COMMENT='이벤트 분류 결과 캐시'
+"""
+
+_SQLITE_DDL = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {TABLE} (
+        namespace  TEXT NOT NULL,
+        version    TEXT NOT NULL,
+        key_hash   TEXT NOT NULL,
+        title_norm TEXT NOT NULL,
+        simhash    INTEGER NOT NULL,
+        band0      INTEGER NOT NULL,
+        band1      INTEGER NOT NULL,
+        band2      INTEGER NOT NULL,
+        band3      INTEGER NOT NULL,
+        value      TEXT NOT NULL,
+        created_at REAL DEFAULT (strftime('%s', 'now')),
+        PRIMARY KEY (namespace, version, key_hash)
+    )
+    """
+] + [
+    f"CREATE INDEX IF NOT EXISTS idx_{TABLE}_band{i} ON {TABLE} (namespace, version, band{i})"
+    for i in range(_BANDS)
+]
+
+
+def version_stamp(*parts: Any) -> str:
+    """레지스트리/프롬프트 등 분류 결과에 영향을 주는 요소의 해시 (바뀌면 기존 캐시 무효)"""
+    blob = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def _signed64(value: int) -> int:
+    # SQLite INTEGER / MySQL BIGINT 는 부호 있는 64bit
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def _bands(value: int) -> List[int]:
+    return [(value >> (16 * i)) & 0xFFFF for i in range(_BANDS)]
+
+
+# --------------------------- backends ---------------------------
+
+class _SQLiteStore:
+    placeholder = "?"
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        # API 워커/배치 프로세스가 동시에 쓰므로 WAL + busy timeout
+        self._db = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        for ddl in _SQLITE_DDL:
+            self._db.execute(ddl)
+        self._db.commit()
+
+    def fetch(self, sql: str, params: Tuple) -> List[Tuple]:
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def execute(self, sql: str, params: Tuple):
+        with self._lock:
+            self._db.execute(sql, params)
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class _MySQLStore:
+    placeholder = "%s"
+
+    def __init__(self, db_config: dict):
+        from munci.main_utils.db_pool import get_pool
+        self._pool = get_pool(db_config)
+        with self._pool.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(_MYSQL_DDL)
+            conn.commit()
+
+    def fetch(self, sql: str, params: Tuple) -> List[Tuple]:
+        with self._pool.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(sql, params)
+                rows = cursor.fetchall()
+        # DictCursor 설정이어도 튜플로 통일
+        return [tuple(r.values()) if isinstance(r, dict) else r for r in rows]
+
+    def execute(self, sql: str, params: Tuple):
+        with self._pool.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(sql, params)
+            conn.commit()
+
+    def close(self):
+        pass  # 연결 풀은 close_all_pools 에서 정리
+
+
+def _env_db_config() -> Optional[dict]:
+    if not all(os.getenv(k) for k in ("DB_USERNAME", "DB_PASSWORD", "DB_DATABASE")):
+        return None
+    return {
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'user': os.getenv('DB_USERNAME'),
+        'password': os.getenv('DB_PASSWORD'),
+        'database': os.getenv('DB_DATABASE'),
+        'port': int(os.getenv('DB_PORT', 3306))
+    }
+
+
+# --------------------------- cache ---------------------------
+
+class LabelCache:
+    """이벤트 분류 결과 영속 캐시
+
+    - 키: normalize_title(제목) → 같은 헤드라인을 매체마다 다시 분류하지 않음
+    - 정확 일치가 없으면 simhash64 해밍거리 max_distance 이하인 근사 중복 제목 결과 재사용
+    - namespace(분류기 종류) + version(레지스트리/프롬프트 해시) 가 다르면 조회되지 않음
+    - SQLite(기본) 또는 MariaDB 에 저장 → API/배치/전처리 프로세스 간 공유
+    """
+
+    MEMORY_SIZE = 5000
+    NEAR_DUP_MIN_LENGTH = 12  # 짧은 제목은 단어 하나 차이로 의미가 바뀌므로 정확 일치만
+    NEAR_DUP_MAX_CANDIDATES = 200
+
+    def __init__(self, store, namespace: str, version: str, max_distance: int = LABEL_CACHE_MAX_DISTANCE):
+        self._store = store
+        self.namespace = namespace
+        self.version = version
+        self.max_distance = max_distance
+        self._memory: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"exact_hits": 0, "near_hits": 0, "misses": 0, "writes": 0, "errors": 0}
+
+        p = store.placeholder
+        band_where = " OR ".join(f"band{i} = {p}" for i in range(_BANDS))
+        self._exact_sql = (f"SELECT value FROM {TABLE} "
+                           f"WHERE namespace = {p} AND version = {p} AND key_hash = {p}")
+        self._near_sql = (f"SELECT simhash, value FROM {TABLE} "
+                          f"WHERE namespace = {p} AND version = {p} AND ({band_where}) "
+                          f"LIMIT {self.NEAR_DUP_MAX_CANDIDATES}")
+        self._upsert_sql = (f"REPLACE INTO {TABLE} (namespace, version, key_hash, title_norm, simhash, "
+                            f"band0, band1, band2, band3, value) VALUES ({', '.join([p] * 10)})")
+
+    # --------------------------- public API ---------------------------
+
+    def get(self, title: str) -> Optional[Dict[str, Any]]:
+        norm = normalize_title(title)
+        if not norm:
+            return None
+        key = self._key(norm)
+
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self._counters["exact_hits"] += 1
+                return value
+
+        try:
+            value = self._lookup(norm, key)
+        except Exception as e:
+            self._count("errors")
+            logger.warning(f"분류 캐시 조회 실패: {e}")
+            return None
+
+        if value is None:
+            self._count("misses")
+        return value
+
+    def set(self, title: str, value: Dict[str, Any]):
+        norm = normalize_title(title)
+        if not norm:
+            return
+        key = self._key(norm)
+        self._remember(key, value)
+
+        sim = int(simhash64(norm), 16)
+        try:
+            self._store.execute(self._upsert_sql, (
+                self.namespace, self.version, key, norm[:512], _signed64(sim),
+                *_bands(sim), json.dumps(value, ensure_ascii=False)
+            ))
+            self._count("writes")
+        except Exception as e:
+            self._count("errors")
+            logger.warning(f"분류 캐시 저장 실패: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self._counters["exact_hits"] + self._counters["near_hits"]
+            total = hits + self._counters["misses"]
+            return {
+                **self._counters,
+                "namespace": self.namespace,
+                "version": self.version,
+                "memory": len(self._memory),
+                "hit_rate": hits / total if total else 0.0,
+            }
+
+    # --------------------------- internals ---------------------------
+
+    @staticmethod
+    def _key(norm: str) -> str:
+        return hashlib.sha1(norm.encode("utf-8")).hexdigest()
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counters[name] += 1
+
+    def _remember(self, key: str, value: Dict[str, Any]):
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.MEMORY_SIZE:
+                self._memory.popitem(last=False)
+
+    def _lookup(self, norm: str, key: str) -> Optional[Dict[str, Any]]:
+        rows = self._store.fetch(self._exact_sql, (self.namespace, self.version, key))
+        if rows:
+            value = json.loads(rows[0][0])
+            self._remember(key, value)
+            self._count("exact_hits")
+            return value
+
+        if len(norm) < self.NEAR_DUP_MIN_LENGTH or self.max_distance <= 0:
+            return None
+
+        sim = int(simhash64(norm), 16)
+        rows = self._store.fetch(self._near_sql, (self.namespace, self.version, *_bands(sim)))
+        best = None
+        for stored, value in rows:
+            distance = bin((stored & 0xFFFFFFFFFFFFFFFF) ^ sim).count("1")
+            if distance <= self.max_distance and (best is None or distance < best[0]):
+                best = (distance, value)
+        if best is None:
+            return None
+
+        value = json.loads(best[1])
+        # 근사 중복 결과는 메모리에만 정확 키로 기억 (저장소에는 원본 제목 행만 유지)
+        self._remember(key, value)
+        self._count("near_hits")
+        return value
+
+
+_stores: Dict[Tuple, Any] = {}
+_caches: Dict[Tuple[str, str], LabelCache] = {}
+_caches_lock = threading.Lock()
+
+
+def _open_store(backend: str):
+    key = (backend, LABEL_CACHE_PATH if backend == "sqlite" else None)
+    store = _stores.get(key)
+    if store is not None:
+        return store
+
+    if backend == "sqlite":
+        store = _SQLiteStore(LABEL_CACHE_PATH)
+    elif backend == "mysql":
+        db_config = _env_db_config()
+        if db_config is None:
+            raise RuntimeError("EVENT_LABEL_CACHE=mysql 이지만 DB 접속 정보(DB_*)가 없습니다")
+        store = _MySQLStore(db_config)
+    else:
+        raise ValueError(f"지원하지 않는 분류 캐시 백엔드: {backend}")
+
+    _stores[key] = store
+    return store
+
+
+def get_label_cache(namespace: str, version: str, max_distance: Optional[int] = None) -> Optional[LabelCache]:
+    """프로세스 공용 분류 캐시 (EVENT_LABEL_CACHE=off 이거나 저장소를 열 수 없으면 None)
+
+    max_distance=0 이면 정확 일치만 사용 (결과가 제목 문구에 의존하는 경우)
+    """
+    if LABEL_CACHE_BACKEND in {"", "off", "none", "0"}:
+        return None
+
+    with _caches_lock:
+        cache = _caches.get((namespace, version))
+        if cache is not None:
+            return cache
+        try:
+            store = _open_store(LABEL_CACHE_BACKEND)
+        except Exception as e:
+            logger.warning(f"분류 캐시 비활성화 ({LABEL_CACHE_BACKEND}): {e}")
+            return None
+
+        cache = LabelCache(store, namespace, version,
+                           LABEL_CACHE_MAX_DISTANCE if max_distance is None else max_distance)
+        _caches[(namespace, version)] = cache
+        logger.info(f"분류 캐시 사용: {LABEL_CACHE_BACKEND} namespace={namespace} version={version}")
+        return cache
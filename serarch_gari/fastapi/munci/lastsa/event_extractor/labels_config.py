@@ -30,7 +30,7 @@ LABEL_REGISTRY_BASE = {
     "company.debt_restructuring":    {"fine": True, "priority": 130, "triggers": [r"(리파이낸싱|재조정|재무\s*구조\s*개선|만기\s*연장)"]},
     "company.covenant_waiver":       {"fine": True, "priority": 131, "triggers": [r"(재무\s*약정|코버넌트).*(면제|유예|waiver)"]},
     "company.rating_watch_outlook":  {"fine": True, "priority": 132, "triggers": [r"(관찰\s*대상|Watch|전망|Outlook).*(상향|하향|부여|변경)"]},
-    "company.early_redemption_call": {"fine": True, "priority": 133, "triggers": [r"(조기\s*상환|콜\s*옵션\s*행사|early\s*redemption|call)"]},
+    "company.early_redemption_call": {"fine": True, "fast_path": False, "priority": 133, "triggers": [r"(조기\s*상환|콜\s*옵션\s*행사|early\s*redemption|call)"]},
 
     # Operations/Facility/Safety
     "company.capex_expansion":            {"fine": True, "priority": 140, "triggers": [r"(대규모|대형)\s*(설비|공장|fab|라인).*(증설|투자|capex|CAPEX|확대)"]},
@@ -42,7 +42,7 @@ LABEL_REGISTRY_BASE = {
     # Legal/Regulatory
     "company.regulatory_sanction_fine":     {"fine": True,  "priority": 150, "triggers": [r"(과징금|행정\s*제재|고발|징계).*(부과|처분|확정)"]},
     "company.litigation_filed":             {"fine": True,  "priority": 151, "triggers": [r"(소송|집단\s*소송|소제기|제소|complaint\s*filed)"]},
-    "company.litigation_outcome":           {"fine": True,  "priority": 152, "triggers": [r"(판결|합의|소취하|승소|패소|일부승소|settlement|verdict)"]},
+    "company.litigation_outcome":           {"fine": True,  "fast_path": False, "priority": 152, "triggers": [r"(판결|합의|소취하|승소|패소|일부승소|settlement|verdict)"]},
     "company.violation_of_law":             {"fine": False, "priority": 218, "triggers": [r"(구속|압수수색|기소|수사|위법|혐의)"]},
     "company.whistleblowing_investigation": {"fine": False, "priority": 180, "triggers": [r"(내부\s*고발|제보)", r"(내부\s*조사|감사)\s*(개시|착수)"]},
     "company.labor_strike_negotiation":     {"fine": False, "priority": 106, "triggers": [r"(파업|쟁의|단체\s*행동|노조)", r"(교섭|협상|중재)"]},
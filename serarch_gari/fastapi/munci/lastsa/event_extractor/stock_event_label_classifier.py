@@ -6,15 +6,22 @@ import ast
 import json
 import time
 import uuid
+import random
+import asyncio
 import logging
+import weakref
+import threading
 import http.client
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from textwrap import dedent
 
 from dotenv import load_dotenv
 from munci.lastsa.event_extractor.labels_config import get_registry  # 사용 환경에 존재해야 함
+from munci.lastsa.event_extractor.hcx_client import create_async_client, get_hcx_limiter, hcx_min_interval
+from munci.lastsa.event_extractor.trigger_index import TriggerIndex
+from munci.lastsa.event_extractor.label_cache import get_label_cache, version_stamp
 
 
 
@@ -28,11 +35,21 @@ class LabelResult:
 
 class StockEventLabelClassifier:
 
-    def __init__(self):
+    MODES = ("llm", "tiered")
+    RULE_FAST_PATH_CONFIDENCE = 0.8
+    TIER_LOG_EVERY = 200  # 계층별 적중률 로그 주기 (분류 건수)
+
+    def __init__(self, mode: Optional[str] = None):
         self._load_env_config()
+        if mode is not None:
+            self.mode = mode.strip().lower()
+        if self.mode not in self.MODES:
+            raise ValueError(f"지원하지 않는 분류 모드: {self.mode} (가능: {', '.join(self.MODES)})")
         self._setup_logging()
         self._load_label_registry()
+        self._setup_http()
         self.system_prompt = self._build_system_prompt()
+        self._setup_cache()
 
         print("Stock Event Label Classifier 초기화 완료!")
         print("HyperCLOVA X API 연결 설정됨" if self.clova_api_key else "CLOVA_API_KEY가 설정되지 않음 - .env 또는 환경변수 확인 필요")
@@ -40,6 +57,9 @@ class StockEventLabelClassifier:
         print(f"   - Model: {self.clova_model_id}")
         print(f"   - Priority Profile: {self.priority_profile or 'disabled'}")
         print(f"   - API 호출 간격: {self.min_api_interval:.0f}초 (분당 {60.0 / self.min_api_interval:.1f}회)")
+        print(f"   - 분류 캐시: {self.cache_version if self.label_cache else 'disabled'}")
+        print(f"   - 분류 모드: {self.mode}" + (
+            f" (룰 우선, 우선순위 <= {self.rule_fast_path_max_priority})" if self.mode == "tiered" else ""))
 
     def _load_env_config(self) -> None:
         """환경변수 로드 및 기본 설정"""
@@ -55,8 +75,12 @@ class StockEventLabelClassifier:
         self.clova_model_id: str = "HCX-007"  # 고정
 
         # 호출 간격
-        rate_per_min = float(os.getenv("CLOVA_RATE_LIMIT_PER_MIN", "15"))
-        self.min_api_interval: float = 60.0 / rate_per_min if rate_per_min > 0 else 3.0
+        self.min_api_interval: float = hcx_min_interval()
+        self.max_connections: int = int(os.getenv("CLOVA_MAX_CONNECTIONS", "4"))
+
+        # 분류 모드: llm(모든 제목 모델 호출) | tiered(트리거가 결정적이면 모델 생략)
+        self.mode: str = (os.getenv("CLASSIFIER_MODE", "llm") or "llm").strip().lower()
+        self.rule_fast_path_max_priority: int = int(os.getenv("RULE_FAST_PATH_MAX_PRIORITY", "200"))
 
         # 프로파일
         self.priority_profile = (os.getenv("PRIORITY_PROFILE", "intraday_kr") or "").strip()
@@ -88,12 +112,62 @@ class StockEventLabelClassifier:
         )
         self.logger = logging.getLogger("LabelClassifier")
 
+    def _setup_http(self) -> None:
+        """keep-alive 연결 + 공용 호출 간격 제한기"""
+        # 같은 API 키를 쓰는 모든 인스턴스/스레드/코루틴 (회사명 추출 포함) 이 CLOVA_RATE_LIMIT_PER_MIN 을 공유
+        self.rate_limiter = get_hcx_limiter(self.clova_api_key)
+        self._local = threading.local()  # 동기 경로: 스레드별 HTTPSConnection
+        self._async_clients = weakref.WeakKeyDictionary()  # 비동기 경로: 이벤트 루프별 연결 풀
+        self._async_clients_lock = threading.Lock()
+
+    def _setup_cache(self) -> None:
+        """정규화 제목 기준 분류 캐시 (레지스트리/프롬프트/호출 파라미터가 바뀌면 버전이 달라져 무효)"""
+        self.cache_version = version_stamp(
+            self.clova_model_id,
+            self.registry,
+            self._build_messages("{title}", "{source}"),
+            self._make_api_body([], "maxCompletionTokens"),
+        )
+        self.label_cache = get_label_cache("hcx", self.cache_version)
+
+    def _label_cache_for(self, source: str):
+        """source 도 프롬프트에 들어가므로 source 별로 캐시 버전을 나눔 (빈 source 는 기본 버전)"""
+        if self.label_cache is None or not source:
+            return self.label_cache
+        return get_label_cache("hcx", version_stamp(self.cache_version, source))
+
+    def _cached_result(self, title: str, source: str = "") -> Optional[LabelResult]:
+        cache = self._label_cache_for(source)
+        if cache is None:
+            return None
+        value = cache.get(title)
+        if value is None:
+            return None
+        self._record_tier("cache")
+        return LabelResult(**value)
+
+    def _store_result(self, title: str, source: str, r1: dict, result: LabelResult) -> None:
+        # 모델이 정상 응답한 결과만 저장 (API 실패 후 other/룰 보정 결과는 재시도 대상)
+        cache = self._label_cache_for(source)
+        if cache is not None and r1.get("ok"):
+            cache.set(title, asdict(result))
+
     def _load_label_registry(self) -> None:
         """레지스트리를 로드하고 파생 속성 생성"""
         self.registry = get_registry(self.priority_profile)
         self.valid_labels, self.compiled_triggers, self.fine_first, self.priority_rank = self._build_label_registry(
             self.registry
         )
+        self.fine_labels = set(self.fine_first)
+        # 룰 즉시 판정 대상: 세분 라벨 중 트리거가 넓은 것 (call, 합의 등 - fast_path: False) 제외
+        self.fast_path_labels = {
+            name.strip().lower() for name, spec in self.registry.items()
+            if isinstance(name, str) and (spec or {}).get("fine") and (spec or {}).get("fast_path", True)
+        }
+        self.trigger_index = TriggerIndex(self.compiled_triggers)
+
+        self._tier_lock = threading.Lock()
+        self._tier_counts: Dict[str, int] = {"rule": 0, "cache": 0, "llm": 0, "backstop": 0, "short": 0}
 
     def _build_label_registry(self, registry: dict):
         """레지스트리 파생: (1) 유효 라벨, (2) 컴파일된 트리거, (3) 세분 목록, (4) 우선순위 매핑"""
@@ -247,123 +321,217 @@ class StockEventLabelClassifier:
             "includeAiFilters": False
         }
 
+    def _get_connection(self) -> http.client.HTTPSConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPSConnection(self.clova_api_host, timeout=30)
+            self._local.conn = conn
+        return conn
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def _encode_body(self, messages: List[Dict[str, str]], token_key: str) -> bytes:
+        return json.dumps(self._make_api_body(messages, token_key), ensure_ascii=False).encode("utf-8")
+
     def _http_request(self, path: str, token_key: str, messages: List[Dict[str, str]]) -> dict:
-        """단일 HTTP 요청 실행 (재시도 없음)"""
-        conn = None
+        """단일 HTTP 요청 실행 (재시도 없음, 스레드별 keep-alive 연결 재사용)"""
+        payload = self._encode_body(messages, token_key)
+        self.rate_limiter.acquire()
+
+        for attempt in range(2):
+            conn = self._get_connection()
+            try:
+                conn.request("POST", path, payload, self._clova_headers())
+                resp = conn.getresponse()
+                status = resp.status
+                resp_headers = {k: v for (k, v) in resp.getheaders()}
+                raw = resp.read().decode("utf-8", errors="ignore")
+                if resp.will_close:
+                    self._drop_connection()
+                return {"status": status, "headers": resp_headers, "raw": raw, "error": None}
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+                # 유휴 중 서버가 끊은 연결 → 새 연결로 1회 재전송
+                self._drop_connection()
+                if attempt == 0:
+                    continue
+                self.logger.error(f"HCX-007 네트워크 예외: {e} (path={path})")
+                return {"status": None, "headers": {}, "raw": str(e), "error": "network_error"}
+            except Exception as e:
+                self._drop_connection()
+                self.logger.error(f"HCX-007 네트워크 예외: {e} (path={path})")
+                return {"status": None, "headers": {}, "raw": str(e), "error": "network_error"}
+
+    def _get_async_client(self):
+        """현재 이벤트 루프 전용 연결 풀 (루프가 사라지면 함께 정리)"""
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = create_async_client(self.clova_api_host, max_connections=self.max_connections)
+                self._async_clients[loop] = client
+            return client
+
+    async def _http_request_async(self, path: str, token_key: str, messages: List[Dict[str, str]]) -> dict:
+        """_http_request 의 비동기 버전 (대기 중 이벤트 루프를 막지 않음)"""
+        payload = self._encode_body(messages, token_key)
+        await self.rate_limiter.acquire_async()
+
         try:
-            conn = http.client.HTTPSConnection(self.clova_api_host, timeout=30)
-            payload = json.dumps(self._make_api_body(messages, token_key), ensure_ascii=False).encode("utf-8")
-            headers = dict(self._clova_headers())
-            conn.request("POST", path, payload, headers)
-            resp = conn.getresponse()
-            status = resp.status
-            resp_headers = {k: v for (k, v) in resp.getheaders()}
-            raw = resp.read().decode("utf-8", errors="ignore")
-            return {"status": status, "headers": resp_headers, "raw": raw, "error": None}
+            resp = await self._get_async_client().post(path, content=payload, headers=self._clova_headers())
+            return {"status": resp.status_code, "headers": dict(resp.headers),
+                    "raw": resp.content.decode("utf-8", errors="ignore"), "error": None}
         except Exception as e:
-            self.logger.error(f"HCX-007 네트워크 예외: {e} (path={path})")
+            self.logger.error(f"HCX-007 네트워크 예외: {e!r} (path={path})")
             return {"status": None, "headers": {}, "raw": str(e), "error": "network_error"}
-        finally:
-            if conn:
-                try:
-                    conn.close()
-                except Exception:
-                    pass
+
+    async def aclose(self) -> None:
+        """현재 이벤트 루프의 연결 풀 정리"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        with self._async_clients_lock:
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    def _handle_response(self, result: dict, attempt: int, max_retries: int,
+                         base_wait: float) -> Tuple[Optional[dict], float]:
+        """응답 해석 → (최종 결과, 0) 또는 재시도 시 (None, 대기 초)"""
+        status = result["status"]
+        resp_headers = result["headers"]
+        raw = result["raw"]
+        error = result["error"]
+
+        # 네트워크 에러 → 재시도
+        if error == "network_error":
+            if attempt < max_retries:
+                return None, base_wait * (2 ** attempt) + random.uniform(0, 0.4)
+            return {"ok": False, "status": None, "content": "", "thinking": None,
+                    "usage": None, "headers": {}, "error": "network_error", "raw": raw}, 0.0
+
+        # 200 성공
+        if status == 200:
+            try:
+                obj = json.loads(raw)
+            except json.JSONDecodeError:
+                return {"ok": False, "status": status, "content": "", "thinking": None,
+                        "usage": None, "headers": resp_headers, "error": "json_decode_error", "raw": raw}, 0.0
+            content, thinking, usage = self._extract_response_content(obj)
+            self.logger.info(f"HCX-007 OK")
+            return {"ok": True, "status": status, "content": content, "thinking": thinking,
+                    "usage": usage, "headers": resp_headers, "error": None, "raw": obj}, 0.0
+
+        # 404 → 경로 오류
+        if status == 404:
+            self.logger.error(f"HCX-007 404 경로 오류")
+            return {"ok": False, "status": status, "content": "", "thinking": None,
+                    "usage": None, "headers": resp_headers, "error": "http_404", "raw": raw}, 0.0
+
+        # 401 → 인증 실패
+        if status == 401:
+            self.logger.error(f"HCX-007 401 인증 실패")
+            return {"ok": False, "status": status, "content": "", "thinking": None,
+                    "usage": None, "headers": resp_headers, "error": "auth_failed", "raw": raw}, 0.0
+
+        # 429 Rate Limit → 재시도
+        if status == 429 and attempt < max_retries:
+            retry_after = resp_headers.get("Retry-After")
+            try:
+                wait = float(retry_after) if retry_after else base_wait * (2 ** attempt)
+            except Exception:
+                wait = base_wait * (2 ** attempt)
+            return None, max(1.0, wait)
+
+        # 5xx 서버 에러 → 재시도
+        if status and status >= 500 and attempt < max_retries:
+            return None, base_wait * (2 ** attempt) + random.uniform(0, 0.4)
+
+        # 기타 에러 (400 포함)
+        self.logger.error(f"HCX-007 오류 (HTTP {status}): {str(raw)[:200]}")
+        return {"ok": False, "status": status, "content": "", "thinking": None,
+                "usage": None, "headers": resp_headers, "error": f"http_{status}", "raw": raw}, 0.0
+
+    @staticmethod
+    def _retries_exhausted(result: dict) -> dict:
+        return {"ok": False, "status": result["status"], "content": "", "thinking": None,
+                "usage": None, "headers": result["headers"], "error": "max_retries_exceeded",
+                "raw": result["raw"]}
 
     def _try_single_request(self, path: str, token_key: str, messages: List[Dict[str, str]],
                             max_retries: int, base_wait: float) -> dict:
 
-        import random
-
         for attempt in range(max_retries + 1):
             result = self._http_request(path, token_key, messages)
-            status = result["status"]
-            resp_headers = result["headers"]
-            raw = result["raw"]
-            error = result["error"]
-
-            # 네트워크 에러 → 재시도
-            if error == "network_error":
-                if attempt < max_retries:
-                    time.sleep(base_wait * (2 ** attempt) + random.uniform(0, 0.4))
-                    continue
-                return {"ok": False, "status": None, "content": "", "thinking": None,
-                        "usage": None, "headers": {}, "error": "network_error", "raw": raw}
-
-            # 200 성공
-            if status == 200:
-                try:
-                    obj = json.loads(raw)
-                except json.JSONDecodeError:
-                    return {"ok": False, "status": status, "content": "", "thinking": None,
-                            "usage": None, "headers": resp_headers, "error": "json_decode_error", "raw": raw}
-                content, thinking, usage = self._extract_response_content(obj)
-                self.logger.info(f"HCX-007 OK")
-                return {"ok": True, "status": status, "content": content, "thinking": thinking,
-                        "usage": usage, "headers": resp_headers, "error": None, "raw": obj}
-
-            # 404 → 경로 오류
-            if status == 404:
-                self.logger.error(f"HCX-007 404 경로 오류")
-                return {"ok": False, "status": status, "content": "", "thinking": None,
-                        "usage": None, "headers": resp_headers, "error": "http_404", "raw": raw}
+            final, wait = self._handle_response(result, attempt, max_retries, base_wait)
+            if final is not None:
+                return final
+            time.sleep(wait)
 
-            # 401 → 인증 실패
-            if status == 401:
-                self.logger.error(f"HCX-007 401 인증 실패")
-                return {"ok": False, "status": status, "content": "", "thinking": None,
-                        "usage": None, "headers": resp_headers, "error": "auth_failed", "raw": raw}
-
-            # 429 Rate Limit → 재시도
-            if status == 429 and attempt < max_retries:
-                retry_after = resp_headers.get("Retry-After")
-                try:
-                    wait = float(retry_after) if retry_after else base_wait * (2 ** attempt)
-                except Exception:
-                    wait = base_wait * (2 ** attempt)
-                time.sleep(max(1.0, wait))
-                continue
+        # 재시도 소진
+        return self._retries_exhausted(result)
 
-            # 5xx 서버 에러 → 재시도
-            if status and status >= 500 and attempt < max_retries:
-                time.sleep(base_wait * (2 ** attempt) + random.uniform(0, 0.4))
-                continue
+    async def _try_single_request_async(self, path: str, token_key: str, messages: List[Dict[str, str]],
+                                        max_retries: int, base_wait: float) -> dict:
 
-            # 기타 에러 (400 포함)
-            self.logger.error(f"HCX-007 오류 (HTTP {status}): {str(raw)[:200]}")
-            return {"ok": False, "status": status, "content": "", "thinking": None,
-                    "usage": None, "headers": resp_headers, "error": f"http_{status}", "raw": raw}
+        for attempt in range(max_retries + 1):
+            result = await self._http_request_async(path, token_key, messages)
+            final, wait = self._handle_response(result, attempt, max_retries, base_wait)
+            if final is not None:
+                return final
+            await asyncio.sleep(wait)
 
-        # 재시도 소진
-        return {"ok": False, "status": status, "content": "", "thinking": None,
-                "usage": None, "headers": resp_headers, "error": "max_retries_exceeded", "raw": raw}
+        return self._retries_exhausted(result)
+
+    def _api_paths(self) -> List[str]:
+        """시도 순서: app_type 경로 → 일반 경로 (404 일 때만 다음 경로)"""
+        paths = []
+        if self.app_type in {"testapp", "serviceapp"}:
+            paths.append(f"/{self.app_type}/v3/chat-completions/{self.clova_model_id}")
+        paths.append(f"/v3/chat-completions/{self.clova_model_id}")
+        return paths
+
+    def _missing_api_key(self) -> dict:
+        self.logger.warning("CLOVA API 키가 설정되지 않았습니다.")
+        return {"ok": False, "status": None, "content": "", "thinking": None,
+                "usage": None, "headers": {}, "error": "missing_api_key", "raw": None}
 
     def _call_hyperclova_x(self, messages: List[Dict[str, str]]) -> dict:
 
         if not self.clova_api_key:
-            self.logger.warning("CLOVA API 키가 설정되지 않았습니다.")
-            return {"ok": False, "status": None, "content": "", "thinking": None,
-                    "usage": None, "headers": {}, "error": "missing_api_key", "raw": None}
+            return self._missing_api_key()
 
         token_key = "maxCompletionTokens"
         max_retries = 2
         base_wait = 1.2
 
-        tried = []
+        for path in self._api_paths():
+            r = self._try_single_request(path, token_key, messages, max_retries, base_wait)
+            if r.get("ok") or r.get("error") != "http_404":
+                return r
+        return r
 
-        # 1) app_type 경로 우선 시도
-        if self.app_type in {"testapp", "serviceapp"}:
-            path1 = f"/{self.app_type}/v3/chat-completions/{self.clova_model_id}"
-            r1 = self._try_single_request(path1, token_key, messages, max_retries, base_wait)
-            tried.append(("app_path", r1))
-            if r1.get("ok") or r1.get("error") != "http_404":
-                return r1
+    async def _call_hyperclova_x_async(self, messages: List[Dict[str, str]]) -> dict:
 
-        # 2) 일반 경로 폴백
-        path2 = f"/v3/chat-completions/{self.clova_model_id}"
-        r2 = self._try_single_request(path2, token_key, messages, max_retries, base_wait)
-        tried.append(("vanilla_path", r2))
-        return r2
+        if not self.clova_api_key:
+            return self._missing_api_key()
+
+        token_key = "maxCompletionTokens"
+        max_retries = 2
+        base_wait = 1.2
+
+        for path in self._api_paths():
+            r = await self._try_single_request_async(path, token_key, messages, max_retries, base_wait)
+            if r.get("ok") or r.get("error") != "http_404":
+                return r
+        return r
 
 
     def _ordered_labels(self) -> List[str]:
@@ -506,31 +674,109 @@ class StockEventLabelClassifier:
         """모델이 other/저신뢰일 때 제목 트리거로 보정"""
         if not title:
             return []
-        txt = str(title).strip()
-        hits = set()
-        for lab, patterns in self.compiled_triggers.items():
-            for pat in patterns:
-                if pat.search(txt):
-                    if lab in self.valid_labels:
-                        hits.add(lab)
+        hits = self._trigger_hits(title)
         if not hits:
             return []
         cand = sorted(
             hits,
-            key=lambda x: (0 if x in self.fine_first else 1, self.priority_rank.get(x, 10 ** 6))
+            key=lambda x: (0 if x in self.fine_labels else 1, self.priority_rank.get(x, 10 ** 6))
         )
         return self._prioritize(cand)[:2]
 
+    def _trigger_hits(self, title: str) -> set:
+        """제목에서 트리거가 발화한 유효 라벨 (통합 자동자 1회 스캔)"""
+        return {lab for lab in self.trigger_index.match(str(title).strip()) if lab in self.valid_labels}
+
+    def _rule_fast_path(self, title: str) -> Optional[LabelResult]:
+        """트리거가 결정적이면 모델 없이 바로 판정
+
+        결정적: 세분 라벨이 정확히 1개 발화 (세분 > 포괄), 그 라벨이 fast_path 대상이고
+        우선순위가 rule_fast_path_max_priority 이내.
+        포괄 라벨 (협상 등) 이나 트리거가 넓은 세분 라벨 (call 등) 은 모델 판단에 맡긴다.
+        """
+        hits = self._trigger_hits(title)
+        fine_hits = [h for h in hits if h in self.fine_labels]
+        if len(fine_hits) != 1 or fine_hits[0] not in self.fast_path_labels:
+            return None
+        label = fine_hits[0]
+
+        if self.priority_rank.get(label, 10 ** 6) > self.rule_fast_path_max_priority:
+            return None
+
+        others = ",".join(sorted(hits - {label}))
+        reason = f"룰 기반 판정(트리거:{label}" + (f", 포괄:{others}" if others else "") + ")"
+        return LabelResult([label], self.RULE_FAST_PATH_CONFIDENCE, reason=reason, raw_response="")
+
+    def _record_tier(self, tier: str) -> None:
+        with self._tier_lock:
+            self._tier_counts[tier] += 1
+            total = sum(self._tier_counts.values())
+        if total % self.TIER_LOG_EVERY == 0:
+            stats = self.get_tier_stats()
+            self.logger.info("분류 계층 적중률 (%d건): %s", total, ", ".join(
+                f"{k} {v:.1%}" for k, v in stats["rates"].items()))
+
+    def get_tier_stats(self) -> dict:
+        """계층별 처리 건수/비율 (rule: 룰 즉시 판정, cache: 분류 캐시, llm: 모델 결과, backstop: 모델 후 룰 보정, short: 제목 부족)"""
+        with self._tier_lock:
+            counts = dict(self._tier_counts)
+        total = sum(counts.values())
+        return {
+            "mode": self.mode,
+            "total": total,
+            "counts": counts,
+            "rates": {k: (v / total if total else 0.0) for k, v in counts.items()},
+        }
+
     # ---------------------
     # Public: Single Title
     # ---------------------
     def classify_event(self, title: str, source: str = "") -> LabelResult:
         """단일 제목 분류"""
-        if not title or len(title.strip()) < 5:
-            return LabelResult(labels=["other"], confidence=0.0, reason="제목 부족", raw_response="")
+        quick = self._classify_without_llm(title)
+        if quick is not None:
+            return quick
+
+        cached = self._cached_result(title, source)
+        if cached is not None:
+            return cached
 
         # 1차: 모델 호출
         r1 = self._call_hyperclova_x(self._build_messages(title, source))
+        result = self._finalize_result(title, r1)
+        self._store_result(title, source, r1, result)
+        return result
+
+    async def classify_event_async(self, title: str, source: str = "") -> LabelResult:
+        """classify_event 의 비동기 버전 (API 대기/재시도 백오프 중 이벤트 루프를 막지 않음)"""
+        quick = self._classify_without_llm(title)
+        if quick is not None:
+            return quick
+
+        cached = self._cached_result(title, source)
+        if cached is not None:
+            return cached
+
+        r1 = await self._call_hyperclova_x_async(self._build_messages(title, source))
+        result = self._finalize_result(title, r1)
+        self._store_result(title, source, r1, result)
+        return result
+
+    def _classify_without_llm(self, title: str) -> Optional[LabelResult]:
+        """모델 호출 전 단계: 제목 부족 / (tiered 모드) 룰 즉시 판정"""
+        if not title or len(title.strip()) < 5:
+            self._record_tier("short")
+            return LabelResult(labels=["other"], confidence=0.0, reason="제목 부족", raw_response="")
+
+        if self.mode == "tiered":
+            fast = self._rule_fast_path(title)
+            if fast is not None:
+                self._record_tier("rule")
+                return fast
+        return None
+
+    def _finalize_result(self, title: str, r1: dict) -> LabelResult:
+        """모델 응답 → LabelResult (API 에러 전파, 룰 백스톱 적용)"""
         if not r1.get("ok") or r1.get("status") != 200:
             err = r1.get("error") or "api_error"
             status = r1.get("status")
@@ -546,7 +792,9 @@ class StockEventLabelClassifier:
             # 기타 에러의 경우 룰 기반 백스톱 시도
             rb = self._rule_based_backstop(title)
             if rb:
+                self._record_tier("backstop")
                 return LabelResult(rb, 0.75, reason=f"룰 기반 보정(모델 실패:{err})", raw_response=str(r1.get("raw") or ""))
+            self._record_tier("llm")
             return LabelResult(["other"], 0.0, reason=f"API 호출 실패: {err}", raw_response=str(r1.get("raw") or ""))
 
         labels1, conf1, reason1 = self._parse_triplet_output(r1.get("content", ""))
@@ -556,8 +804,10 @@ class StockEventLabelClassifier:
         if (len(v1) == 1 and v1[0] == "other") or (conf1 < 0.6):
             rb = self._rule_based_backstop(title)
             if rb:
+                self._record_tier("backstop")
                 return LabelResult(rb, 0.75, reason=f"룰 기반 보정(모델:{','.join(v1)} conf={conf1:.2f})",
                                    raw_response=r1.get("content", ""))
 
         # 기본 결과 반환
+        self._record_tier("llm")
         return LabelResult(v1[:2], conf1, reason1, r1.get("content", ""))
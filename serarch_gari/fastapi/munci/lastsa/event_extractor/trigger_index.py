@@ -0,0 +1,118 @@
+from __future__ import annotations
+from typing import Dict, List, Optional, Pattern, Set, Tuple
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_parse
+
+from munci.main_utils.automaton import AhoCorasickMatcher
+
+_ZERO_WIDTH = {sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT}
+_REPEATS = {sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, getattr(sre_parse, "POSSESSIVE_REPEAT", None)}
+
+
+def required_literals(pattern: str, flags: int = 0) -> Optional[Set[str]]:
+    """정규식이 매칭되려면 반드시 포함해야 하는 리터럴 후보 집합 (그중 하나는 본문에 있어야 함)
+
+    뽑을 수 없으면 None (예: 문자 클래스/와일드카드만으로 된 패턴).
+    """
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except Exception:
+        return None
+    return _sequence_literals(parsed)
+
+
+def _sequence_literals(items) -> Optional[Set[str]]:
+    """연속 항목 중 가장 변별력 있는(최소 길이가 가장 긴) 필수 리터럴 집합 선택"""
+    candidates: List[Set[str]] = []
+    run = ""
+
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            run += chr(av)
+            continue
+        if op in _ZERO_WIDTH:
+            # \b, 전후방 탐색은 폭이 없으므로 앞뒤 리터럴이 그대로 이어짐
+            continue
+
+        if run:
+            candidates.append({run})
+            run = ""
+
+        sub = None
+        if op is sre_parse.SUBPATTERN:
+            sub = _sequence_literals(av[-1])
+        elif op is sre_parse.BRANCH:
+            sub = _branch_literals(av[1])
+        elif op in _REPEATS and av[0] >= 1:
+            sub = _sequence_literals(av[2])
+        if sub:
+            candidates.append(sub)
+
+    if run:
+        candidates.append({run})
+    if not candidates:
+        return None
+    return max(candidates, key=lambda s: (min(len(x) for x in s), -len(s)))
+
+
+def _branch_literals(branches) -> Optional[Set[str]]:
+    merged: Set[str] = set()
+    for branch in branches:
+        sub = _sequence_literals(branch)
+        if not sub:
+            return None  # 리터럴 없는 분기가 하나라도 있으면 거를 수 없음
+        merged |= sub
+    return merged
+
+
+class TriggerIndex:
+    """라벨 트리거 통합 인덱스
+
+    - 모든 트리거 정규식의 필수 리터럴을 Aho-Corasick 자동자 하나에 등록
+    - 제목을 한 번 훑어 리터럴이 등장한 정규식만 검증 → 발화 라벨 집합
+    - 필수 리터럴을 뽑지 못한 정규식은 매번 검증 (결과는 전수 검사와 동일)
+    """
+
+    def __init__(self, compiled_triggers: Dict[str, List[Pattern]]):
+        self._patterns: List[Tuple[str, Pattern]] = []
+        self._always: List[int] = []
+        self._matcher = AhoCorasickMatcher()
+
+        for label, patterns in compiled_triggers.items():
+            for pat in patterns:
+                idx = len(self._patterns)
+                self._patterns.append((label, pat))
+                literals = required_literals(pat.pattern, pat.flags)
+                if not literals:
+                    self._always.append(idx)
+                    continue
+                for literal in literals:
+                    self._matcher.add(literal, idx)
+
+        self._matcher.build()
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    @property
+    def prefiltered_ratio(self) -> float:
+        """자동자로 거를 수 있는 정규식 비율"""
+        return 1 - len(self._always) / len(self._patterns) if self._patterns else 0.0
+
+    def match(self, text: str) -> Set[str]:
+        """text 에서 트리거가 발화한 라벨 집합"""
+        if not text:
+            return set()
+
+        candidates = {idx for _, _, idx in self._matcher.iter_matches(text)}
+        candidates.update(self._always)
+
+        hits: Set[str] = set()
+        for idx in candidates:
+            label, pat = self._patterns[idx]
+            if label not in hits and pat.search(text):
+                hits.add(label)
+        return hits
@@ -93,6 +93,47 @@ def _extract_json_block(text: str, expect_array: bool = False):
     return data if isinstance(data, (list, dict)) else ([] if expect_array else {})
 
 
+GPT_EVENT_MODEL = "gpt-4-turbo-preview"
+
+GPT_EVENT_SYSTEM_MSG = (
+    "너는 금융/산업 뉴스의 '구체적 사건(event)'을 추출하는 전문가다. "
+    "**중요: 모든 응답은 반드시 한국어로만 작성한다.** "
+    "출력은 오직 JSON 객체 하나만 허용한다(코드블록/설명/주석/여분 텍스트 금지). "
+    "스키마: {\"events\": <문자열 배열, 길이 0~2>, \"confidence\": <0~1 float>, \"reason\": <짧은 한국어 문장>}. "
+    "events에는 제목에 실제로 존재하는 한국어 단어를 그대로 사용한 '핵심 명사구'만 넣는다(새 단어/의역/영어 번역 금지). "
+    "reason도 반드시 한국어로 작성한다."
+)
+
+GPT_EVENT_USER_TEMPLATE = """아래 뉴스 제목에서 실제 일어난 사건을 나타내는 '핵심 명사/명사구'를 최대 2개 추출하세요.
+**주의: 모든 결과는 반드시 한국어로 작성해야 합니다.**
+
+뉴스 제목: {text}
+
+출력 형식(JSON-only, 한국어):
+{{"events": ["이벤트1"], "confidence": 0.90, "reason": "간단 근거"}}
+
+응답:"""
+
+GPT_EVENT_FEWSHOT = [
+    {"role": "user", "content": "뉴스 제목: Samsung Electronics announces Q3 earnings\n\n출력 형식(JSON-only, 한국어):"},
+    {"role": "assistant", "content": '{"events": ["Q3 실적 발표"], "confidence": 0.85, "reason": "제목에 명시됨"}'},
+]
+
+
+def _build_gpt_event_messages(text: str) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": GPT_EVENT_SYSTEM_MSG},
+        *GPT_EVENT_FEWSHOT,
+        {"role": "user", "content": GPT_EVENT_USER_TEMPLATE.format(text=text)},
+    ]
+
+
+def gpt_event_prompt_version() -> str:
+    """ChatGPT 이벤트 추출 결과 캐시 버전 (모델/프롬프트/후번역 설정이 바뀌면 무효)"""
+    from munci.lastsa.event_extractor.label_cache import version_stamp
+    return version_stamp(GPT_EVENT_MODEL, _build_gpt_event_messages("{text}"), EVENT_POST_TRANSLATE_TO)
+
+
 @APIErrorHandler.handle_openai_error
 def classify_event_by_chatgpt(text: str) -> Dict[str, Any]:
     """ChatGPT를 사용한 이벤트 분류"""
@@ -106,36 +147,12 @@ def classify_event_by_chatgpt(text: str) -> Dict[str, Any]:
     client = OpenAI(api_key=api_key)
     logger.debug("[GPT] OpenAI client initialized")
 
-    SYSTEM_MSG = (
-        "너는 금융/산업 뉴스의 '구체적 사건(event)'을 추출하는 전문가다. "
-        "**중요: 모든 응답은 반드시 한국어로만 작성한다.** "
-        "출력은 오직 JSON 객체 하나만 허용한다(코드블록/설명/주석/여분 텍스트 금지). "
-        "스키마: {\"events\": <문자열 배열, 길이 0~2>, \"confidence\": <0~1 float>, \"reason\": <짧은 한국어 문장>}. "
-        "events에는 제목에 실제로 존재하는 한국어 단어를 그대로 사용한 '핵심 명사구'만 넣는다(새 단어/의역/영어 번역 금지). "
-        "reason도 반드시 한국어로 작성한다."
-    )
-
-    user_prompt = f"""아래 뉴스 제목에서 실제 일어난 사건을 나타내는 '핵심 명사/명사구'를 최대 2개 추출하세요.
-**주의: 모든 결과는 반드시 한국어로 작성해야 합니다.**
-
-뉴스 제목: {text}
-
-출력 형식(JSON-only, 한국어):
-{{"events": ["이벤트1"], "confidence": 0.90, "reason": "간단 근거"}}
+    messages = _build_gpt_event_messages(text)
 
-응답:"""
-
-    messages = [
-        {"role": "system", "content": SYSTEM_MSG},
-        {"role": "user", "content": "뉴스 제목: Samsung Electronics announces Q3 earnings\n\n출력 형식(JSON-only, 한국어):"},
-        {"role": "assistant", "content": '{"events": ["Q3 실적 발표"], "confidence": 0.85, "reason": "제목에 명시됨"}'},
-        {"role": "user", "content": user_prompt},
-    ]
-
-    logger.debug("[GPT] Calling OpenAI API with model: gpt-4-turbo-preview")
+    logger.debug(f"[GPT] Calling OpenAI API with model: {GPT_EVENT_MODEL}")
 
     resp = client.chat.completions.create(
-        model="gpt-4-turbo-preview",
+        model=GPT_EVENT_MODEL,
         messages=messages,
         temperature=0,
         max_tokens=200,
@@ -219,3 +236,18 @@ def classify_event(text: str) -> UnifiedEventResult:
         source=result.source,
         raw_response=result.raw_response
     )
+
+
+async def classify_event_async(text: str) -> UnifiedEventResult:
+    """classify_event 의 비동기 버전 (async 핸들러에서 워커 스레드를 점유하지 않음)"""
+    from munci.rumerapi.utils.classifier_wrapper import get_classifier_wrapper
+
+    result = await get_classifier_wrapper().classify_async(text)
+
+    return UnifiedEventResult(
+        labels=result.labels,
+        event_phrases=result.phrases,
+        confidence=result.confidence,
+        source=result.source,
+        raw_response=result.raw_response
+    )
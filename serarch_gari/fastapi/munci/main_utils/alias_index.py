@@ -0,0 +1,189 @@
+from __future__ import annotations
+import os
+import json
+import pickle
+import threading
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# fastapi/examples/normalized_aliases.json (스캐너 기본 사전)
+DEFAULT_ALIASES_PATH = Path(__file__).parent.parent.parent / "examples" / "normalized_aliases.json"
+
+# 컴파일 산출물 위치 (미지정 시 원본 JSON 옆에 .idx.pkl 로 저장)
+ALIAS_INDEX_CACHE_DIR = os.getenv("ALIAS_INDEX_CACHE_DIR", "")
+
+_INDEX_VERSION = 2
+
+
+@dataclass
+class AliasIndex:
+    """normalized_aliases.json 컴파일 결과
+
+    - name_to_code: 공식명/별칭 → 종목코드
+    - code_to_names: 종목코드 → [공식명, 별칭...]
+    - alias_to_official: 별칭 → 공식명
+    - official_aliases: 공식명 → 별칭 목록 (6자리 종목코드 제외, 원본 순서)
+    - official_to_code: 공식명 → 종목코드 (없으면 None)
+    """
+    source: str
+    source_mtime_ns: int
+    source_size: int
+    name_to_code: Dict[str, str] = field(default_factory=dict)
+    code_to_names: Dict[str, List[str]] = field(default_factory=dict)
+    alias_to_official: Dict[str, str] = field(default_factory=dict)
+    official_aliases: Dict[str, List[str]] = field(default_factory=dict)
+    official_to_code: Dict[str, Optional[str]] = field(default_factory=dict)
+    version: int = _INDEX_VERSION
+
+    def __len__(self) -> int:
+        return len(self.official_aliases)
+
+    def code_for(self, name: str) -> Optional[str]:
+        return self.name_to_code.get(name)
+
+    def names_for(self, code: str) -> List[str]:
+        return self.code_to_names.get(str(code).zfill(6), [])
+
+    def official_for(self, alias: str) -> Optional[str]:
+        return self.alias_to_official.get(alias)
+
+    def is_fresh(self, stat: os.stat_result) -> bool:
+        return (
+            self.version == _INDEX_VERSION
+            and self.source_mtime_ns == stat.st_mtime_ns
+            and self.source_size == stat.st_size
+        )
+
+    @classmethod
+    def from_json(cls, path: Path, stat: os.stat_result) -> AliasIndex:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        index = cls(str(path), stat.st_mtime_ns, stat.st_size)
+
+        for official_name, items in data.items():
+            if not isinstance(items, list) or not items:
+                continue
+
+            # 추출기용: 6자리 숫자(마지막 항목 우선)만 종목코드, 나머지 숫자는 별칭 유지
+            ticker, extractor_aliases = _split_ticker(items)
+            index.official_aliases[official_name] = extractor_aliases
+            index.official_to_code[official_name] = ticker
+
+            for alias in extractor_aliases:
+                index.alias_to_official[alias] = official_name
+
+            # 스캐너용: 첫 숫자 항목을 종목코드로, 숫자 항목은 이름에서 제외
+            code, aliases = _split_code(items)
+            if not code:
+                continue
+
+            index.name_to_code[official_name] = code
+            for alias in aliases:
+                index.name_to_code[alias] = code
+
+            names = index.code_to_names.setdefault(code, [])
+            for name in [official_name] + aliases:
+                if name not in names:
+                    names.append(name)
+
+        return index
+
+
+def _split_ticker(items: List[str]) -> Tuple[Optional[str], List[str]]:
+    """추출기 규칙: 6자리 숫자 항목이 종목코드 (여러 개면 마지막), 그 외 항목은 모두 별칭"""
+    ticker = None
+    aliases = []
+    for item in items:
+        item = str(item)
+        if item.isdigit() and len(item) == 6:
+            ticker = item
+        else:
+            aliases.append(item)
+    return ticker, aliases
+
+
+def _split_code(items: List[str]) -> Tuple[Optional[str], List[str]]:
+    """스캐너 규칙: 첫 숫자 항목을 종목코드로, 숫자가 아닌 항목만 별칭"""
+    code = None
+    aliases = []
+    for item in items:
+        item = str(item)
+        if item.isdigit():
+            if code is None:
+                code = item
+        else:
+            aliases.append(item)
+    return code, aliases
+
+
+# --------------------------- 컴파일/캐시 ---------------------------
+
+_INDEXES: Dict[str, AliasIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def _artifact_path(source: Path) -> Path:
+    if ALIAS_INDEX_CACHE_DIR:
+        # 경로가 달라도 파일명이 같을 수 있으므로 부모 디렉터리명을 붙임
+        return Path(ALIAS_INDEX_CACHE_DIR) / f"{source.parent.name}_{source.stem}.idx.pkl"
+    return source.with_suffix(".idx.pkl")
+
+
+def _load_artifact(artifact: Path, stat: os.stat_result) -> Optional[AliasIndex]:
+    if not artifact.exists():
+        return None
+    try:
+        with open(artifact, 'rb') as f:
+            index = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"별칭 인덱스 산출물 읽기 실패 → 재컴파일: {e}")
+        return None
+    return index if isinstance(index, AliasIndex) and index.is_fresh(stat) else None
+
+
+def _save_artifact(artifact: Path, index: AliasIndex):
+    try:
+        artifact.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = artifact.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, artifact)
+    except OSError as e:
+        # 읽기 전용 배포 환경 등: 산출물 없이 메모리 인덱스만 사용
+        logger.info(f"별칭 인덱스 산출물 저장 생략: {e}")
+
+
+def get_alias_index(path: Optional[str] = None) -> Optional[AliasIndex]:
+    """별칭 인덱스 조회 (프로세스당 1회 로드, 원본 mtime 변경 시 재컴파일)
+
+    fork 된 워커는 부모에서 로드한 인덱스를 그대로 공유한다.
+    원본 파일이 없으면 None.
+    """
+    source = Path(path) if path else DEFAULT_ALIASES_PATH
+    try:
+        stat = source.stat()
+    except OSError:
+        logger.warning(f"별칭 사전 파일 없음: {source}")
+        return None
+
+    key = str(source.resolve())
+
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is not None and index.is_fresh(stat):
+            return index
+
+        artifact = _artifact_path(source)
+        index = _load_artifact(artifact, stat)
+        if index is None:
+            index = AliasIndex.from_json(source, stat)
+            _save_artifact(artifact, index)
+            logger.info(f"별칭 인덱스 컴파일: {source.name} ({len(index)}개 기업, 별칭 {len(index.name_to_code)}개)")
+
+        _INDEXES[key] = index
+        return index
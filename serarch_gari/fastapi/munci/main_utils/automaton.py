@@ -0,0 +1,118 @@
+from __future__ import annotations
+from collections import deque
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+def _fold(text: str) -> str:
+    """대소문자 무시용 소문자화 (문자 수가 바뀌는 문자는 그대로 두어 오프셋 유지)"""
+    low = text.lower()
+    if len(low) == len(text):
+        return low
+    return ''.join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+class AhoCorasickMatcher:
+    """다중 키워드 Aho-Corasick 자동자 (대소문자 무시)
+
+    - add() 로 키워드와 payload 등록 후 build()
+    - iter_matches() 는 본문을 한 번만 훑어 (start, end, payload) 를 모두 반환
+    """
+
+    def __init__(self) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._own: List[List[int]] = [[]]   # 노드에서 끝나는 키워드 (add 기준, build 로 바뀌지 않음)
+        self._out: List[List[int]] = [[]]   # _own + 실패 링크 출력 병합 (build 때마다 다시 계산)
+        self._lengths: List[int] = []
+        self._payloads: List[List[Any]] = []
+        self._key_ids: Dict[str, int] = {}
+        self._built = False
+        # 같은 본문을 연달아 조회하는 경우(추출 → 검증) 재사용
+        self._last: Tuple[str, List[Tuple[int, int, Any]]] = ("", [])
+
+    def __len__(self) -> int:
+        return len(self._key_ids)
+
+    def add(self, key: str, payload: Any) -> None:
+        if not key:
+            return
+
+        folded = _fold(key)
+        key_id = self._key_ids.get(folded)
+        if key_id is None:
+            node = 0
+            for ch in folded:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._own.append([])
+                    self._out.append([])
+                node = nxt
+
+            key_id = len(self._lengths)
+            self._key_ids[folded] = key_id
+            self._lengths.append(len(folded))
+            self._payloads.append([])
+            self._own[node].append(key_id)
+
+        self._payloads[key_id].append(payload)
+        self._built = False
+
+    def build(self) -> AhoCorasickMatcher:
+        """실패 링크 구성 (BFS) 및 출력 링크 병합 (add 후 다시 호출해도 같은 결과)"""
+        self._out[0] = list(self._own[0])
+        queue = deque()
+        for nxt in self._goto[0].values():
+            self._fail[nxt] = 0
+            self._out[nxt] = list(self._own[nxt])
+            queue.append(nxt)
+
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # 실패 노드는 더 얕으므로 BFS 순서상 이미 병합 완료
+                self._out[nxt] = self._own[nxt] + self._out[self._fail[nxt]]
+
+        self._built = True
+        self._last = ("", [])
+        return self
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """겹치는 매칭 포함 모든 (start, end, payload)"""
+        if not self._built:
+            self.build()
+
+        goto, fail, out = self._goto, self._fail, self._out
+        lengths, payloads = self._lengths, self._payloads
+
+        node = 0
+        for i, ch in enumerate(_fold(text)):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            for key_id in out[node]:
+                end = i + 1
+                start = end - lengths[key_id]
+                for payload in payloads[key_id]:
+                    yield start, end, payload
+
+    def find_all(self, text: str) -> List[Tuple[int, int, Any]]:
+        """iter_matches 결과 리스트 (직전 본문과 같으면 재사용)"""
+        # 스레드 간 공유 상태이므로 한 번만 읽고, 호출자가 수정해도 캐시가 변하지 않게 복사본 반환
+        last = self._last
+        if self._built and last[0] == text and text:
+            return list(last[1])
+
+        matches = list(self.iter_matches(text))
+        self._last = (text, matches)
+        return list(matches)
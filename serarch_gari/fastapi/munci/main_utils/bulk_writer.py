@@ -0,0 +1,169 @@
+from __future__ import annotations
+import os
+import time
+import threading
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BULK_BATCH_SIZE = int(os.getenv("DB_BULK_BATCH_SIZE", "1000"))
+
+
+@dataclass
+class BulkWriteResult:
+    """일괄 저장 결과"""
+    table: str
+    rows: int = 0
+    chunks: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class BulkUpsertWriter:
+    """INSERT ... ON DUPLICATE KEY UPDATE 일괄 저장기
+
+    - 청크 단위 executemany (pymysql 이 multi-row VALUES 한 문장으로 재작성)
+    - 청크마다 트랜잭션 1개 (실패 시 해당 청크 롤백 후 예외 전파)
+    - VALUES 절에는 %s 만 두어야 multi-row 재작성이 적용됨 (NOW() 등은 UPDATE 절에)
+    """
+
+    def __init__(
+        self,
+        table: str,
+        columns: Sequence[str],
+        update_columns: Optional[Sequence[str]] = None,
+        update_exprs: Optional[Mapping[str, str]] = None,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE
+    ):
+        if batch_size < 1:
+            raise ValueError(f"batch_size는 1 이상이어야 합니다: {batch_size}")
+
+        self.table = table
+        self.columns = list(columns)
+        self.batch_size = batch_size
+        self.sql = self._build_sql(update_columns or [], update_exprs or {})
+
+    def _build_sql(self, update_columns: Sequence[str], update_exprs: Mapping[str, str]) -> str:
+        placeholders = ', '.join(['%s'] * len(self.columns))
+        sql = f"INSERT INTO {self.table} ({', '.join(self.columns)}) VALUES ({placeholders})"
+
+        updates = [f"{c} = VALUES({c})" for c in update_columns]
+        updates += [f"{c} = {expr}" for c, expr in update_exprs.items()]
+        if updates:
+            sql += " ON DUPLICATE KEY UPDATE " + ', '.join(updates)
+        return sql
+
+    def write(self, conn, rows: Iterable[Sequence]) -> BulkWriteResult:
+        """행(컬럼 순서 튜플) 일괄 저장"""
+        rows = rows if isinstance(rows, list) else list(rows)
+        result = BulkWriteResult(self.table)
+        if not rows:
+            return result
+
+        started = time.perf_counter()
+        with conn.cursor() as cursor:
+            for i in range(0, len(rows), self.batch_size):
+                chunk = rows[i:i + self.batch_size]
+                try:
+                    cursor.executemany(self.sql, chunk)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                result.rows += len(chunk)
+                result.chunks += 1
+
+        result.elapsed = time.perf_counter() - started
+        logger.info(
+            f"{self.table} 일괄 저장: {result.rows}행 / {result.chunks}청크, "
+            f"{result.elapsed:.2f}s ({result.rows_per_sec:,.0f} rows/s)"
+        )
+        return result
+
+    def write_dicts(self, conn, records: Iterable[Mapping]) -> BulkWriteResult:
+        """dict 레코드 일괄 저장 (없는 키는 NULL)"""
+        return self.write(conn, [tuple(r.get(c) for c in self.columns) for r in records])
+
+
+# --------------------------- 테이블 컬럼 캐시 ---------------------------
+
+_COLUMNS_CACHE: Dict[Tuple, frozenset] = {}
+_COLUMNS_LOCK = threading.Lock()
+
+
+def get_table_columns(conn, table: str) -> frozenset:
+    """SHOW COLUMNS 결과를 (호스트, DB, 테이블) 별로 프로세스당 1회만 조회"""
+    key = (getattr(conn, 'host', None), getattr(conn, 'db', None), table)
+
+    with _COLUMNS_LOCK:
+        cached = _COLUMNS_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    with conn.cursor() as cursor:
+        cursor.execute(f"SHOW COLUMNS FROM {table}")
+        rows = cursor.fetchall()
+    # DictCursor / 기본 커서 모두 지원
+    columns = frozenset(r['Field'] if isinstance(r, dict) else r[0] for r in rows)
+
+    with _COLUMNS_LOCK:
+        _COLUMNS_CACHE[key] = columns
+    logger.info(f"{table} columns: {sorted(columns)}")
+    return columns
+
+
+# --------------------------- 테이블별 writer ---------------------------
+
+NEWS_GAPS_COLUMNS = [
+    'news_id', 'news_title', 'stock_code', 'stock_name', 'event_code',
+    'news_date', 'horizon', 'actual_return', 'expected_return', 'expected_std',
+    'z_score', 'direction', 'magnitude', 'sample_count'
+]
+
+NEWS_RETURNS_COLUMNS = [
+    'news_id', 'stock_code', 'stock_name', 'event_code', 'news_date',
+    'anchor_price', 'return_1d', 'return_3d', 'return_5d'
+]
+
+EVENT_RETURNS_HISTORY_COLUMNS = [
+    'stock_code', 'event_date', 'event_code', 'anchor_date',
+    'anchor_price', 'return_1d', 'return_3d', 'return_5d',
+    'volume', 'market_cap', 'created_at'
+]
+
+
+def news_gaps_writer(
+    conn,
+    with_calc_mode: bool = True,
+    batch_size: int = DEFAULT_BULK_BATCH_SIZE
+) -> BulkUpsertWriter:
+    """news_gaps writer (calc_mode 컬럼이 있으면 함께 저장)"""
+    has_calc_mode = with_calc_mode and 'calc_mode' in get_table_columns(conn, 'news_gaps')
+    columns = NEWS_GAPS_COLUMNS + (['calc_mode'] if has_calc_mode else [])
+    updates = ['z_score', 'direction', 'magnitude'] + (['calc_mode'] if has_calc_mode else [])
+    return BulkUpsertWriter('news_gaps', columns, updates, batch_size=batch_size)
+
+
+def news_returns_writer(batch_size: int = DEFAULT_BULK_BATCH_SIZE) -> BulkUpsertWriter:
+    return BulkUpsertWriter(
+        'news_returns',
+        NEWS_RETURNS_COLUMNS,
+        ['return_1d', 'return_3d', 'return_5d'],
+        batch_size=batch_size
+    )
+
+
+def event_returns_history_writer(batch_size: int = DEFAULT_BULK_BATCH_SIZE) -> BulkUpsertWriter:
+    return BulkUpsertWriter(
+        'event_returns_history',
+        EVENT_RETURNS_HISTORY_COLUMNS,
+        ['anchor_date', 'anchor_price', 'return_1d', 'return_3d', 'return_5d',
+         'volume', 'market_cap'],
+        update_exprs={'updated_at': 'NOW()'},
+        batch_size=batch_size
+    )
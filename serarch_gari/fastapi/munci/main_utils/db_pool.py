@@ -0,0 +1,213 @@
+from __future__ import annotations
+import os
+import time
+import threading
+import logging
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import pymysql
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DEFAULT_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))        # 초, 연결 최대 수명
+DEFAULT_POOL_PING_INTERVAL = int(os.getenv("DB_POOL_PING_INTERVAL", "30"))  # 초, 유휴 후 헬스체크
+DEFAULT_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))        # 초, 대여 대기 한도
+
+
+class PoolTimeoutError(RuntimeError):
+    """풀에서 연결을 대여하지 못함 (대기 시간 초과)"""
+
+
+@dataclass
+class _PooledEntry:
+    conn: Any
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class ConnectionPool:
+    """스레드 안전 MariaDB(pymysql) 연결 풀
+
+    - max_size: 동시에 열 수 있는 최대 연결 수
+    - recycle: 생성 후 N초가 지난 연결은 폐기 후 재생성
+    - ping_interval: N초 이상 유휴였던 연결은 대여 전 ping 으로 헬스체크
+    """
+
+    def __init__(
+        self,
+        db_config: dict,
+        max_size: int = DEFAULT_POOL_SIZE,
+        recycle: int = DEFAULT_POOL_RECYCLE,
+        ping_interval: int = DEFAULT_POOL_PING_INTERVAL,
+        timeout: float = DEFAULT_POOL_TIMEOUT
+    ):
+        if max_size < 1:
+            raise ValueError(f"max_size는 1 이상이어야 합니다: {max_size}")
+
+        self.db_config = db_config
+        self.max_size = max_size
+        self.recycle = recycle
+        self.ping_interval = ping_interval
+        self.timeout = timeout
+
+        self._idle: deque[_PooledEntry] = deque()
+        self._size = 0  # 열려 있는 전체 연결 수 (대여 중 + 유휴)
+        self._cond = threading.Condition(threading.Lock())
+        self._closed = False
+
+    # --------------------------- public API ---------------------------
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """연결 대여 컨텍스트 (종료 시 미커밋 트랜잭션은 롤백 후 반납)"""
+        entry = self._acquire()
+        broken = False
+        try:
+            yield entry.conn
+        except (pymysql.err.OperationalError, pymysql.err.InterfaceError):
+            broken = True
+            raise
+        finally:
+            self._release(entry, discard=broken)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "max_size": self.max_size,
+            }
+
+    def close(self):
+        """유휴 연결 모두 종료 (대여 중 연결은 반납 시 종료)"""
+        with self._cond:
+            self._closed = True
+            entries = list(self._idle)
+            self._idle.clear()
+            self._size -= len(entries)
+            self._cond.notify_all()
+
+        for entry in entries:
+            self._close_quietly(entry.conn)
+
+    # --------------------------- internals ---------------------------
+
+    def _acquire(self) -> _PooledEntry:
+        deadline = time.monotonic() + self.timeout
+        entry: Optional[_PooledEntry] = None
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("이미 종료된 연결 풀입니다")
+                if self._idle:
+                    entry = self._idle.pop()  # LIFO: 최근 사용 연결 우선
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeoutError(
+                        f"연결 풀 대여 시간 초과 ({self.timeout}s, max_size={self.max_size})"
+                    )
+                self._cond.wait(remaining)
+
+        try:
+            if entry is None:
+                return _PooledEntry(conn=self._connect())
+            return self._validate(entry)
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+    def _validate(self, entry: _PooledEntry) -> _PooledEntry:
+        now = time.monotonic()
+
+        if self.recycle > 0 and now - entry.created_at > self.recycle:
+            logger.debug("연결 수명 초과 → 재생성")
+            self._close_quietly(entry.conn)
+            return _PooledEntry(conn=self._connect())
+
+        if now - entry.last_used > self.ping_interval:
+            try:
+                entry.conn.ping(reconnect=False)
+            except Exception as e:
+                logger.info(f"연결 헬스체크 실패 → 재생성: {e}")
+                self._close_quietly(entry.conn)
+                return _PooledEntry(conn=self._connect())
+
+        return entry
+
+    def _release(self, entry: _PooledEntry, discard: bool = False):
+        if not discard:
+            try:
+                # 읽기 전용 사용이라도 트랜잭션 스냅샷이 남지 않도록 정리
+                entry.conn.rollback()
+            except Exception:
+                discard = True
+
+        with self._cond:
+            if discard or self._closed:
+                self._size -= 1
+            else:
+                entry.last_used = time.monotonic()
+                self._idle.append(entry)
+            self._cond.notify()
+
+        if discard or self._closed:
+            self._close_quietly(entry.conn)
+
+    def _connect(self):
+        return pymysql.connect(**self.db_config)
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+# --------------------------- process-wide registry ---------------------------
+
+_POOLS: Dict[Tuple, ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _config_key(db_config: dict) -> Tuple:
+    return tuple(sorted((k, repr(v)) for k, v in db_config.items()))
+
+
+def get_pool(db_config: dict, **pool_kwargs) -> ConnectionPool:
+    """db_config 별 프로세스 공유 연결 풀 (fork 된 자식 프로세스는 별도 풀 사용)"""
+    key = (os.getpid(), _config_key(db_config))
+
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = ConnectionPool(db_config, **pool_kwargs)
+            _POOLS[key] = pool
+            logger.info(
+                f"DB 연결 풀 생성: {db_config.get('host')}/{db_config.get('database')} "
+                f"(max_size={pool.max_size}, recycle={pool.recycle}s)"
+            )
+        return pool
+
+
+def close_all_pools():
+    """현재 프로세스의 모든 연결 풀 종료"""
+    pid = os.getpid()
+    with _POOLS_LOCK:
+        keys = [k for k in _POOLS if k[0] == pid]
+        pools = [_POOLS.pop(k) for k in keys]
+
+    for pool in pools:
+        pool.close()
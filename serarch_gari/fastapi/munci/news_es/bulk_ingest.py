@@ -0,0 +1,249 @@
+"""
+병렬 ES 적재 도구
+
+- 전처리: 프로세스 풀 (워커 프로세스당 NewsPreprocessor 1개)
+- 임베딩: 메인 프로세스에서 배치 생성 (모델은 프로세스에 1개만 로드)
+- 인덱싱: helpers.parallel_bulk, 청크는 바이트 예산(max_chunk_bytes) 기준으로 잘림
+"""
+from __future__ import annotations
+import os
+import time
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from elasticsearch import Elasticsearch, helpers
+
+logger = logging.getLogger(__name__)
+
+# 청크당 최대 요청 크기 (임베딩 1024차원 문서는 ~20KB → 약 500건)
+BULK_MAX_CHUNK_BYTES = int(os.getenv("ES_BULK_MAX_CHUNK_MB", "10")) * 1024 * 1024
+# 바이트 예산이 먼저 걸리도록 건수 상한은 넉넉하게
+BULK_MAX_CHUNK_DOCS = int(os.getenv("ES_BULK_MAX_CHUNK_DOCS", "5000"))
+
+
+# --------------------------- worker (프로세스 단위) ---------------------------
+
+_worker_transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+_worker_prime: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+
+
+def _init_worker(model_name: str, use_ai_events: bool):
+    """워커 프로세스당 전처리기 1개 (임베딩은 메인 프로세스에서 배치로 생성)"""
+    global _worker_transform, _worker_prime
+    from .preprocess import NewsPreprocessor
+    from .sync_from_db import DB_COLS, transform_row
+
+    logging.basicConfig(
+        level=logging.WARNING,
+        format='%(asctime)s - %(processName)s - %(levelname)s - %(message)s'
+    )
+    preprocessor = NewsPreprocessor(False, model_name, use_ai_events)
+    _worker_transform = lambda row: transform_row(preprocessor, row)
+    # 배치 단위로 제목 keyphrases/simhash 를 한 번에 계산
+    _worker_prime = lambda rows: preprocessor.prime_titles(
+        (row.get(DB_COLS["title"]) or "").strip() for row in rows
+    )
+
+
+def _preprocess_batch(rows: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Tuple[Any, str]], float]:
+    started = time.perf_counter()
+    docs, errors = [], []
+    _worker_prime(rows)
+    for row in rows:
+        try:
+            docs.append(_worker_transform(row))
+        except Exception as e:
+            errors.append((row.get('id'), str(e)))
+    return docs, errors, time.perf_counter() - started
+
+
+# --------------------------- metrics ---------------------------
+
+class StageMetrics:
+    """단계별 처리 건수/소요 시간"""
+
+    def __init__(self):
+        self.docs: Dict[str, int] = {}
+        self.seconds: Dict[str, float] = {}
+
+    def add(self, stage: str, docs: int, seconds: float):
+        self.docs[stage] = self.docs.get(stage, 0) + docs
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+
+    def log(self, wall_seconds: float):
+        logger.info(f"  - 단계별 처리량 (전체 {wall_seconds:.1f}초):")
+        for stage, docs in self.docs.items():
+            sec = self.seconds.get(stage, 0.0)
+            rate = docs / sec if sec > 0 else 0.0
+            logger.info(f"      {stage:<12} {docs:>10,}건 {sec:>9.1f}초 ({rate:,.1f}건/초)")
+
+
+# --------------------------- index settings ---------------------------
+
+class BulkLoadSettings:
+    """적재 동안 refresh/replica 를 끄고 끝나면 원래 값으로 되돌림"""
+
+    def __init__(self, es: Elasticsearch, index: str, replicas: int = 0):
+        self.es = es
+        self.index = index
+        self.replicas = replicas
+        self._saved: Optional[Dict[str, Any]] = None
+
+    def __enter__(self):
+        try:
+            current = self.es.indices.get_settings(index=self.index)[self.index]["settings"]["index"]
+            self._saved = {
+                "refresh_interval": current.get("refresh_interval", "1s"),
+                "number_of_replicas": current.get("number_of_replicas", "1"),
+            }
+            self.es.indices.put_settings(index=self.index, settings={
+                "index": {"refresh_interval": "-1", "number_of_replicas": self.replicas}
+            })
+            logger.info(f"적재 설정 적용: refresh=-1, replicas={self.replicas} (복원값 {self._saved})")
+        except Exception as e:
+            logger.warning(f"적재 설정 변경 실패 (기본 설정으로 진행): {e}")
+            self._saved = None
+        return self
+
+    def __exit__(self, *exc):
+        if self._saved is None:
+            return
+        try:
+            self.es.indices.put_settings(index=self.index, settings={"index": self._saved})
+            self.es.indices.refresh(index=self.index)
+            logger.info(f"인덱스 설정 복원: {self._saved}")
+        except Exception as e:
+            logger.error(f"인덱스 설정 복원 실패: {e}")
+
+
+# --------------------------- pipeline ---------------------------
+
+def _batched(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch: List[Dict[str, Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class ParallelIngestor:
+    """행 스트림 → (프로세스 풀 전처리) → (배치 임베딩) → parallel_bulk"""
+
+    def __init__(
+            self,
+            es: Elasticsearch,
+            index: str,
+            use_embedding: bool = False,
+            embed_model: str = "",
+            use_ai_events: bool = False,
+            workers: Optional[int] = None,
+            bulk_threads: int = 4,
+            max_chunk_bytes: int = BULK_MAX_CHUNK_BYTES,
+            max_chunk_docs: int = BULK_MAX_CHUNK_DOCS,
+            near_dup=None
+    ):
+        self.es = es
+        self.index = index
+        self.use_embedding = use_embedding
+        self.embed_model = embed_model
+        self.use_ai_events = use_ai_events
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.bulk_threads = max(1, bulk_threads)
+        self.max_chunk_bytes = max_chunk_bytes
+        self.max_chunk_docs = max_chunk_docs
+        # SimhashLSHIndex: 워커별로 나누면 클러스터가 갈라지므로 메인 프로세스에서 부여
+        self.near_dup = near_dup
+        self.metrics = StageMetrics()
+        self.success_count = 0
+        self.error_count = 0
+
+    def _actions(self, rows: Iterable[Dict[str, Any]], batch_size: int, tracker=None) -> Iterator[Dict[str, Any]]:
+        from .embedding import embed_titles
+
+        rows_iter = _batched(rows, batch_size)
+        in_flight = deque()
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.embed_model, self.use_ai_events)
+        ) as executor:
+            while True:
+                # 워커 수의 2배까지만 미리 제출 (메모리 상한)
+                while len(in_flight) < self.workers * 2:
+                    started = time.perf_counter()
+                    batch = next(rows_iter, None)
+                    if batch is None:
+                        break
+                    self.metrics.add("fetch", len(batch), time.perf_counter() - started)
+                    in_flight.append((executor.submit(_preprocess_batch, batch), batch[-1].get('id')))
+
+                if not in_flight:
+                    break
+
+                future, last_id = in_flight.popleft()
+                docs, errors, worker_sec = future.result()
+                # preprocess 시간은 워커 처리 시간 합 (워커 1개당 처리량)
+                self.metrics.add("preprocess", len(docs) + len(errors), worker_sec)
+                self.error_count += len(errors)
+                for row_id, err in errors:
+                    logger.error(f"문서 변환 실패 (ID: {row_id}): {err}")
+
+                if self.use_embedding and docs:
+                    started = time.perf_counter()
+                    vectors = embed_titles([d.get('title', '') for d in docs], self.embed_model)
+                    for doc, vec in zip(docs, vectors):
+                        if vec is not None:
+                            doc['embedding'] = vec
+                    self.metrics.add("embed", len(docs), time.perf_counter() - started)
+
+                for doc in docs:
+                    if self.near_dup is not None:
+                        self.near_dup.assign(doc)
+                    if tracker:
+                        tracker.sent()
+                    yield {
+                        "_op_type": "index",
+                        "_index": self.index,
+                        "_id": doc["id"],
+                        **doc
+                    }
+                if tracker and last_id is not None:
+                    tracker.mark(last_id)
+
+    def run(self, rows: Iterable[Dict[str, Any]], batch_size: int = 1000, tracker=None) -> Tuple[int, int]:
+        """적재 실행 후 (성공, 실패) 건수 반환 (tracker 가 있으면 확정 id 갱신)"""
+        started = time.perf_counter()
+        indexed = 0
+
+        with BulkLoadSettings(self.es, self.index):
+            for ok, info in helpers.parallel_bulk(
+                    self.es,
+                    self._actions(rows, batch_size, tracker),
+                    thread_count=self.bulk_threads,
+                    queue_size=self.bulk_threads * 2,
+                    chunk_size=self.max_chunk_docs,
+                    max_chunk_bytes=self.max_chunk_bytes,
+                    raise_on_error=False,
+                    raise_on_exception=False
+            ):
+                indexed += 1
+                if tracker:
+                    tracker.acked(ok=ok)
+                if ok:
+                    self.success_count += 1
+                else:
+                    self.error_count += 1
+                    logger.error(f"ES 인덱싱 실패: {info}")
+
+        wall = time.perf_counter() - started
+        # 인덱싱 단계는 전체 시간에서 메인 프로세스가 직접 쓴 시간(조회/임베딩)을 뺀 값
+        direct = self.metrics.seconds.get("fetch", 0.0) + self.metrics.seconds.get("embed", 0.0)
+        self.metrics.add("index", indexed, max(0.0, wall - direct))
+        self.metrics.log(wall)
+        return self.success_count, self.error_count
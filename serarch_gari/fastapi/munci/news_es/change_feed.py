@@ -0,0 +1,218 @@
+"""
+news_articles 변경 피드
+
+- UpdatedAtFeed: (updated_at, id) 고수위(high-watermark) 이후 행만 LIMIT 단위로 조회
+  · updated_at 인덱스 범위 스캔 1회 → 테이블 크기와 무관한 비용
+  · 신규 행도 updated_at 이 채워져 있어야 함 (DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP)
+  · updated_at 은 커밋이 아니라 문장 실행 시각이므로 NOW() - safety_lag 이전 행만 읽음
+    (늦게 커밋된 트랜잭션/같은 초의 더 작은 id 를 워터마크가 건너뛰지 않도록)
+- OutboxFeed: 트리거가 채우는 news_articles_outbox 를 seq 순서로 소비
+  · 워터마크 없이 남은 항목 중 오래된 N건을 읽고, 반영한 seq 만 정확히 삭제
+    (seq 는 커밋 순서가 아니므로 seq 워터마크를 쓰면 늦게 커밋된 항목을 잃음)
+"""
+from __future__ import annotations
+import os
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import pymysql
+
+from munci.main_utils.db_pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+# 이 시간(초)보다 오래 열려 있던 트랜잭션이 커밋한 변경은 놓칠 수 있음
+CHANGE_FEED_SAFETY_LAG = int(os.getenv("CHANGE_FEED_SAFETY_LAG", "60"))
+
+# UpdatedAtFeed 용 인덱스 (없으면 ORDER BY updated_at, id 가 정렬 비용을 치름)
+CHANGE_FEED_INDEX_DDL = "CREATE INDEX idx_news_articles_updated_id ON news_articles (updated_at, id)"
+
+OUTBOX_TABLE = "news_articles_outbox"
+
+OUTBOX_DDL = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {OUTBOX_TABLE} (
+        seq        BIGINT AUTO_INCREMENT PRIMARY KEY,
+        news_id    BIGINT NOT NULL,
+        op         CHAR(1) NOT NULL COMMENT 'I/U/D',
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_news_articles_outbox_ins AFTER INSERT ON news_articles
+    FOR EACH ROW INSERT INTO {OUTBOX_TABLE} (news_id, op) VALUES (NEW.id, 'I')
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_news_articles_outbox_upd AFTER UPDATE ON news_articles
+    FOR EACH ROW INSERT INTO {OUTBOX_TABLE} (news_id, op) VALUES (NEW.id, 'U')
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_news_articles_outbox_del AFTER DELETE ON news_articles
+    FOR EACH ROW INSERT INTO {OUTBOX_TABLE} (news_id, op) VALUES (OLD.id, 'D')
+    """,
+]
+
+
+class ChangeBatch:
+    """한 번 읽은 변경분 (id 목록 + 반영 후 저장할 워터마크)"""
+
+    def __init__(self, upsert_ids: List[int], deleted_ids: List[int], watermark: Dict[str, Any], size: int,
+                 seqs: Optional[List[int]] = None):
+        self.upsert_ids = upsert_ids
+        self.deleted_ids = deleted_ids
+        self.watermark = watermark
+        self.size = size  # 읽은 원본 행 수 (limit 과 비교해 남은 변경 여부 판단)
+        self.seqs = seqs or []  # outbox: 반영 후 삭제할 항목
+
+
+def _dedupe(ids: List[int]) -> List[int]:
+    seen = set()
+    return [i for i in ids if not (i in seen or seen.add(i))]
+
+
+class UpdatedAtFeed:
+    """(updated_at, id) 워터마크 기반 변경 피드"""
+
+    name = "updated_at"
+
+    def __init__(self, pool: ConnectionPool, safety_lag: int = CHANGE_FEED_SAFETY_LAG):
+        self.pool = pool
+        self.safety_lag = max(0, safety_lag)
+
+    def check(self):
+        """updated_at 이 NOT NULL + 자동 갱신인지 확인 (아니면 신규/수정 행을 놓치므로 중단)"""
+        with self.pool.connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute(
+                """
+                SELECT IS_NULLABLE, COLUMN_DEFAULT, EXTRA
+                FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'news_articles' AND COLUMN_NAME = 'updated_at'
+                """
+            )
+            column = cursor.fetchone()
+            cursor.execute(
+                """
+                SELECT 1
+                FROM information_schema.STATISTICS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'news_articles'
+                  AND COLUMN_NAME = 'updated_at' AND SEQ_IN_INDEX = 1
+                LIMIT 1
+                """
+            )
+            indexed = cursor.fetchone()
+
+        if not column:
+            raise RuntimeError("news_articles.updated_at 컬럼 없음 → --mode poll 사용")
+        default = str(column['COLUMN_DEFAULT'] or '').lower()
+        extra = str(column['EXTRA'] or '').lower()
+        if column['IS_NULLABLE'] != 'NO' or 'current_timestamp' not in default or 'on update' not in extra:
+            raise RuntimeError(
+                "news_articles.updated_at 이 NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP 가 아님 "
+                "(신규/수정 행 누락 가능) → 마이그레이션 전에는 --mode poll 사용"
+            )
+        if not indexed:
+            logger.warning(f"updated_at 인덱스 없음 (조회마다 정렬 비용 발생): {CHANGE_FEED_INDEX_DDL}")
+
+    def initial_watermark(self, since: datetime) -> Dict[str, Any]:
+        return {"updated_at": since.strftime("%Y-%m-%d %H:%M:%S"), "id": 0}
+
+    def read(self, watermark: Dict[str, Any], limit: int) -> ChangeBatch:
+        ts, last_id = watermark["updated_at"], int(watermark.get("id", 0))
+
+        # updated_at >= ts 로 범위를 먼저 좁히고, 같은 시각 안에서는 id 로 이어 읽음
+        # 최근 safety_lag 초 구간은 아직 커밋 전인 트랜잭션이 있을 수 있어 다음 주기로 미룸
+        sql = """
+            SELECT id, updated_at
+            FROM news_articles
+            WHERE updated_at >= %s
+              AND (updated_at > %s OR id > %s)
+              AND updated_at < NOW() - INTERVAL %s SECOND
+            ORDER BY updated_at, id
+            LIMIT %s
+        """
+        with self.pool.connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute(sql, (ts, ts, last_id, self.safety_lag, limit))
+            rows = cursor.fetchall()
+
+        if not rows:
+            return ChangeBatch([], [], watermark, 0)
+
+        last = rows[-1]
+        updated_at = last['updated_at']
+        if isinstance(updated_at, datetime):
+            updated_at = updated_at.strftime("%Y-%m-%d %H:%M:%S")
+        return ChangeBatch(
+            _dedupe([row['id'] for row in rows]), [],
+            {"updated_at": str(updated_at), "id": int(last['id'])},
+            len(rows)
+        )
+
+    def acknowledge(self, batch: ChangeBatch):
+        pass
+
+
+class OutboxFeed:
+    """트리거 기반 outbox 테이블 변경 피드 (반영한 항목을 지우며 소비)"""
+
+    name = "outbox"
+
+    def __init__(self, pool: ConnectionPool):
+        self.pool = pool
+
+    def check(self):
+        with self.pool.connection() as conn, conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+                (OUTBOX_TABLE,)
+            )
+            if not cursor.fetchone():
+                raise RuntimeError(f"{OUTBOX_TABLE} 테이블 없음 → --install-outbox 로 생성")
+
+    def install(self):
+        """outbox 테이블 + 트리거 생성 (트리거 권한 필요)"""
+        with self.pool.connection() as conn, conn.cursor() as cursor:
+            for ddl in OUTBOX_DDL:
+                cursor.execute(ddl)
+            conn.commit()
+        logger.info(f"outbox 테이블/트리거 준비 완료: {OUTBOX_TABLE}")
+
+    def initial_watermark(self, since: datetime) -> Dict[str, Any]:
+        # outbox 는 처리 후 비워지므로 워터마크 없이 남아 있는 항목부터 전부 처리
+        return {}
+
+    def read(self, watermark: Dict[str, Any], limit: int) -> ChangeBatch:
+        with self.pool.connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute(
+                f"SELECT seq, news_id, op FROM {OUTBOX_TABLE} ORDER BY seq LIMIT %s",
+                (limit,)
+            )
+            rows = cursor.fetchall()
+
+        if not rows:
+            return ChangeBatch([], [], watermark, 0)
+
+        # 같은 기사가 여러 번 바뀌었으면 마지막 작업만 반영
+        last_op: Dict[int, str] = {}
+        for row in rows:
+            last_op[row['news_id']] = row['op']
+        upserts = [i for i, op in last_op.items() if op != 'D']
+        deletes = [i for i, op in last_op.items() if op == 'D']
+        return ChangeBatch(upserts, deletes, watermark, len(rows), seqs=[int(row['seq']) for row in rows])
+
+    def acknowledge(self, batch: ChangeBatch):
+        """반영 완료된 outbox 항목만 삭제 (실패하면 예외 → 다음 주기에 같은 항목 재처리)"""
+        if not batch.seqs:
+            return
+        placeholders = ", ".join(["%s"] * len(batch.seqs))
+        with self.pool.connection() as conn, conn.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {OUTBOX_TABLE} WHERE seq IN ({placeholders})", batch.seqs)
+            conn.commit()
+
+
+def create_feed(mode: str, pool: ConnectionPool):
+    if mode == "outbox":
+        return OutboxFeed(pool)
+    if mode == "feed":
+        return UpdatedAtFeed(pool)
+    raise ValueError(f"알 수 없는 변경 피드 모드: {mode}")
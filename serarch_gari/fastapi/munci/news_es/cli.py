@@ -16,6 +16,7 @@ def parse_args():
     ap.add_argument("--recreate-index", action="store_true", help="인덱스를 삭제 후 재생성")
     ap.add_argument("--use-embedding", action="store_true", help="제목 임베딩 생성 + dense_vector 필드 포함")
     ap.add_argument("--embed-model", default="intfloat/multilingual-e5-large", help="임베딩 모델명(sentence-transformers)")
+    ap.add_argument("--embed-batch-size", type=int, default=None, help="임베딩 배치 크기(기본: EMBED_BATCH_SIZE)")
 
     ap.add_argument("--use-ai-events", action="store_true",
                     help="rumerapi를 사용한 AI 이벤트 추출 (HyperCLOVA + GPT-4, 느리지만 정확)")
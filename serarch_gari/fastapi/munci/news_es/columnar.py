@@ -0,0 +1,143 @@
+from __future__ import annotations
+import logging
+from typing import Any, Dict, Generator, Iterable, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# ES 문서 필드 기준 컬럼 구성 (preprocess._build_document 와 동일한 이름)
+STRING_FIELDS = [
+    "id", "oid", "aid", "title", "title_simhash", "cluster_id", "published_at", "published_at_mysql",
+    "publisher", "category", "url", "canonical_url", "body",
+]
+FLOAT_FIELDS = ["publisher_tier", "event_conf"]
+LIST_FIELDS = [
+    "keyphrases", "companies", "companies_kw", "companies_raw", "tickers", "events", "event_codes",
+]
+EMBEDDING_FIELD = "embedding"
+
+
+def _pa():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet 적재에는 pyarrow 가 필요합니다 (pip install pyarrow)") from e
+    return pa, pq
+
+
+def doc_schema(embed_dim: int = 0):
+    """전처리 문서 Arrow 스키마 (임베딩은 float32 고정 길이 배열)"""
+    pa, _ = _pa()
+    fields = [pa.field(name, pa.string()) for name in STRING_FIELDS]
+    fields += [pa.field(name, pa.float64()) for name in FLOAT_FIELDS]
+    fields += [pa.field(name, pa.list_(pa.string())) for name in LIST_FIELDS]
+    if embed_dim:
+        fields.append(pa.field(EMBEDDING_FIELD, pa.list_(pa.float32(), embed_dim)))
+    return pa.schema(fields)
+
+
+class ParquetDocWriter:
+    """전처리 문서 dict → Parquet (row group 단위로 이어 쓰기)"""
+
+    def __init__(self, path: str, embed_dim: int = 0, compression: str = "zstd"):
+        pa, pq = _pa()
+        self.path = path
+        self.embed_dim = embed_dim
+        self.schema = doc_schema(embed_dim)
+        self._writer = pq.ParquetWriter(path, self.schema, compression=compression)
+        self.rows = 0
+
+    def write_docs(self, docs: List[Dict[str, Any]]):
+        if not docs:
+            return
+        pa, _ = _pa()
+
+        columns = []
+        for field in self.schema:
+            name = field.name
+            values = [doc.get(name) for doc in docs]
+            if name in STRING_FIELDS:
+                values = [None if v is None else str(v) for v in values]
+            elif name in LIST_FIELDS:
+                values = [[str(x) for x in v] if v else [] for v in values]
+            elif name == EMBEDDING_FIELD:
+                values = [v if v is not None and len(v) == self.embed_dim else None for v in values]
+            columns.append(pa.array(values, type=field.type))
+
+        self._writer.write_table(pa.Table.from_arrays(columns, schema=self.schema))
+        self.rows += len(docs)
+
+    def close(self):
+        self._writer.close()
+        logger.info(f"Parquet 저장 완료: {self.path} ({self.rows:,}행)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_actions_to_parquet(
+        actions: Iterable[Dict[str, Any]],
+        writer: ParquetDocWriter,
+        batch_size: int = 1000
+) -> Generator[Dict[str, Any], None, None]:
+    """bulk action 을 그대로 흘려보내면서 문서 부분을 Parquet 에도 기록"""
+    buffer: List[Dict[str, Any]] = []
+    for action in actions:
+        buffer.append({k: v for k, v in action.items() if not k.startswith("_")})
+        if len(buffer) >= batch_size:
+            writer.write_docs(buffer)
+            buffer = []
+        yield action
+    writer.write_docs(buffer)
+
+
+def _embedding_block(column) -> Optional[np.ndarray]:
+    """FixedSizeList<float32> 컬럼 → (행, 차원) ndarray (자식 버퍼를 복사 없이 참조)"""
+    dim = column.type.list_size
+    values = column.values.slice(column.offset * dim, len(column) * dim)
+    return values.to_numpy(zero_copy_only=False).reshape(len(column), dim)
+
+
+def iter_parquet_actions(
+        path: str,
+        index: str,
+        use_embedding: bool = False,
+        batch_size: int = 5000
+) -> Generator[Dict[str, Any], None, None]:
+    """Parquet 을 record batch 단위로 읽어 bulk action 생성 (행 단위 파싱 없음)"""
+    _, pq = _pa()
+    pf = pq.ParquetFile(path)
+    names = set(pf.schema_arrow.names)
+    columns = [c for c in pf.schema_arrow.names if use_embedding or c != EMBEDDING_FIELD]
+
+    for batch in pf.iter_batches(batch_size=batch_size, columns=columns):
+        n = batch.num_rows
+        cols: Dict[str, list] = {}
+        for name in batch.schema.names:
+            if name == EMBEDDING_FIELD:
+                continue
+            cols[name] = batch.column(name).to_pylist()
+
+        vectors = None
+        valid = None
+        if use_embedding and EMBEDDING_FIELD in names:
+            column = batch.column(EMBEDDING_FIELD)
+            vectors = _embedding_block(column).tolist()
+            valid = column.is_valid().to_pylist()
+
+        for i in range(n):
+            doc = {name: values[i] for name, values in cols.items() if values[i] is not None}
+            doc.setdefault("publisher_tier", 0.5)
+            if vectors is not None and valid[i]:
+                doc[EMBEDDING_FIELD] = vectors[i]
+            yield {
+                "_op_type": "index",
+                "_index": index,
+                "_id": doc.get("id"),
+                **doc
+            }
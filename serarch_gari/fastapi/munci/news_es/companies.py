@@ -5,19 +5,25 @@ from pathlib import Path
 from munci.lastsa.company_extractor.extractor import FinalCompanyExtractor
 
 
-def extract_stock_codes(csv_path):
+def extract_stock_codes(csv_path, batch_size: int = 100):
     extractor = FinalCompanyExtractor()
 
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+
     results = []
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
+    # HyperCLOVA 호출은 batch_size 단위로 동시 처리 (결과 순서 유지)
+    for start in range(0, len(rows), batch_size):
+        chunk = rows[start:start + batch_size]
+        extraction_results = extractor.extract_companies_batch(
+            [row['종목명'] for row in chunk], verbose=False
+        )
+
+        for row, extraction_result in zip(chunk, extraction_results):
             stock_name = row['종목명']
             stock_code_from_csv = row['종목코드']
 
-            extraction_result = extractor.extract_companies(stock_name, verbose=False)
-
             extracted_ticker = ""
             canonical_name = ""
 
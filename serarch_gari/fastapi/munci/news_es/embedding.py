@@ -1,26 +1,166 @@
-
 from __future__ import annotations
-from typing import Optional, List
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 한 번에 encode 할 문장 수 (CPU 기준 32~128 권장)
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "64"))
+# 추론 백엔드: torch(기본) | int8(torch 동적 양자화) | onnx | onnx-int8
+EMBED_BACKEND = os.getenv("EMBED_BACKEND", "torch").lower()
+
+PASSAGE_PREFIX = "passage: "
+QUERY_PREFIX = "query: "
+
+_BACKENDS = ("torch", "int8", "onnx", "onnx-int8")
+
+
+def _get_store(service: "EmbeddingService"):
+    from .embedding_store import get_embedding_store
+    return get_embedding_store(service.store_name)
+
+
+class EmbeddingService:
+    """문장 임베딩 배치 서비스 (모델은 첫 encode 시점에 1회 로드)"""
+
+    def __init__(self, model_name: str, backend: str = EMBED_BACKEND, batch_size: int = EMBED_BATCH_SIZE):
+        if backend not in _BACKENDS:
+            print(f"[warn] unknown EMBED_BACKEND={backend!r}, fallback to torch")
+            backend = "torch"
+        self.model_name = model_name
+        self.backend = backend
+        self.batch_size = max(1, batch_size)
+        self._model = None
+        self._load_lock = threading.Lock()
+        self._encode_lock = threading.Lock()
+
+    @property
+    def store_name(self) -> str:
+        # 양자화/ONNX 결과는 원본과 미세하게 다르므로 저장소 분리
+        return self.model_name if self.backend == "torch" else f"{self.model_name}@{self.backend}"
+
+    @property
+    def loaded(self) -> bool:
+        return self._model is not None
+
+    @property
+    def model(self):
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    self._model = self._load()
+        return self._model
+
+    def _load(self):
+        from sentence_transformers import SentenceTransformer
+
+        if self.backend in ("onnx", "onnx-int8"):
+            kwargs = {}
+            if self.backend == "onnx-int8":
+                # export_dynamic_quantized_onnx_model 로 미리 만들어 둔 양자화 모델 사용
+                kwargs["model_kwargs"] = {"file_name": os.getenv("EMBED_ONNX_FILE", "onnx/model_qint8_avx512_vnni.onnx")}
+            try:
+                return SentenceTransformer(self.model_name, device="cpu", backend="onnx", **kwargs)
+            except Exception as e:
+                print(f"[warn] ONNX backend unavailable ({e}), fallback to torch")
+                self.backend = "torch"
+
+        model = SentenceTransformer(self.model_name)
+        if self.backend == "int8":
+            import torch
+            model = model.to("cpu")
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return model
+
+    @property
+    def dim(self) -> int:
+        if self._model is not None:
+            return int(self._model.get_sentence_embedding_dimension())
+        return _config_dim(self.model_name)
+
+    def encode(self, texts: List[str], prefix: str = PASSAGE_PREFIX) -> List[Optional[List[float]]]:
+        """texts 를 batch_size 단위로 encode (실패 시 전체 None)"""
+        if not texts:
+            return []
+        try:
+            # 토크나이저/모델 호출은 스레드 간 공유하지 않음
+            with self._encode_lock:
+                vecs = self.model.encode(
+                    [prefix + (t or "") for t in texts],
+                    batch_size=self.batch_size,
+                    normalize_embeddings=True,
+                    convert_to_numpy=True,
+                    show_progress_bar=False
+                )
+            return [v.tolist() for v in vecs]
+        except Exception as e:
+            print("[warn] embedding skipped:", e)
+            return [None] * len(texts)
+
+    def encode_titles(self, titles: List[str]) -> List[Optional[List[float]]]:
+        """제목 임베딩: 디스크 저장소에 있으면 재사용, 없는 것만 encode 후 저장"""
+        store = _get_store(self)
+        if store is None:
+            return self.encode(titles, PASSAGE_PREFIX)
+
+        out = store.get_many(titles)
+        missing = [i for i, v in enumerate(out) if v is None]
+        if missing:
+            computed = self.encode([titles[i] for i in missing], PASSAGE_PREFIX)
+            for i, vec in zip(missing, computed):
+                out[i] = vec
+            store.put_many([titles[i] for i in missing], computed)
+        return out
+
+
+_SERVICES: Dict[Tuple[str, str], EmbeddingService] = {}
+_SERVICES_LOCK = threading.Lock()
+_DIMS: Dict[str, int] = {}
+
+
+def get_embedding_service(model_name: str, backend: Optional[str] = None) -> EmbeddingService:
+    """프로세스 공용 서비스 (모델명 + 백엔드별 1개)"""
+    key = (model_name, (backend or EMBED_BACKEND).lower())
+    with _SERVICES_LOCK:
+        service = _SERVICES.get(key)
+        if service is None:
+            service = EmbeddingService(model_name, backend=key[1])
+            _SERVICES[key] = service
+        return service
+
+
+def embed_titles(titles: Iterable[str], model_name: str) -> List[Optional[List[float]]]:
+    return get_embedding_service(model_name).encode_titles(list(titles))
 
-_EMB_MODEL = None
 
 def embed_title(title: str, model_name: str) -> Optional[List[float]]:
-    global _EMB_MODEL
-    try:
-        if _EMB_MODEL is None:
-            from sentence_transformers import SentenceTransformer
-            _EMB_MODEL = SentenceTransformer(model_name)
-        txt = "passage: " + (title or "")
-        vec = _EMB_MODEL.encode(txt, normalize_embeddings=True)
-        return vec.tolist()
-    except Exception as e:
-        print("[warn] embedding skipped:", e)
-        return None
+    return embed_titles([title], model_name)[0]
 
-def embedding_dim(model_name: str) -> int:
+
+def embedding_store_stats(model_name: str) -> Optional[Dict[str, object]]:
+    store = _get_store(get_embedding_service(model_name))
+    return store.stats() if store is not None else None
+
+
+def embed_query(query: str, model_name: str) -> Optional[List[float]]:
+    return get_embedding_service(model_name).encode([query], QUERY_PREFIX)[0]
+
+
+def _config_dim(model_name: str) -> int:
+    """가중치 로드 없이 config 만 읽어 차원 확인"""
+    if model_name in _DIMS:
+        return _DIMS[model_name]
     try:
-        from sentence_transformers import SentenceTransformer
-        m = SentenceTransformer(model_name)
-        return m.get_sentence_embedding_dimension()
+        from transformers import AutoConfig
+        dim = int(AutoConfig.from_pretrained(model_name).hidden_size)
     except Exception:
-        return 1024 if "large" in model_name.lower() else 768
+        dim = 1024 if "large" in model_name.lower() else 768
+    _DIMS[model_name] = dim
+    return dim
+
+
+def embedding_dim(model_name: str) -> int:
+    with _SERVICES_LOCK:
+        loaded = [s for (name, _), s in _SERVICES.items() if name == model_name and s.loaded]
+    if loaded:
+        return loaded[0].dim
+    return _config_dim(model_name)
@@ -0,0 +1,202 @@
+from __future__ import annotations
+import os
+import re
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .utils import normalize_title
+
+# off 로 두면 저장소 미사용 (항상 새로 임베딩)
+EMBED_STORE = os.getenv("EMBED_STORE", "on").lower()
+EMBED_STORE_DIR = os.getenv(
+    "EMBED_STORE_DIR",
+    str(Path(__file__).parents[2] / "cache" / "embeddings")
+)
+# float16 이면 디스크/메모리 절반 (정규화된 벡터라 코사인 오차 ~1e-3)
+EMBED_STORE_DTYPE = os.getenv("EMBED_STORE_DTYPE", "float16")
+
+_SAFE_NAME = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def title_key(title: str) -> str:
+    return hashlib.sha1(normalize_title(title).encode("utf-8")).hexdigest()
+
+
+class EmbeddingStore:
+    """제목 임베딩 디스크 저장소 (모델별 디렉터리 1개)
+
+    - vectors.bin: 고정 길이 행(dim x dtype)을 이어 붙인 파일, np.memmap 으로 읽음
+    - index.sqlite3: sha1(정규화 제목) → 행 번호 (offset = 행 번호 x 행 크기)
+    - 행 번호는 sqlite 트랜잭션 안에서 할당 → 여러 프로세스가 동시에 추가해도 겹치지 않음
+    """
+
+    def __init__(self, root_dir: str, model_name: str, dtype: str = EMBED_STORE_DTYPE):
+        self.model_name = model_name
+        self.dir = Path(root_dir) / _SAFE_NAME.sub("_", model_name)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.vectors_path = self.dir / "vectors.bin"
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.dir / "index.sqlite3"), timeout=30,
+                                   check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (k TEXT PRIMARY KEY, v TEXT NOT NULL)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS vectors (key_hash TEXT PRIMARY KEY, row INTEGER NOT NULL)")
+
+        meta = dict(self._db.execute("SELECT k, v FROM meta").fetchall())
+        self.dtype = np.dtype(meta.get("dtype", dtype))
+        self.dim: Optional[int] = int(meta["dim"]) if "dim" in meta else None
+        if meta.get("model_name", model_name) != model_name:
+            raise ValueError(f"저장소 모델 불일치: {meta['model_name']} != {model_name}")
+
+        self._mmap: Optional[np.memmap] = None
+        self._counters = {"hits": 0, "misses": 0, "writes": 0}
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+
+    # --------------------------- public API ---------------------------
+
+    def get_many(self, titles: Sequence[str]) -> List[Optional[List[float]]]:
+        keys = [title_key(t) for t in titles]
+        rows = self._lookup(keys)
+
+        out: List[Optional[List[float]]] = [None] * len(keys)
+        found = [(i, rows[k]) for i, k in enumerate(keys) if k in rows]
+        if found:
+            with self._lock:
+                mm = self._vectors(max(row for _, row in found) + 1)
+                if mm is not None:
+                    block = np.asarray(mm[[row for _, row in found]], dtype=np.float32)
+                    for (i, _), vec in zip(found, block):
+                        out[i] = vec.tolist()
+
+        hits = sum(1 for v in out if v is not None)
+        with self._lock:
+            self._counters["hits"] += hits
+            self._counters["misses"] += len(out) - hits
+        return out
+
+    def put_many(self, titles: Sequence[str], vectors: Sequence[Optional[List[float]]]):
+        pairs: Dict[str, List[float]] = {}
+        for title, vec in zip(titles, vectors):
+            if vec is not None:
+                pairs.setdefault(title_key(title), vec)
+        if not pairs:
+            return
+
+        block = np.asarray(list(pairs.values()), dtype=self.dtype)
+        with self._lock:
+            if self.dim is None:
+                self._init_meta(block.shape[1])
+            if block.shape[1] != self.dim:
+                print(f"[warn] embedding store dim mismatch: {block.shape[1]} != {self.dim}")
+                return
+
+            try:
+                self._db.execute("BEGIN IMMEDIATE")
+                existing = self._lookup_locked(list(pairs))
+                new_keys = [k for k in pairs if k not in existing]
+                if not new_keys:
+                    self._db.execute("COMMIT")
+                    return
+
+                start = self._db.execute("SELECT COALESCE(MAX(row) + 1, 0) FROM vectors").fetchone()[0]
+                position = {k: i for i, k in enumerate(pairs)}
+                data = np.ascontiguousarray(block[[position[k] for k in new_keys]]).tobytes()
+                fd = os.open(self.vectors_path, os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    os.pwrite(fd, data, start * self.row_bytes)
+                finally:
+                    os.close(fd)
+
+                self._db.executemany(
+                    "INSERT INTO vectors (key_hash, row) VALUES (?, ?)",
+                    [(k, start + i) for i, k in enumerate(new_keys)]
+                )
+                self._db.execute("COMMIT")
+                self._counters["writes"] += len(new_keys)
+            except Exception as e:
+                self._db.execute("ROLLBACK")
+                print(f"[warn] embedding store write failed: {e}")
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            total = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_rate": self._counters["hits"] / total if total else 0.0,
+                "dim": self.dim,
+                "dtype": self.dtype.name,
+            }
+
+    def close(self):
+        with self._lock:
+            self._mmap = None
+            self._db.close()
+
+    # --------------------------- internal ---------------------------
+
+    @property
+    def row_bytes(self) -> int:
+        return int(self.dim or 0) * self.dtype.itemsize
+
+    def _init_meta(self, dim: int):
+        self._db.executemany(
+            "INSERT OR IGNORE INTO meta (k, v) VALUES (?, ?)",
+            [("model_name", self.model_name), ("dim", str(dim)), ("dtype", self.dtype.name)]
+        )
+        meta = dict(self._db.execute("SELECT k, v FROM meta").fetchall())
+        # 다른 프로세스가 먼저 기록했으면 그 값을 따름
+        self.dim = int(meta["dim"])
+        self.dtype = np.dtype(meta["dtype"])
+
+    def _lookup(self, keys: List[str]) -> Dict[str, int]:
+        with self._lock:
+            return self._lookup_locked(keys)
+
+    def _lookup_locked(self, keys: List[str]) -> Dict[str, int]:
+        rows: Dict[str, int] = {}
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows.update(self._db.execute(
+                f"SELECT key_hash, row FROM vectors WHERE key_hash IN ({placeholders})", chunk
+            ).fetchall())
+        return rows
+
+    def _vectors(self, min_rows: int) -> Optional[np.memmap]:
+        """min_rows 행 이상을 덮는 memmap (파일이 커졌으면 다시 매핑)"""
+        if not self.dim:
+            return None
+        if self._mmap is None or self._mmap.shape[0] < min_rows:
+            size = self.vectors_path.stat().st_size if self.vectors_path.exists() else 0
+            n_rows = size // self.row_bytes
+            if n_rows < min_rows:
+                return None
+            self._mmap = np.memmap(self.vectors_path, dtype=self.dtype, mode="r", shape=(n_rows, self.dim))
+        return self._mmap
+
+
+_stores: Dict[str, Optional[EmbeddingStore]] = {}
+_stores_lock = threading.Lock()
+
+
+def get_embedding_store(store_name: str) -> Optional[EmbeddingStore]:
+    """프로세스 공용 저장소 (EMBED_STORE=off 이거나 열기 실패 시 None)"""
+    if EMBED_STORE in ("off", "0", "false", "none"):
+        return None
+    with _stores_lock:
+        if store_name not in _stores:
+            try:
+                _stores[store_name] = EmbeddingStore(EMBED_STORE_DIR, store_name)
+            except Exception as e:
+                print(f"[warn] embedding store disabled: {e}")
+                _stores[store_name] = None
+        return _stores[store_name]
@@ -74,6 +74,7 @@ def create_index(es: Elasticsearch, index: str, use_embedding: bool, embed_dim:
             "title_char3": {"type": "text", "analyzer": "char3"},
             "body_char3": {"type": "text", "analyzer": "char3"},
             "title_simhash": {"type": "keyword"},
+            "cluster_id": {"type": "keyword"},
             "published_at": {"type": "date"},
             "publisher": {"type": "keyword"},
             "publisher_tier": {"type": "float"},
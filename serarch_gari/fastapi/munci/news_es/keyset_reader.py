@@ -0,0 +1,255 @@
+"""
+news_articles keyset 페이지 리더
+
+- WHERE id > last_id ORDER BY id LIMIT n (OFFSET 없이 PK 범위 스캔)
+- 백그라운드 스레드가 다음 페이지를 미리 읽어 둠 → 전처리/ES 적재와 DB 조회가 겹침
+- ES 반영이 확인된 마지막 id 를 체크포인트 파일에 기록 → 중단 후 이어서 실행
+"""
+from __future__ import annotations
+import os
+import json
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+import pymysql
+
+logger = logging.getLogger(__name__)
+
+NEWS_COLUMNS = "id, title, published_at, publisher, category, url, stock_name, body"
+
+_END = object()  # 마지막 페이지 표시
+
+
+class KeysetReader:
+    """news_articles 를 id 오름차순 페이지로 읽는 스트리밍 리더"""
+
+    def __init__(
+            self,
+            db_config: Dict[str, Any],
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None,
+            page_size: int = 1000,
+            after_id: Optional[int] = None,
+            prefetch: int = 2
+    ):
+        self.db_config = db_config
+        self.page_size = max(1, page_size)
+        self.after_id = after_id
+        self.prefetch = max(1, prefetch)
+
+        where, params = [], []
+        if start_date:
+            where.append("published_at >= %s")
+            params.append(start_date)
+        if end_date:
+            where.append("published_at <= %s")
+            params.append(end_date)
+        self._where = where
+        self._params = params
+
+        self.pages = 0
+        self.fetch_seconds = 0.0
+
+    def _where_sql(self, extra: Optional[str] = None) -> str:
+        clauses = self._where + ([extra] if extra else [])
+        return f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    def count(self) -> int:
+        conn = pymysql.connect(**self.db_config)
+        try:
+            with conn.cursor() as cursor:
+                extra = "id > %s" if self.after_id is not None else None
+                params = self._params + ([self.after_id] if self.after_id is not None else [])
+                cursor.execute(f"SELECT COUNT(*) FROM news_articles {self._where_sql(extra)}", params)
+                return int(cursor.fetchone()[0])
+        finally:
+            conn.close()
+
+    def id_at_offset(self, offset: int) -> Optional[int]:
+        """기존 offset 인자 호환: offset 번째 행 직전 id (한 번만 OFFSET 사용)"""
+        if offset <= 0:
+            return self.after_id
+        conn = pymysql.connect(**self.db_config)
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT id FROM news_articles {self._where_sql()} ORDER BY id LIMIT 1 OFFSET %s",
+                    self._params + [offset - 1]
+                )
+                row = cursor.fetchone()
+                return int(row[0]) if row else None
+        finally:
+            conn.close()
+
+    def _fetch_pages(self, out: queue.Queue, stop: threading.Event):
+        conn = pymysql.connect(**self.db_config)
+        last_id = self.after_id
+        try:
+            with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+                while not stop.is_set():
+                    extra = "id > %s" if last_id is not None else None
+                    params = self._params + ([last_id] if last_id is not None else []) + [self.page_size]
+                    started = time.perf_counter()
+                    cursor.execute(
+                        f"SELECT {NEWS_COLUMNS} FROM news_articles {self._where_sql(extra)} "
+                        f"ORDER BY id LIMIT %s",
+                        params
+                    )
+                    rows = cursor.fetchall()
+                    self.fetch_seconds += time.perf_counter() - started
+
+                    if not rows:
+                        break
+                    last_id = rows[-1]['id']
+                    self._put(out, rows, stop)
+                    if len(rows) < self.page_size:
+                        break
+        except Exception as e:
+            logger.error(f"페이지 조회 실패 (last_id={last_id}): {e}", exc_info=True)
+            self._put(out, e, stop)
+        finally:
+            conn.close()
+            self._put(out, _END, stop)
+
+    @staticmethod
+    def _put(q: queue.Queue, item, stop: threading.Event):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        pages: queue.Queue = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+        worker = threading.Thread(target=self._fetch_pages, args=(pages, stop),
+                                  name="keyset-prefetch", daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = pages.get()
+                if item is _END:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                self.pages += 1
+                yield from item
+        finally:
+            stop.set()
+            worker.join(timeout=5)
+
+
+class CommitTracker:
+    """ES 반영 확인 순서로 '여기까지는 확실히 저장됨' id 추적
+
+    bulk 결과는 보낸 순서대로 돌아오므로(streaming_bulk / parallel_bulk 모두)
+    보낸 건수와 확인 건수를 비교해 마지막으로 확정된 행 id 를 구한다.
+    ES 가 거부한 항목이 나오면 그 앞까지만 확정하고 더 이상 진행하지 않는다 (재개 시 다시 적재).
+    """
+
+    def __init__(self, checkpoint: Optional["SyncCheckpoint"] = None, save_every: float = 5.0):
+        self.checkpoint = checkpoint
+        self.save_every = save_every
+        self.committed_id: Optional[int] = None
+        self._sent = 0
+        self._acked = 0
+        self.failed = False
+        self._marks: Deque[Tuple[int, int]] = deque()
+        self._last_save = time.monotonic()
+
+    def sent(self, n: int = 1):
+        self._sent += n
+
+    def mark(self, row_id: int):
+        """지금까지 보낸 action 이 모두 확인되면 row_id 까지 확정"""
+        self._marks.append((self._sent, row_id))
+        self._advance()
+
+    def acked(self, n: int = 1, ok: bool = True):
+        if self.failed:
+            return
+        if not ok:
+            # 실패 항목 이전까지 확인된 것만 확정
+            self._advance()
+            self.failed = True
+            return
+        self._acked += n
+        self._advance()
+
+    def _advance(self):
+        moved = False
+        while not self.failed and self._marks and self._marks[0][0] <= self._acked:
+            self.committed_id = self._marks.popleft()[1]
+            moved = True
+        if moved and self.checkpoint and time.monotonic() - self._last_save >= self.save_every:
+            self.flush()
+
+    def flush(self):
+        if self.checkpoint and self.committed_id is not None:
+            self.checkpoint.save(self.committed_id)
+            self._last_save = time.monotonic()
+
+
+class SyncCheckpoint:
+    """동기화 체크포인트 파일 (실행 키별 상태, 기본은 마지막 확정 id)"""
+
+    def __init__(self, path: str, run_key: str):
+        self.path = Path(path)
+        self.run_key = run_key
+
+    def load(self) -> Optional[int]:
+        entry = self.load_state()
+        return int(entry["last_id"]) if entry and "last_id" in entry else None
+
+    def save(self, last_id: int):
+        self.save_state({"last_id": int(last_id)})
+
+    def load_state(self) -> Optional[Dict[str, Any]]:
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"체크포인트 읽기 실패 → 처음부터 실행: {e}")
+            return None
+        return data.get(self.run_key)
+
+    def save_state(self, state: Dict[str, Any]):
+        data: Dict[str, Any] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception:
+                data = {}
+
+        data[self.run_key] = {
+            **state,
+            "updated_at": datetime.now().isoformat(timespec='seconds')
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        # 중단되더라도 체크포인트 파일이 깨지지 않도록 원자적 교체
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.pop(self.run_key, None) is not None:
+                with open(self.path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            logger.warning(f"체크포인트 정리 실패: {e}")
@@ -9,6 +9,7 @@ from elasticsearch import helpers
 from .es_client import create_es_client
 from .index_schema import create_index, recreate_index
 from .embedding import embedding_dim
+from .columnar import ParquetDocWriter, iter_parquet_actions
 
 logging.basicConfig(
     level=logging.INFO,
@@ -192,6 +193,65 @@ class PreprocessedCSVLoader:
                 logger.error(f"Row {idx} 변환 실패: {e}")
                 continue
 
+    @property
+    def is_parquet(self) -> bool:
+        return self.csv_path.lower().endswith(('.parquet', '.pq'))
+
+    def convert_to_parquet(self, out_path: str, chunk_size: int = 10000, encoding: str = 'utf-8'):
+        """전처리 CSV → Parquet 1회 변환 (이후 적재는 문자열 파싱 없이 진행)"""
+        emb_dim = embedding_dim(self.embed_model) if self.use_embedding else 0
+        total = 0
+        with ParquetDocWriter(out_path, embed_dim=emb_dim) as writer:
+            for chunk in pd.read_csv(self.csv_path, chunksize=chunk_size, encoding=encoding):
+                docs = []
+                for idx, row in chunk.iterrows():
+                    try:
+                        docs.append(self.row_to_document(row))
+                    except Exception as e:
+                        logger.error(f"Row {idx} 변환 실패: {e}")
+                writer.write_docs(docs)
+                total += len(docs)
+                logger.info(f"Parquet 변환 중... {total:,}행")
+        return total
+
+    def load_parquet(self, chunk_size: int = 10000, recreate: bool = False):
+        """Parquet → ES 적재 (record batch 단위 컬럼 변환)"""
+        logger.info("=" * 60)
+        logger.info(f"전처리된 Parquet → ES 적재 시작")
+        logger.info(f"  - Parquet: {self.csv_path}")
+        logger.info(f"  - Index: {self.index_name}")
+        logger.info("=" * 60)
+
+        self.prepare_index(recreate=recreate)
+
+        success_count = 0
+        error_count = 0
+        start_time = datetime.now()
+
+        for ok, info in helpers.streaming_bulk(
+                self.es,
+                iter_parquet_actions(self.csv_path, self.index_name, self.use_embedding, chunk_size),
+                chunk_size=1000,
+                raise_on_error=False
+        ):
+            if ok:
+                success_count += 1
+                if success_count % chunk_size == 0:
+                    logger.info(f"진행 - 성공: {success_count:,}건")
+            else:
+                error_count += 1
+                logger.error(f"인덱싱 실패: {info}")
+
+        elapsed = (datetime.now() - start_time).total_seconds()
+
+        logger.info("=" * 60)
+        logger.info(" 적재 완료")
+        logger.info(f"  - 성공: {success_count:,}건")
+        logger.info(f"  - 실패: {error_count:,}건")
+        logger.info(f"  - 소요시간: {elapsed:.1f}초")
+        logger.info(f"  - 속도: {success_count / max(elapsed, 1e-9):.1f}건/초")
+        logger.info("=" * 60)
+
     def load(
             self,
             chunk_size: int = 10000,
@@ -199,6 +259,10 @@ class PreprocessedCSVLoader:
             encoding: str = 'utf-8'
     ):
 
+        if self.is_parquet:
+            self.load_parquet(chunk_size=chunk_size, recreate=recreate)
+            return
+
         logger.info("=" * 60)
         logger.info(f"전처리된 CSV → ES 적재 시작")
         logger.info(f"  - CSV: {self.csv_path}")
@@ -272,13 +336,14 @@ def main():
 
     parser = argparse.ArgumentParser(description="전처리된 CSV → ES 직접 적재")
 
-    parser.add_argument("--csv", required=True, help="전처리된 CSV 파일 경로")
+    parser.add_argument("--csv", required=True, help="전처리된 CSV 또는 Parquet(.parquet) 파일 경로")
     parser.add_argument("--index", required=True, help="ES 인덱스명")
     parser.add_argument("--chunk-size", type=int, default=10000, help="청크 크기")
     parser.add_argument("--recreate-index", action="store_true", help="인덱스 재생성")
     parser.add_argument("--use-embedding", action="store_true", help="임베딩 필드 포함")
     parser.add_argument("--embed-model", default="intfloat/multilingual-e5-large")
     parser.add_argument("--encoding", default="utf-8", help="CSV 인코딩")
+    parser.add_argument("--to-parquet", default=None, help="적재 대신 CSV를 Parquet 으로 변환해 저장할 경로")
 
     args = parser.parse_args()
 
@@ -290,6 +355,10 @@ def main():
         embed_model=args.embed_model
     )
 
+    if args.to_parquet:
+        loader.convert_to_parquet(args.to_parquet, chunk_size=args.chunk_size, encoding=args.encoding)
+        return
+
     # 적재 실행
     loader.load(
         chunk_size=args.chunk_size,
@@ -8,7 +8,7 @@ from elasticsearch import helpers
 
 from .es_client import create_es_client
 from .index_schema import create_index, recreate_index
-from .embedding import embed_title, embedding_dim
+from .embedding import embed_titles, embedding_dim, embedding_store_stats, EMBED_BATCH_SIZE
 
 logging.basicConfig(
     level=logging.INFO,
@@ -24,12 +24,14 @@ class CSVLoaderWithEmbedding:
             self,
             csv_path: str,
             index_name: str,
-            embed_model: str = "intfloat/multilingual-e5-large"
+            embed_model: str = "intfloat/multilingual-e5-large",
+            embed_batch_size: int = EMBED_BATCH_SIZE
     ):
 
         self.csv_path = csv_path
         self.index_name = index_name
         self.embed_model = embed_model
+        self.embed_batch_size = max(1, embed_batch_size)
         self.es = create_es_client()
 
         logger.info(f"임베딩 포함 CSV 로더 초기화")
@@ -81,7 +83,7 @@ class CSVLoaderWithEmbedding:
         except Exception:
             return default
 
-    def row_to_document(self, row: pd.Series) -> Dict[str, Any]:
+    def row_to_document(self, row: pd.Series, with_embedding: bool = True) -> Dict[str, Any]:
 
         # 필수 필드
         doc = {
@@ -115,36 +117,56 @@ class CSVLoaderWithEmbedding:
         if 'title_simhash' in row:
             doc['title_simhash'] = str(row.get('title_simhash', ''))
 
-        # ⚡ 임베딩 생성 (핵심!)
+        # ⚡ 임베딩 생성 (핵심!) - generate_docs 에서는 배치로 따로 생성
         title = doc['title']
-        if title:
-            try:
-                embedding = embed_title(title, self.embed_model)
-                if embedding:
-                    doc['embedding'] = embedding
-                else:
-                    logger.warning(f"임베딩 생성 실패: {title[:50]}...")
-            except Exception as e:
-                logger.error(f"임베딩 생성 에러: {e}")
+        if title and with_embedding:
+            self.attach_embeddings([doc])
 
         return doc
 
+    def attach_embeddings(self, docs: list):
+        """제목 있는 문서들의 임베딩을 한 번에 생성해 붙임"""
+        targets = [doc for doc in docs if doc.get('title')]
+        if not targets:
+            return
+        try:
+            embeddings = embed_titles([doc['title'] for doc in targets], self.embed_model)
+        except Exception as e:
+            logger.error(f"임베딩 생성 에러: {e}")
+            return
+
+        for doc, embedding in zip(targets, embeddings):
+            if embedding:
+                doc['embedding'] = embedding
+            else:
+                logger.warning(f"임베딩 생성 실패: {doc['title'][:50]}...")
+
     def generate_docs(self, chunk: pd.DataFrame) -> Generator[Dict[str, Any], None, None]:
-        """문서 제너레이터"""
+        """문서 제너레이터 (embed_batch_size 행씩 임베딩 배치 생성)"""
+        batch = []
         for idx, row in chunk.iterrows():
             try:
-                doc = self.row_to_document(row)
-
-                yield {
-                    "_op_type": "index",
-                    "_index": self.index_name,
-                    "_id": doc["id"],
-                    **doc
-                }
+                batch.append(self.row_to_document(row, with_embedding=False))
             except Exception as e:
                 logger.error(f"Row {idx} 변환 실패: {e}")
                 continue
 
+            if len(batch) >= self.embed_batch_size:
+                yield from self._flush_docs(batch)
+                batch = []
+
+        yield from self._flush_docs(batch)
+
+    def _flush_docs(self, batch: list) -> Generator[Dict[str, Any], None, None]:
+        self.attach_embeddings(batch)
+        for doc in batch:
+            yield {
+                "_op_type": "index",
+                "_index": self.index_name,
+                "_id": doc["id"],
+                **doc
+            }
+
     def load(
             self,
             chunk_size: int = 1000,  # 임베딩 생성 있어서 작게
@@ -220,6 +242,12 @@ class CSVLoaderWithEmbedding:
         logger.info(" 적재 완료")
         logger.info(f"  - 성공: {success_count:,}건")
         logger.info(f"  - 임베딩 생성: {embedding_count:,}건")
+        store_stats = embedding_store_stats(self.embed_model)
+        if store_stats:
+            logger.info(
+                f"  - 임베딩 저장소 재사용: {store_stats['hits']:,}건 "
+                f"(적중률 {store_stats['hit_rate']:.1%}, 신규 {store_stats['writes']:,}건)"
+            )
         logger.info(f"  - 실패: {error_count:,}건")
         logger.info(f"  - 총 소요시간: {elapsed:.1f}초 ({elapsed / 60:.1f}분)")
         logger.info(f"  - 평균 속도: {success_count / elapsed:.1f}건/초")
@@ -247,6 +275,7 @@ def main():
         help="임베딩 모델명"
     )
     parser.add_argument("--encoding", default="utf-8", help="CSV 인코딩")
+    parser.add_argument("--embed-batch-size", type=int, default=EMBED_BATCH_SIZE, help="임베딩 배치 크기")
 
     args = parser.parse_args()
 
@@ -254,7 +283,8 @@ def main():
     loader = CSVLoaderWithEmbedding(
         csv_path=args.csv,
         index_name=args.index,
-        embed_model=args.embed_model
+        embed_model=args.embed_model,
+        embed_batch_size=args.embed_batch_size
     )
 
     # 적재 실행
@@ -9,6 +9,8 @@ from .embedding import embedding_dim
 from .es_client import connect_es
 from .index_schema import create_index, recreate_index
 from .preprocess import docs_generator
+from .columnar import ParquetDocWriter, write_actions_to_parquet
+from .near_dup import SimhashLSHIndex, with_cluster_ids
 from elasticsearch import helpers
 
 
@@ -64,39 +66,46 @@ def main():
             print(f"[경고] MariaDB 설정 로드/연결 실패: {e}")
             conn = None
 
+    # --save-parquet: 적재하는 문서를 그대로 Parquet 으로도 남김 (재적재 시 load_preprocessed 로 사용)
+    parquet_path = None
+    if args.save_parquet:
+        parquet_path = os.path.join(args.out_dir, f"{args.index}.parquet")
+        print(f"[정보] 전처리 결과 Parquet 저장: {parquet_path}")
+
+    def actions(chunk, near_dup, parquet_writer):
+        gen = docs_generator(
+            chunk,
+            cols,
+            args.use_embedding,
+            args.embed_model,
+            args.index,
+            args.use_ai_events,
+            args.embed_batch_size
+        )
+        gen = with_cluster_ids(gen, near_dup)
+        return write_actions_to_parquet(gen, parquet_writer) if parquet_writer else gen
+
     usecols = [cols["date"], cols["category"], cols["title"], cols["publisher"], cols["url"], cols["companies"]]
+
+    def load_csv(encoding):
+        # 인코딩을 바꿔 다시 읽을 때 앞선 시도의 문서가 섞이지 않도록 시도마다 새로 만듦
+        # (Parquet 파일은 덮어쓰고, CSV 청크 전체에 걸쳐 근사 중복 제목에 같은 cluster_id 부여)
+        near_dup = SimhashLSHIndex()
+        parquet_writer = ParquetDocWriter(parquet_path, embed_dim=emb_dim) if parquet_path else None
+        try:
+            for chunk in pd.read_csv(args.csv, sep=sep, chunksize=args.chunk_size, usecols=usecols, dtype=str,
+                                     encoding=encoding):
+                helpers.bulk(es, actions(chunk, near_dup, parquet_writer), chunk_size=1000)
+        finally:
+            if parquet_writer:
+                parquet_writer.close()
+
     try:
-        for chunk in pd.read_csv(args.csv, sep=sep, chunksize=args.chunk_size, usecols=usecols, dtype=str,
-                                 encoding='utf-8'):
-            helpers.bulk(
-                es,
-                docs_generator(
-                    chunk,
-                    cols,
-                    args.use_embedding,
-                    args.embed_model,
-                    args.index,
-                    args.use_ai_events
-                ),
-                chunk_size=1000
-            )
+        load_csv('utf-8')
     except UnicodeDecodeError:
         for enc in ['cp949', 'euc-kr', 'utf-8-sig']:
             try:
-                for chunk in pd.read_csv(args.csv, sep=sep, chunksize=args.chunk_size, usecols=usecols, dtype=str,
-                                         encoding=enc):
-                    helpers.bulk(
-                        es,
-                        docs_generator(
-                            chunk,
-                            cols,
-                            args.use_embedding,
-                            args.embed_model,
-                            args.index,
-                            args.use_ai_events
-                        ),
-                        chunk_size=1000
-                    )
+                load_csv(enc)
                 break
             except Exception as e:
                 print(f"[경고] CSV({enc}) 로딩 실패: {e}")
@@ -0,0 +1,217 @@
+"""
+title_simhash 근사 중복 인덱스
+
+- 64bit simhash 를 n 개 구간(band)으로 나눠 구간값 → 문서 조회 테이블 유지
+  · 해밍거리 k 이하면 (k+1) 구간 중 최소 1개는 그대로 일치 (비둘기집 원리)
+  · probe_bits > 0 이면 구간값의 비트를 뒤집어 추가 조회 (multi-probe) → 구간 수 감소
+- 문서 1건당 조회/추가 비용은 구간 수 × 버킷 크기 (인덱스 크기와 무관)
+- cluster_id: 가장 가까운 기존 문서의 cluster_id, 없으면 자기 id (재실행해도 같은 순서면 같은 값)
+"""
+from __future__ import annotations
+import os
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from itertools import combinations
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+NEAR_DUP_MAX_DISTANCE = int(os.getenv("NEAR_DUP_MAX_DISTANCE", "3"))
+NEAR_DUP_PROBE_BITS = int(os.getenv("NEAR_DUP_PROBE_BITS", "0"))
+# 같은 제목이라도 시간이 많이 떨어져 있으면 별개 기사 (예: 매 분기 실적 발표)
+NEAR_DUP_WINDOW_HOURS = float(os.getenv("NEAR_DUP_WINDOW_HOURS", "72"))
+NEAR_DUP_MAX_ITEMS = int(os.getenv("NEAR_DUP_MAX_ITEMS", "500000"))
+
+_MASK64 = (1 << 64) - 1
+
+
+def parse_simhash(value: Any) -> Optional[int]:
+    """'0x..' 문자열/정수 → int (빈 제목의 0 은 중복 판단에서 제외)"""
+    if value is None or value == "":
+        return None
+    try:
+        h = value if isinstance(value, int) else int(str(value), 16)
+    except ValueError:
+        return None
+    h &= _MASK64
+    return h or None
+
+
+def _epoch(published_at: Any) -> Optional[float]:
+    if isinstance(published_at, datetime):
+        return published_at.timestamp()
+    if not published_at:
+        return None
+    try:
+        return datetime.fromisoformat(str(published_at).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class SimhashLSHIndex:
+    """simhash 구간 분할 조회 테이블 + 선두(leader) 방식 클러스터 id 부여"""
+
+    def __init__(
+            self,
+            max_distance: int = NEAR_DUP_MAX_DISTANCE,
+            probe_bits: int = NEAR_DUP_PROBE_BITS,
+            window_hours: Optional[float] = NEAR_DUP_WINDOW_HOURS,
+            max_items: int = NEAR_DUP_MAX_ITEMS
+    ):
+        self.max_distance = max(0, max_distance)
+        self.probe_bits = max(0, probe_bits)
+        self.window = window_hours * 3600 if window_hours else None
+        self.max_items = max_items
+
+        n_bands = min(64, -(-(self.max_distance + 1) // (self.probe_bits + 1)))
+        base, extra = divmod(64, n_bands)
+        self._bands: List[Tuple[int, int]] = []  # (shift, width)
+        shift = 0
+        for i in range(n_bands):
+            width = base + (1 if i < extra else 0)
+            self._bands.append((shift, width))
+            shift += width
+        self._probes: List[List[int]] = [
+            [sum(1 << b for b in bits) for r in range(min(self.probe_bits, width) + 1)
+             for bits in combinations(range(width), r)]
+            for _, width in self._bands
+        ]
+
+        self._tables: List[Dict[int, List[str]]] = [{} for _ in self._bands]
+        # doc_id → (simhash, epoch, cluster_id), 오래 들어온 순서대로 정리
+        self._entries: "OrderedDict[str, Tuple[int, Optional[float], str]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _keys(self, h: int) -> List[int]:
+        return [(h >> shift) & ((1 << width) - 1) for shift, width in self._bands]
+
+    def query(self, simhash: Any, published_at: Any = None) -> List[Tuple[str, int]]:
+        """해밍거리 max_distance 이하 문서 → [(doc_id, 거리)] 거리 오름차순"""
+        h = parse_simhash(simhash)
+        if h is None:
+            return []
+        ts = _epoch(published_at)
+
+        seen, out = set(), []
+        for table, key, probes in zip(self._tables, self._keys(h), self._probes):
+            for mask in probes:
+                for doc_id in table.get(key ^ mask, ()):
+                    if doc_id in seen:
+                        continue
+                    seen.add(doc_id)
+                    other, other_ts, _ = self._entries[doc_id]
+                    if self.window and ts is not None and other_ts is not None and abs(ts - other_ts) > self.window:
+                        continue
+                    distance = bin(other ^ h).count("1")
+                    if distance <= self.max_distance:
+                        out.append((doc_id, distance))
+        out.sort(key=lambda x: x[1])
+        return out
+
+    def cluster_of(self, doc_id: str) -> Optional[str]:
+        entry = self._entries.get(doc_id)
+        return entry[2] if entry else None
+
+    def add(self, doc_id: str, simhash: Any, published_at: Any = None, cluster_id: Optional[str] = None) -> str:
+        """문서 추가 후 cluster_id 반환 (이미 있는 id 면 기존 cluster_id 유지)"""
+        existing = self._entries.get(doc_id)
+        if existing is not None:
+            return existing[2]
+
+        h = parse_simhash(simhash)
+        if h is None:
+            return cluster_id or doc_id
+
+        if cluster_id is None:
+            matches = self.query(h, published_at)
+            cluster_id = self._entries[matches[0][0]][2] if matches else doc_id
+
+        self._entries[doc_id] = (h, _epoch(published_at), cluster_id)
+        for table, key in zip(self._tables, self._keys(h)):
+            table.setdefault(key, []).append(doc_id)
+
+        while self.max_items and len(self._entries) > self.max_items:
+            self._evict()
+        return cluster_id
+
+    def _evict(self):
+        doc_id, (h, _, _) = self._entries.popitem(last=False)
+        for table, key in zip(self._tables, self._keys(h)):
+            bucket = table.get(key)
+            if bucket is None:
+                continue
+            bucket.remove(doc_id)
+            if not bucket:
+                del table[key]
+
+    def assign(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """ES 문서에 cluster_id 채우기 (문서 dict 를 그대로 수정)"""
+        doc_id = doc.get("id")
+        if doc_id:
+            doc["cluster_id"] = self.add(doc_id, doc.get("title_simhash"), doc.get("published_at"))
+        return doc
+
+    def seed_from_es(self, es, index: str, days: int = 3) -> int:
+        """최근 days 일 문서로 인덱스 채우기 (증분 동기화가 기존 클러스터에 이어 붙도록)"""
+        from elasticsearch import helpers
+
+        query = {"query": {"range": {"published_at": {"gte": f"now-{int(days)}d"}}}}
+        count = 0
+        try:
+            for hit in helpers.scan(es, index=index, query=query,
+                                    _source=["title_simhash", "published_at", "cluster_id"],
+                                    sort=["published_at"], preserve_order=True):
+                s = hit.get("_source", {})
+                self.add(hit["_id"], s.get("title_simhash"), s.get("published_at"), s.get("cluster_id"))
+                count += 1
+        except Exception as e:
+            logger.warning(f"근사 중복 인덱스 초기화 실패 (빈 인덱스로 진행): {e}")
+        logger.info(f"근사 중복 인덱스 초기화: 최근 {days}일 {count:,}건")
+        return count
+
+
+def with_cluster_ids(actions: Iterable[Dict[str, Any]], lsh: SimhashLSHIndex) -> Iterator[Dict[str, Any]]:
+    """bulk action 스트림에 cluster_id 를 채워 그대로 흘려보냄"""
+    for action in actions:
+        yield lsh.assign(action)
+
+
+def collapse_near_duplicates(
+        results: List[Dict[str, Any]],
+        max_distance: int = NEAR_DUP_MAX_DISTANCE
+) -> List[Dict[str, Any]]:
+    """검색 결과(점수순)에서 근사 중복을 묶고 그룹별 최고 점수 문서만 남김
+
+    cluster_id 가 있으면 그대로 묶고, 없으면 title_simhash 로 즉석 인덱스를 만들어 판단
+    (색인 때와 같은 시간 창 적용). 서로 다른 cluster_id 가 이미 붙은 문서끼리는 색인 시점 판단을 따른다.
+    남은 문서에는 duplicates(묶인 사본 수) 와 duplicate_publishers 를 기록한다.
+    """
+    lsh = SimhashLSHIndex(max_distance=max_distance, max_items=0)
+    stored: Dict[str, Optional[str]] = {}  # 즉석 인덱스 id → 문서에 원래 있던 cluster_id
+    groups: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    for i, r in enumerate(results):
+        own = r.get("cluster_id") or None
+        key = own
+        if not key or key not in groups:
+            # cluster_id 가 없는 예전 문서와도 묶이도록 simhash 로 한 번 더 확인
+            for doc_id, _ in lsh.query(r.get("title_simhash"), r.get("published_at")):
+                if own is None or stored[doc_id] is None:
+                    key = lsh.cluster_of(doc_id)
+                    break
+            key = key or f"#{i}"
+            stored[f"#{i}"] = own
+            lsh.add(f"#{i}", r.get("title_simhash"), r.get("published_at"), cluster_id=key)
+        group = groups.get(key)
+        if group is None:
+            groups[key] = {**r, "duplicates": 0, "duplicate_publishers": []}
+            continue
+        group["duplicates"] += 1
+        publisher = r.get("publisher")
+        if publisher and publisher != group.get("publisher") and publisher not in group["duplicate_publishers"]:
+            group["duplicate_publishers"].append(publisher)
+
+    return list(groups.values())
@@ -2,16 +2,16 @@ from __future__ import annotations
 import hashlib
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List, Tuple
 
 from .config import KST
 from .utils import (
     split_companies, canonicalize_naver_news, normalize_title, generate_keyphrases,
-    simhash64, iso_to_mysql_dt, normalize_publisher
+    simhash64, iso_to_mysql_dt, normalize_publisher, title_features_batch
 )
 from .companies import normalize_company
 from .events_es import extract_events, EVENT_CODE2LABEL
-from .embedding import embed_title
+from .embedding import embed_titles, EMBED_BATCH_SIZE
 
 try:
     from munci.lastsa.event_with_translate import classify_event
@@ -35,6 +35,8 @@ class NewsPreprocessor:
         self.use_embedding = use_embedding
         self.model_name = model_name
         self.use_ai_events = use_ai_events
+        # prime_titles 로 미리 계산한 정규화 제목별 (keyphrases, simhash)
+        self._title_features: Dict[str, Tuple[List[str], str]] = {}
 
         logger.info(
             f"전처리기 초기화 완료 "
@@ -45,7 +47,8 @@ class NewsPreprocessor:
     def preprocess_row(
             self,
             row: Dict[str, str],
-            cols: Dict[str, str]
+            cols: Dict[str, str],
+            with_embedding: bool = True
     ) -> Dict[str, Any]:
         try:
             input_data = self._extract_input_data(row, cols)
@@ -62,7 +65,7 @@ class NewsPreprocessor:
 
             event_data = self._extract_events(title_data['normalized'])
 
-            embedding = self._generate_embedding(title_data['normalized'])
+            embedding = self._generate_embedding(title_data['normalized']) if with_embedding else None
 
             doc_id = self._generate_doc_id(
                 url_data['oid'],
@@ -90,6 +93,43 @@ class NewsPreprocessor:
             logger.debug(f"문제 발생 행 데이터: {row}")
             raise
 
+    def preprocess_rows(
+            self,
+            rows: List[Dict[str, str]],
+            cols: Dict[str, str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """여러 행 전처리 후 임베딩은 한 번에 배치 생성 (실패한 행은 None)"""
+        self.prime_titles((row.get(cols["title"], "") or "").strip() for row in rows)
+
+        docs: List[Optional[Dict[str, Any]]] = []
+        try:
+            for row in rows:
+                try:
+                    docs.append(self.preprocess_row(row, cols, with_embedding=False))
+                except Exception:
+                    docs.append(None)
+        finally:
+            self._title_features.clear()
+
+        if self.use_embedding:
+            targets = [doc for doc in docs if doc is not None]
+            embeddings = self._generate_embeddings([doc['title'] for doc in targets])
+            for doc, embedding in zip(targets, embeddings):
+                if embedding is not None:
+                    doc['embedding'] = embedding
+
+        return docs
+
+    def prime_titles(self, raw_titles: Iterable[str]):
+        """제목 keyphrases/simhash 를 배치로 미리 계산 (이후 _process_title 에서 재사용)"""
+        try:
+            normalized = list(dict.fromkeys(normalize_title(t) for t in raw_titles))
+            keyphrases, hashes = title_features_batch(normalized)
+            self._title_features = dict(zip(normalized, zip(keyphrases, hashes)))
+        except Exception as e:
+            logger.warning(f"제목 배치 처리 실패 → 행 단위로 계산: {e}")
+            self._title_features = {}
+
     def _extract_input_data(self, row: Dict[str, str], cols: Dict[str, str]) -> Dict[str, str]:
         try:
             return {
@@ -170,8 +210,13 @@ class NewsPreprocessor:
     def _process_title(self, title_raw: str) -> Dict[str, Any]:
         try:
             normalized = normalize_title(title_raw)
-            keyphrases = generate_keyphrases(normalized)
-            title_hash = simhash64(normalized)
+            cached = self._title_features.get(normalized)
+            if cached is not None:
+                keyphrases, title_hash = cached
+                keyphrases = list(keyphrases)
+            else:
+                keyphrases = generate_keyphrases(normalized)
+                title_hash = simhash64(normalized)
 
             return {
                 'raw': title_raw,
@@ -308,16 +353,23 @@ class NewsPreprocessor:
         if not self.use_embedding:
             return None
 
+        return self._generate_embeddings([title])[0]
+
+    def _generate_embeddings(self, titles: List[str]) -> List[Optional[List[float]]]:
+        if not self.use_embedding or not titles:
+            return [None] * len(titles)
+
         try:
-            embedding = embed_title(title, self.model_name)
-            if embedding:
-                logger.debug(f"임베딩 생성 완료 (차원={len(embedding)})")
+            embeddings = embed_titles(titles, self.model_name)
+            failed = sum(1 for e in embeddings if e is None)
+            if failed:
+                logger.warning(f"임베딩 생성 실패: {failed}/{len(titles)}건")
             else:
-                logger.warning("임베딩 생성 실패")
-            return embedding
+                logger.debug(f"임베딩 생성 완료 ({len(titles)}건)")
+            return embeddings
         except Exception as e:
-            logger.error(f"임베딩 생성 오류 '{title[:50]}...': {e}")
-            return None
+            logger.error(f"임베딩 배치 생성 오류 ({len(titles)}건): {e}")
+            return [None] * len(titles)
 
     def _generate_doc_id(
             self,
@@ -403,10 +455,12 @@ class DocumentGenerator:
             use_embedding: bool,
             model_name: str,
             index: str,
-            use_ai_events: bool = False
+            use_ai_events: bool = False,
+            batch_size: int = EMBED_BATCH_SIZE
     ):
         self.cols = cols
         self.index = index
+        self.batch_size = max(1, batch_size)
         self.preprocessor = NewsPreprocessor(use_embedding, model_name, use_ai_events)
         logger.info(f"문서 생성기 초기화: {index}")
 
@@ -415,22 +469,27 @@ class DocumentGenerator:
         success_count = 0
         error_count = 0
 
-        for idx, row in df.fillna("").iterrows():
-            try:
-                doc = self.preprocessor.preprocess_row(row.to_dict(), self.cols)
-                success_count += 1
+        df = df.fillna("")
+        # 임베딩을 batch_size 행 단위로 묶어 생성
+        for start in range(0, total_rows, self.batch_size):
+            part = df.iloc[start:start + self.batch_size]
+            rows = [row.to_dict() for _, row in part.iterrows()]
+            docs = self.preprocessor.preprocess_rows(rows, self.cols)
 
+            for idx, row, doc in zip(part.index, rows, docs):
+                if doc is None:
+                    error_count += 1
+                    logger.error(f"행 처리 실패 {idx}")
+                    logger.debug(f"행 데이터: {row}")
+                    continue
+
+                success_count += 1
                 yield {
                     "_op_type": "index",
                     "_index": self.index,
                     "_id": doc["id"],
                     **doc
                 }
-            except Exception as e:
-                error_count += 1
-                logger.error(f"행 처리 실패 {idx}: {e}")
-                logger.debug(f"행 데이터: {row.to_dict()}")
-                continue
 
         logger.info(
             f"문서 생성 완료: "
@@ -460,10 +519,14 @@ def docs_generator(
         use_embedding: bool,
         model_name: str,
         index: str,
-        use_ai_events: bool = False
+        use_ai_events: bool = False,
+        batch_size: Optional[int] = None
 ):
     try:
-        generator = DocumentGenerator(cols, use_embedding, model_name, index, use_ai_events)
+        generator = DocumentGenerator(
+            cols, use_embedding, model_name, index, use_ai_events,
+            batch_size=batch_size or EMBED_BATCH_SIZE
+        )
         return generator.generate(df)
     except Exception as e:
         logger.error(f"docs_generator wrapper 실패: {e}")
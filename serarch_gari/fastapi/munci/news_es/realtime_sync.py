@@ -3,10 +3,14 @@ from __future__ import annotations
 import pymysql
 import time
 import logging
-from typing import Dict, Any, Optional
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 from .sync_from_db import MariaDBToElasticsearchSyncer
+from .change_feed import create_feed
+from .keyset_reader import NEWS_COLUMNS, SyncCheckpoint
+from munci.main_utils.db_pool import ConnectionPool, get_pool
 
 logging.basicConfig(
     level=logging.INFO,
@@ -14,6 +18,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+DEFAULT_WATERMARK_PATH = str(Path(__file__).parents[2] / "cache" / "realtime_sync_watermark.json")
+
 
 class RealtimeSyncer:
 
@@ -23,13 +29,28 @@ class RealtimeSyncer:
             db_config: Dict[str, Any],
             es_index: str,
             poll_interval: int = 60,
-            lookback_minutes: int = 5
+            lookback_minutes: int = 5,
+            pool: Optional[ConnectionPool] = None,
+            mode: str = "poll",
+            watermark_path: Optional[str] = None,
+            feed_batch_size: int = 1000,
+            id_batch_size: int = 500
     ):
 
         self.db_config = db_config
+        self.pool = pool or get_pool(db_config)
         self.es_index = es_index
         self.poll_interval = poll_interval
         self.lookback_minutes = lookback_minutes
+        self.mode = mode
+        self.feed_batch_size = max(1, feed_batch_size)
+        self.id_batch_size = max(1, id_batch_size)
+
+        # feed/outbox 모드: 워터마크를 파일에 남겨 재시작해도 이어서 처리
+        self.feed = create_feed(mode, self.pool) if mode != "poll" else None
+        self.checkpoint = SyncCheckpoint(
+            watermark_path or DEFAULT_WATERMARK_PATH, f"{es_index}|{mode}"
+        ) if self.feed else None
 
         self.syncer = MariaDBToElasticsearchSyncer(
             db_config=db_config,
@@ -38,19 +59,21 @@ class RealtimeSyncer:
             use_ai_events=False
         )
 
+        # 기존 문서와 같은 cluster_id 를 이어 받도록 최근 문서로 근사 중복 인덱스 채움
+        self.syncer.near_dup.seed_from_es(self.syncer.es, es_index)
+
         # 마지막 동기화 시점
         self.last_sync_time: Optional[datetime] = None
 
         logger.info(f"RealtimeSyncer initialized")
         logger.info(f"  - Poll interval: {poll_interval}초")
         logger.info(f"  - Lookback: {lookback_minutes}분")
+        logger.info(f"  - Mode: {mode}")
 
     def get_changed_news_ids(self) -> list:
 
-        conn = pymysql.connect(**self.db_config)
-
         try:
-            with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            with self.pool.connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
                 # 마지막 동기화 시점 계산
                 if self.last_sync_time:
                     since = self.last_sync_time
@@ -75,63 +98,106 @@ class RealtimeSyncer:
             logger.error(f"변경 사항 조회 실패: {e}", exc_info=True)
             return []
 
-        finally:
-            conn.close()
-
-    def sync_by_ids(self, news_ids: list):
+    def sync_by_ids(self, news_ids: list) -> Tuple[int, int]:
+        """id 목록을 id_batch_size 단위로 나눠 조회/인덱싱 → (성공, 실패)"""
 
         if not news_ids:
-            return
-
-        conn = pymysql.connect(**self.db_config)
-
-        try:
-            with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-                # ID로 뉴스 조회
-                placeholders = ','.join(['%s'] * len(news_ids))
-                sql = f"""
-                    SELECT 
-                        id, title, published_at, publisher,
-                        category, url, stock_name, body
-                    FROM news_articles
-                    WHERE id IN ({placeholders})
-                """
-
-                cursor.execute(sql, news_ids)
-                rows = cursor.fetchall()
-
-                # ES에 인덱싱
-                from elasticsearch import helpers
-
-                def doc_generator():
-                    for row in rows:
-                        try:
-                            doc = self.syncer.transform_row_to_doc(row)
-                            yield {
-                                "_op_type": "index",
-                                "_index": self.es_index,
-                                "_id": doc["id"],
-                                **doc
-                            }
-                        except Exception as e:
-                            logger.error(f"문서 변환 실패 (ID: {row.get('id')}): {e}")
-                            continue
-
-                # Bulk 인덱싱
-                success, failed = helpers.bulk(
-                    self.syncer.es,
-                    doc_generator(),
-                    chunk_size=100,
-                    raise_on_error=False
-                )
-
-                logger.info(f"동기화 완료: 성공 {success}건, 실패 {len(failed)}건")
-
-        except Exception as e:
-            logger.error(f"ID 기반 동기화 실패: {e}", exc_info=True)
-
-        finally:
-            conn.close()
+            return 0, 0
+
+        success_total, failed_total = 0, 0
+        for i in range(0, len(news_ids), self.id_batch_size):
+            chunk = news_ids[i:i + self.id_batch_size]
+            try:
+                success, failed = self._sync_id_chunk(chunk)
+            except Exception as e:
+                logger.error(f"ID 기반 동기화 실패 ({len(chunk)}건): {e}", exc_info=True)
+                failed_total += len(chunk)
+                continue
+            success_total += success
+            failed_total += failed
+
+        logger.info(f"동기화 완료: 성공 {success_total}건, 실패 {failed_total}건")
+        return success_total, failed_total
+
+    def _sync_id_chunk(self, news_ids: List[int]) -> Tuple[int, int]:
+        """id 묶음 1개 조회 + bulk (DB/ES 오류는 호출자에게 전파)"""
+        from elasticsearch import helpers
+
+        with self.pool.connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            placeholders = ','.join(['%s'] * len(news_ids))
+            cursor.execute(
+                f"SELECT {NEWS_COLUMNS} FROM news_articles WHERE id IN ({placeholders})",
+                news_ids
+            )
+            rows = cursor.fetchall()
+
+        convert_failed = 0
+
+        def doc_generator():
+            nonlocal convert_failed
+            for row in rows:
+                try:
+                    doc = self.syncer.near_dup.assign(self.syncer.transform_row_to_doc(row))
+                    yield {
+                        "_op_type": "index",
+                        "_index": self.es_index,
+                        "_id": doc["id"],
+                        **doc
+                    }
+                except Exception as e:
+                    convert_failed += 1
+                    logger.error(f"문서 변환 실패 (ID: {row.get('id')}): {e}")
+
+        success, failed = helpers.bulk(
+            self.syncer.es,
+            doc_generator(),
+            chunk_size=100,
+            raise_on_error=False
+        )
+        return success, len(failed) + convert_failed
+
+    def sync_changes(self) -> int:
+        """변경 피드를 워터마크부터 끝까지 읽어 반영 → 처리한 변경 수
+
+        묶음 단위로 반영이 끝난 뒤에만 워터마크를 저장하므로,
+        중간에 실패하면 다음 주기에 같은 묶음부터 다시 처리한다.
+        """
+        # 체크포인트 파일의 updated_at(저장 시각)과 겹치지 않게 watermark 키 아래에 보관
+        watermark = (self.checkpoint.load_state() or {}).get("watermark")
+        if watermark is None:
+            watermark = self.feed.initial_watermark(
+                datetime.now() - timedelta(minutes=self.lookback_minutes)
+            )
+            logger.info(f"워터마크 없음 → 시작 지점 {watermark}")
+
+        processed = 0
+        while True:
+            batch = self.feed.read(watermark, self.feed_batch_size)
+            if not batch.size:
+                break
+
+            # 묶음 조회/bulk 자체가 실패하면 워터마크를 저장하지 않고 예외 전파
+            success, failed = 0, 0
+            for i in range(0, len(batch.upsert_ids), self.id_batch_size):
+                ok, ng = self._sync_id_chunk(batch.upsert_ids[i:i + self.id_batch_size])
+                success += ok
+                failed += ng
+            if failed:
+                logger.warning(f"문서 단위 실패 {failed}건 (워터마크는 진행)")
+            if batch.deleted_ids:
+                # ES 문서 id 는 기사 URL/날짜 기반이라 삭제된 행에서 역산 불가
+                logger.warning(f"삭제된 기사 {len(batch.deleted_ids)}건은 ES 에서 수동 정리 필요: {batch.deleted_ids[:10]}")
+
+            watermark = batch.watermark
+            self.checkpoint.save_state({"watermark": watermark})
+            self.feed.acknowledge(batch)
+            processed += batch.size
+            logger.info(f" 변경 {batch.size}건 → 성공 {success}건, 실패 {failed}건 (워터마크 {watermark})")
+
+            if batch.size < self.feed_batch_size:
+                break
+
+        return processed
 
     def run(self):
         """실시간 동기화 시작 (무한 루프)"""
@@ -139,10 +205,26 @@ class RealtimeSyncer:
         logger.info(" 실시간 동기화 시작")
         logger.info("=" * 60)
 
+        # 변경 피드 전제 조건 (updated_at 자동 갱신 / outbox 테이블) 이 없으면 시작하지 않음
+        if self.feed is not None:
+            self.feed.check()
+
         try:
             while True:
                 loop_start = time.time()
 
+                # 변경 피드 모드: 워터마크 이후 변경분만 묶음 단위로 반영
+                if self.feed is not None:
+                    try:
+                        processed = self.sync_changes()
+                        logger.info(f" 변경 {processed}건 반영" if processed else " 변경 없음")
+                    except Exception as e:
+                        logger.error(f"변경 피드 처리 실패 (다음 주기에 재시도): {e}", exc_info=True)
+
+                    elapsed = time.time() - loop_start
+                    time.sleep(max(0, self.poll_interval - elapsed))
+                    continue
+
                 # 1. 변경된 뉴스 조회
                 changed_ids = self.get_changed_news_ids()
 
@@ -192,6 +274,11 @@ def main():
     parser.add_argument("--index", required=True, help="ES 인덱스명")
     parser.add_argument("--poll-interval", type=int, default=60, help="폴링 주기 (초)")
     parser.add_argument("--lookback-minutes", type=int, default=5, help="역방향 조회 시간 (분)")
+    parser.add_argument("--mode", choices=["feed", "outbox", "poll"], default="poll",
+                        help="poll: 기존 방식, feed: (updated_at, id) 워터마크 (updated_at 자동 갱신 필요), "
+                             "outbox: 트리거 outbox 테이블")
+    parser.add_argument("--watermark-path", default=None, help="워터마크 파일 경로")
+    parser.add_argument("--install-outbox", action="store_true", help="outbox 테이블/트리거 생성 후 시작")
 
     args = parser.parse_args()
 
@@ -210,9 +297,14 @@ def main():
         db_config=db_config,
         es_index=args.index,
         poll_interval=args.poll_interval,
-        lookback_minutes=args.lookback_minutes
+        lookback_minutes=args.lookback_minutes,
+        mode=args.mode,
+        watermark_path=args.watermark_path
     )
 
+    if args.install_outbox and args.mode == "outbox":
+        syncer.feed.install()
+
     syncer.run()
 
 
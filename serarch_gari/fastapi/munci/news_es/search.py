@@ -50,6 +50,8 @@ def search_with_api_params(
             results.append({
                 "score": h.get("_score", 0.0),
                 "title": s.get("title"),
+                "title_simhash": s.get("title_simhash"),
+                "cluster_id": s.get("cluster_id"),
                 "body": s.get("body", "")[:500] if "body" in s else "",
                 "publisher": s.get("publisher"),
                 "published_at": s.get("published_at"),
@@ -99,9 +101,11 @@ def smoke_search(es: Elasticsearch, index: str, query: str, use_embedding: bool,
             print("    ", s["url"])
 
     if use_embedding:
-        from sentence_transformers import SentenceTransformer
-        m = SentenceTransformer(model_name)
-        qvec = m.encode("query: " + query, normalize_embeddings=True).tolist()
+        from .embedding import embed_query
+        qvec = embed_query(query, model_name)
+        if qvec is None:
+            print("[warn] kNN smoke skipped: query embedding failed")
+            return
         print("\n[SMOKE] kNN top 10 (with date filter)")
         knn = {
             "size": 10,
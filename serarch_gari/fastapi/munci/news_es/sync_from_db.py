@@ -4,7 +4,6 @@ MariaDB → Elasticsearch 동기화
 MariaDB에서 뉴스 데이터를 읽어 Elasticsearch에 인덱싱
 """
 from __future__ import annotations
-import pymysql
 import logging
 from typing import Dict, Any, Generator
 from datetime import datetime
@@ -14,6 +13,8 @@ from .es_client import create_es_client
 from .index_schema import create_index
 from .preprocess import NewsPreprocessor
 from .config import KST
+from .keyset_reader import KeysetReader, CommitTracker, SyncCheckpoint
+from .near_dup import SimhashLSHIndex
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,6 +22,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# DB 컬럼 → 전처리 입력 컬럼
+DB_COLS = {
+    "date": "published_at",
+    "category": "category",
+    "title": "title",
+    "publisher": "publisher",
+    "url": "url",
+    "companies": "stock_name"  # DB: stock_name → ES: companies
+}
+
+
+def transform_row(preprocessor: NewsPreprocessor, row: Dict[str, Any], with_embedding: bool = True) -> Dict[str, Any]:
+    """news_articles 행 → ES 문서 (병렬 적재 워커에서도 사용)"""
+    # 날짜 형식 변환 (MySQL datetime → ISO)
+    if isinstance(row['published_at'], datetime):
+        row['published_at'] = row['published_at'].astimezone(KST).isoformat()
+
+    doc = preprocessor.preprocess_row(row, DB_COLS, with_embedding=with_embedding)
+
+    # body 추가 (있는 경우)
+    if 'body' in row and row['body']:
+        doc['body'] = row['body'][:5000]  # 최대 5000자
+
+    return doc
+
 
 class MariaDBToElasticsearchSyncer:
     """MariaDB → Elasticsearch 동기화"""
@@ -38,6 +64,8 @@ class MariaDBToElasticsearchSyncer:
         self.es_index = es_index
         self.es = create_es_client()
         self.preprocessor = NewsPreprocessor(use_embedding, embed_model, use_ai_events)
+        # 근사 중복 제목에 같은 cluster_id 부여 (실행 동안 유지)
+        self.near_dup = SimhashLSHIndex()
 
         logger.info(f"동기화 도구 초기화 - index: {es_index}")
 
@@ -46,117 +74,54 @@ class MariaDBToElasticsearchSyncer:
             start_date: str = None,
             end_date: str = None,
             batch_size: int = 1000,
-            offset: int = 0
+            offset: int = 0,
+            after_id: int = None
     ) -> Generator[Dict[str, Any], None, None]:
+        """id 오름차순 keyset 페이지 조회 (다음 페이지는 백그라운드에서 미리 읽음)"""
 
-        conn = pymysql.connect(**self.db_config)
+        reader = KeysetReader(self.db_config, start_date, end_date, page_size=batch_size, after_id=after_id)
 
         try:
-            with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-                # SQL 쿼리 구성
-                where_clauses = []
-                params = []
-
-                if start_date:
-                    where_clauses.append("published_at >= %s")
-                    params.append(start_date)
-
-                if end_date:
-                    where_clauses.append("published_at <= %s")
-                    params.append(end_date)
-
-                where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
-
-                # 전체 개수 조회
-                count_sql = f"SELECT COUNT(*) as total FROM news_articles {where_sql}"
-                cursor.execute(count_sql, params)
-                total = cursor.fetchone()['total']
-                logger.info(f"총 {total:,}건의 뉴스 조회 예정")
-
-                # 배치 단위로 조회
-                current_offset = offset
-                processed = 0
-
-                while True:
-                    sql = f"""
-                        SELECT 
-                            id,
-                            title,
-                            published_at,
-                            publisher,
-                            category,
-                            url,
-                            stock_name,
-                            body
-                        FROM news_articles
-                        {where_sql}
-                        ORDER BY published_at DESC
-                        LIMIT %s OFFSET %s
-                    """
-
-                    cursor.execute(sql, params + [batch_size, current_offset])
-                    rows = cursor.fetchall()
-
-                    if not rows:
-                        break
-
-                    for row in rows:
-                        processed += 1
-                        yield row
-
-                    current_offset += batch_size
-
-                    # 진행률 출력
+            if offset:
+                # 기존 offset 인자는 시작 id 로 한 번만 환산
+                reader.after_id = reader.id_at_offset(offset)
+
+            total = reader.count()
+            logger.info(f"총 {total:,}건의 뉴스 조회 예정 (after_id={reader.after_id})")
+
+            processed = 0
+            for row in reader:
+                processed += 1
+                yield row
+
+                # 진행률 출력
+                if processed % batch_size == 0 or processed == total:
                     logger.info(
                         f"진행: {processed:,}/{total:,} "
-                        f"({processed / total * 100:.1f}%)"
+                        f"({processed / max(total, 1) * 100:.1f}%), "
+                        f"DB 조회 누적 {reader.fetch_seconds:.1f}초"
                     )
 
         except Exception as e:
             logger.error(f"DB 조회 실패: {e}", exc_info=True)
             raise
 
-        finally:
-            conn.close()
-
     def transform_row_to_doc(self, row: Dict[str, Any]) -> Dict[str, Any]:
 
         # preprocess.py의 로직 재사용
-        cols = {
-            "date": "published_at",
-            "category": "category",
-            "title": "title",
-            "publisher": "publisher",
-            "url": "url",
-            "companies": "stock_name"  # DB: stock_name → ES: companies
-        }
-
-        # 날짜 형식 변환 (MySQL datetime → ISO)
-        if isinstance(row['published_at'], datetime):
-            row['published_at'] = row['published_at'].astimezone(KST).isoformat()
-        elif isinstance(row['published_at'], str):
-            # 문자열인 경우 그대로 사용
-            pass
-
-        # body 필드 추가 (preprocess.py에 없는 경우)
-        if 'body' in row and row['body']:
-            # body는 별도 처리하지 않고 그대로 저장
-            pass
-
-        doc = self.preprocessor.preprocess_row(row, cols)
-
-        # body 추가 (있는 경우)
-        if 'body' in row and row['body']:
-            doc['body'] = row['body'][:5000]  # 최대 5000자
-
-        return doc
+        return transform_row(self.preprocessor, row)
 
     def sync(
             self,
             start_date: str = None,
             end_date: str = None,
             batch_size: int = 1000,
-            recreate_index: bool = False
+            recreate_index: bool = False,
+            parallel: bool = False,
+            workers: int = None,
+            bulk_threads: int = 4,
+            resume: bool = False,
+            checkpoint_path: str = None
     ):
 
         logger.info("=" * 60)
@@ -178,6 +143,23 @@ class MariaDBToElasticsearchSyncer:
         create_index(self.es, self.es_index, self.preprocessor.use_embedding, emb_dim)
         logger.info("인덱스 준비 완료")
 
+        # 체크포인트: ES 반영이 확인된 마지막 id (같은 인덱스/기간 실행끼리만 공유)
+        checkpoint = None
+        after_id = None
+        if checkpoint_path:
+            checkpoint = SyncCheckpoint(checkpoint_path, f"{self.es_index}|{start_date}|{end_date}")
+            if resume:
+                after_id = checkpoint.load()
+                logger.info(f"체크포인트에서 재개: id > {after_id}")
+                if after_id is not None:
+                    # 이미 적재된 문서의 cluster_id 를 이어 받도록 근사 중복 인덱스 채움
+                    self.near_dup.seed_from_es(self.es, self.es_index)
+        tracker = CommitTracker(checkpoint)
+
+        if parallel:
+            self._sync_parallel(start_date, end_date, batch_size, workers, bulk_threads, after_id, tracker)
+            return
+
         # 동기화 실행
         success_count = 0
         error_count = 0
@@ -186,10 +168,11 @@ class MariaDBToElasticsearchSyncer:
         def doc_generator():
             nonlocal success_count, error_count
 
-            for row in self.fetch_news_from_db(start_date, end_date, batch_size):
+            for row in self.fetch_news_from_db(start_date, end_date, batch_size, after_id=after_id):
                 try:
-                    doc = self.transform_row_to_doc(row)
+                    doc = self.near_dup.assign(self.transform_row_to_doc(row))
                     success_count += 1
+                    tracker.sent()
 
                     yield {
                         "_op_type": "index",
@@ -201,7 +184,8 @@ class MariaDBToElasticsearchSyncer:
                 except Exception as e:
                     error_count += 1
                     logger.error(f"문서 변환 실패 (ID: {row.get('id')}): {e}")
-                    continue
+
+                tracker.mark(row['id'])
 
         # Bulk 인덱싱
         try:
@@ -211,14 +195,23 @@ class MariaDBToElasticsearchSyncer:
                     chunk_size=1000,
                     raise_on_error=False
             ):
+                tracker.acked(ok=ok)
                 if not ok:
                     error_count += 1
                     logger.error(f"ES 인덱싱 실패: {info}")
 
         except Exception as e:
-            logger.error(f"Bulk 인덱싱 에러: {e}", exc_info=True)
+            tracker.flush()
+            logger.error(f"Bulk 인덱싱 에러: {e} (재개 지점 id={tracker.committed_id})", exc_info=True)
             raise
 
+        if tracker.failed:
+            # 거부된 항목부터 다시 적재하도록 체크포인트 유지
+            tracker.flush()
+            logger.warning(f"ES 인덱싱 실패 항목 있음 (재개 지점 id={tracker.committed_id})")
+        elif checkpoint:
+            checkpoint.clear()
+
         # 결과 출력
         elapsed = (datetime.now() - start_time).total_seconds()
 
@@ -230,6 +223,51 @@ class MariaDBToElasticsearchSyncer:
         logger.info(f"  - 속도: {success_count / elapsed:.1f}건/초")
         logger.info("=" * 60)
 
+    def _sync_parallel(self, start_date, end_date, batch_size, workers, bulk_threads,
+                       after_id=None, tracker=None):
+        """프로세스 풀 전처리 + parallel_bulk 적재 (전체 재동기화용)"""
+        from .bulk_ingest import ParallelIngestor
+
+        ingestor = ParallelIngestor(
+            self.es,
+            self.es_index,
+            use_embedding=self.preprocessor.use_embedding,
+            embed_model=self.preprocessor.model_name,
+            use_ai_events=self.preprocessor.use_ai_events,
+            workers=workers,
+            bulk_threads=bulk_threads,
+            near_dup=self.near_dup
+        )
+        logger.info(f"병렬 적재: 전처리 워커 {ingestor.workers}개, bulk 스레드 {ingestor.bulk_threads}개")
+
+        start_time = datetime.now()
+        try:
+            success_count, error_count = ingestor.run(
+                self.fetch_news_from_db(start_date, end_date, batch_size, after_id=after_id),
+                batch_size=batch_size,
+                tracker=tracker
+            )
+        except Exception:
+            if tracker:
+                tracker.flush()
+                logger.error(f"병렬 적재 중단 (재개 지점 id={tracker.committed_id})")
+            raise
+
+        if tracker and tracker.failed:
+            tracker.flush()
+            logger.warning(f"ES 인덱싱 실패 항목 있음 (재개 지점 id={tracker.committed_id})")
+        elif tracker and tracker.checkpoint:
+            tracker.checkpoint.clear()
+        elapsed = (datetime.now() - start_time).total_seconds()
+
+        logger.info("=" * 60)
+        logger.info(" 동기화 완료 (병렬)")
+        logger.info(f"  - 성공: {success_count:,}건")
+        logger.info(f"  - 실패: {error_count:,}건")
+        logger.info(f"  - 소요시간: {elapsed:.1f}초")
+        logger.info(f"  - 속도: {success_count / max(elapsed, 1e-9):.1f}건/초")
+        logger.info("=" * 60)
+
     def sync_incremental(
             self,
             since_minutes: int = 60,
@@ -243,6 +281,9 @@ class MariaDBToElasticsearchSyncer:
 
         logger.info(f"증분 동기화: 최근 {since_minutes}분")
 
+        # 기존 문서와 같은 cluster_id 를 이어 받도록 최근 문서로 근사 중복 인덱스 채움
+        self.near_dup.seed_from_es(self.es, self.es_index)
+
         self.sync(
             start_date=start_date.strftime("%Y-%m-%d %H:%M:%S"),
             end_date=end_date.strftime("%Y-%m-%d %H:%M:%S"),
@@ -270,6 +311,11 @@ def main():
     parser.add_argument("--embed-model", default="intfloat/multilingual-e5-large")
     parser.add_argument("--use-ai-events", action="store_true", help="AI 이벤트 추출")
     parser.add_argument("--incremental", action="store_true", help="증분 동기화 (최근 1시간)")
+    parser.add_argument("--parallel", action="store_true", help="병렬 적재 (프로세스 풀 전처리 + parallel_bulk)")
+    parser.add_argument("--workers", type=int, default=None, help="전처리 프로세스 수 (기본: CPU-1)")
+    parser.add_argument("--bulk-threads", type=int, default=4, help="parallel_bulk 스레드 수")
+    parser.add_argument("--checkpoint", default=None, help="재개용 체크포인트 파일 경로 (ES 반영된 마지막 id 기록)")
+    parser.add_argument("--resume", action="store_true", help="체크포인트의 마지막 id 이후부터 재개")
 
     args = parser.parse_args()
 
@@ -300,7 +346,12 @@ def main():
             start_date=args.start_date,
             end_date=args.end_date,
             batch_size=args.batch_size,
-            recreate_index=args.recreate_index
+            recreate_index=args.recreate_index,
+            parallel=args.parallel,
+            workers=args.workers,
+            bulk_threads=args.bulk_threads,
+            resume=args.resume,
+            checkpoint_path=args.checkpoint
         )
 
 
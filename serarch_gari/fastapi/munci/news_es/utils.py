@@ -2,8 +2,11 @@
 from __future__ import annotations
 import re, hashlib
 from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse, unquote
-from typing import Optional, Tuple, List
+from typing import Dict, Iterable, Optional, Tuple, List
+
+import numpy as np
 
 from .config import SPACE, PUNCT, KST, PUBLISHER_TIER
 
@@ -44,30 +47,80 @@ def normalize_title(title: str) -> str:
     t = SPACE.sub(" ", t).strip()
     return t
 
+_TOKEN = re.compile(r"[A-Za-z0-9가-힣]{2,}")
+_BITS = np.arange(64, dtype=np.uint64)
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN.findall((text or "").lower())
+
+
+def _keyphrases_from_tokens(toks: List[str], max_n: int) -> List[str]:
+    phrases = set(toks)
+    for a, b in zip(toks, toks[1:]):
+        phrases.add(f"{a} {b}"); phrases.add(a + b)
+    for a, b, c in zip(toks, toks[1:], toks[2:]):
+        phrases.add(f"{a} {b} {c}"); phrases.add(a + b + c)
+    return sorted(phrases)[:max_n]
+
+
 def generate_keyphrases(title: str, max_n: int = 32) -> List[str]:
-    toks = re.findall(r"[A-Za-z0-9가-힣]{2,}", (title or "").lower())
-    phrases = set()
-    for i in range(len(toks)):
-        phrases.add(toks[i])
-        if i + 1 < len(toks):
-            bi = f"{toks[i]} {toks[i + 1]}"; phrases.add(bi); phrases.add(bi.replace(" ", ""))
-        if i + 2 < len(toks):
-            tri = f"{toks[i]} {toks[i + 1]} {toks[i + 2]}"; phrases.add(tri); phrases.add(tri.replace(" ", ""))
-    out = list(phrases); out.sort()
-    return out[:max_n]
+    return _keyphrases_from_tokens(_tokens(title), max_n)
+
+
+def generate_keyphrases_batch(titles: Iterable[str], max_n: int = 32) -> List[List[str]]:
+    return [_keyphrases_from_tokens(_tokens(t), max_n) for t in titles]
+
+
+@lru_cache(maxsize=200_000)
+def _token_hash(tok: str) -> int:
+    # 제목 토큰은 반복이 많아 해시 재계산을 캐시로 대부분 생략
+    return int.from_bytes(hashlib.blake2b(tok.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _simhash_from_tokens(token_lists: List[List[str]]) -> np.ndarray:
+    """토큰 목록들 → simhash (uint64 배열)
+
+    고유 토큰 해시 (U,) → 비트 투표 행렬 (U, 64) → 문서별 구간 합 → 부호로 비트 결정
+    """
+    n = len(token_lists)
+    out = np.zeros(n, dtype=np.uint64)
+    lengths = np.fromiter((len(t) for t in token_lists), dtype=np.int64, count=n)
+    if not lengths.any():
+        return out
+
+    vocab: Dict[str, int] = {}
+    flat = [vocab.setdefault(tok, len(vocab)) for toks in token_lists for tok in toks]
+    hashes = np.fromiter((_token_hash(tok) for tok in vocab), dtype=np.uint64, count=len(vocab))
+
+    votes = ((hashes[:, None] >> _BITS) & np.uint64(1)).astype(np.int8) * 2 - 1   # (U, 64) ±1
+    token_votes = votes[np.asarray(flat, dtype=np.int64)]                          # (T, 64)
+
+    # 토큰이 없는 문서는 0 (원래 구현과 동일) → 토큰 있는 문서의 시작 위치로만 구간 합
+    has_tokens = lengths > 0
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))[has_tokens]
+    sums = np.add.reduceat(token_votes, starts, axis=0, dtype=np.int32)           # (N', 64)
+
+    out[has_tokens] = np.bitwise_or.reduce((sums > 0).astype(np.uint64) << _BITS, axis=1)
+    return out
+
 
 def simhash64(text: str) -> str:
-    tokens = re.findall(r"[A-Za-z0-9가-힣]{2,}", (text or "").lower())
-    v = [0] * 64
-    for tok in tokens:
-        h = int.from_bytes(hashlib.blake2b(tok.encode("utf-8"), digest_size=8).digest(), "big")
-        for i in range(64):
-            v[i] += 1 if (h >> i) & 1 else -1
-    res = 0
-    for i in range(64):
-        if v[i] > 0:
-            res |= (1 << i)
-    return hex(res)
+    return hex(int(_simhash_from_tokens([_tokens(text)])[0]))
+
+
+def simhash64_batch(texts: Iterable[str]) -> List[str]:
+    """여러 제목의 simhash64 를 한 번에 계산 (simhash64 와 같은 값)"""
+    return [hex(int(h)) for h in _simhash_from_tokens([_tokens(t) for t in texts])]
+
+
+def title_features_batch(titles: Iterable[str], max_n: int = 32) -> Tuple[List[List[str]], List[str]]:
+    """정규화된 제목들 → (keyphrases, simhash64) 목록 (토큰화 1회 공유)"""
+    token_lists = [_tokens(t) for t in titles]
+    keyphrases = [_keyphrases_from_tokens(toks, max_n) for toks in token_lists]
+    hashes = [hex(int(h)) for h in _simhash_from_tokens(token_lists)]
+    return keyphrases, hashes
+
 
 def iso_to_mysql_dt(iso_dt: Optional[str]) -> Optional[str]:
     if not iso_dt:
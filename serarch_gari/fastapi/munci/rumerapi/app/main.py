@@ -19,9 +19,11 @@ from munci.rumerapi.services.gap_verification_service import GapVerificationServ
 from munci.rumerapi.services.build_news_history import NewsGapScanner
 from munci.rumerapi.services.gap_checker import NewsGapChecker
 from munci.rumerapi.extractors.companyGpt import initialize_extractor
-from munci.lastsa.event_with_translate import initialize_event_classifier, classify_event
+from munci.lastsa.event_with_translate import initialize_event_classifier, classify_event_async
+from munci.rumerapi.utils.classifier_wrapper import get_classifier_wrapper
 from munci.rumerapi.core.config import settings
 from munci.rumerapi.core.logging import setup_logging
+from munci.main_utils.db_pool import close_all_pools
 
 setup_logging()
 
@@ -93,6 +95,8 @@ async def lifespan(app: FastAPI):
     print(" 서비스 정리 중...")
     print("=" * 60)
     services.clear()
+    await get_classifier_wrapper().aclose()
+    close_all_pools()
     print("모든 서비스 정리 완료")
 
 
@@ -131,25 +135,25 @@ def health():
 
 
 @app.post("/rumors/verify", response_model=RumorVerifyResponse)
-def verify_rumor(req: RumorVerifyRequest):
+async def verify_rumor(req: RumorVerifyRequest):
     service = services.get("rumor")
     if service is None:
         raise HTTPException(status_code=503, detail="RumorService not initialized")
 
     try:
-        return service.verify(req)
+        return await service.verify_async(req)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/patterns/analyze", response_model=PatternAnalysisResponse)
-def analyze_pattern(req: PatternAnalysisRequest):
+async def analyze_pattern(req: PatternAnalysisRequest):
     service = services.get("pattern")
     if service is None:
         raise HTTPException(status_code=503, detail="PatternService not initialized")
 
     try:
-        return service.analyze(req)
+        return await service.analyze_async(req)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -309,12 +313,12 @@ def test_extract_companies(text: str):
 
 
 @app.get("/test/classify-event")
-def test_classify_event(text: str):
+async def test_classify_event(text: str):
     classifier = services.get("classifier")
     if classifier is None:
         raise HTTPException(status_code=503, detail="Classifier not initialized")
 
-    unified_result = classify_event(text)
+    unified_result = await classify_event_async(text)
 
     return {
         "input": text,
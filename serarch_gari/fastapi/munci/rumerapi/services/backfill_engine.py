@@ -0,0 +1,167 @@
+from __future__ import annotations
+import os
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# --------------------------- worker (프로세스 단위) ---------------------------
+
+_worker_scanner = None
+
+
+def _init_worker(db_config: dict, z_threshold: float, min_confidence: float):
+    """워커 프로세스당 스캐너 1개 (연결 풀/기대효과 캐시는 프로세스 내에서 재사용)"""
+    global _worker_scanner
+    from munci.rumerapi.services.daily_scanner import DailyGapScanner
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(processName)s - %(levelname)s - %(message)s'
+    )
+    # strict: 조회/저장 실패가 "0개 신호" 로 완료 처리되지 않도록 예외로 받음
+    _worker_scanner = DailyGapScanner(
+        db_config, z_threshold=z_threshold, min_confidence=min_confidence, strict=True
+    )
+
+
+def _scan_partition(start_date: str, end_date: str) -> Tuple[str, str, int]:
+    signals = _worker_scanner.scan_range(start_date, end_date, save=True)
+    return start_date, end_date, len(signals)
+
+
+# --------------------------- engine ---------------------------
+
+class BackfillEngine:
+    """기간 백필 엔진
+
+    - 날짜 구간을 partition_days 단위로 나눠 프로세스 풀에서 병렬 스캔
+    - 파티션마다 뉴스 조회/가격 패널 로드 1회, news_gaps 저장 1회
+    - 완료된 파티션은 체크포인트 파일에 기록 → 재실행 시 건너뜀
+    """
+
+    def __init__(
+        self,
+        db_config: dict,
+        workers: Optional[int] = None,
+        partition_days: int = 7,
+        checkpoint_path: Optional[str] = None,
+        z_threshold: float = 2.0,
+        min_confidence: float = 0.5
+    ):
+        if partition_days < 1:
+            raise ValueError(f"partition_days는 1 이상이어야 합니다: {partition_days}")
+
+        self.db_config = db_config
+        self.workers = workers or max(1, min(4, (os.cpu_count() or 1)))
+        self.partition_days = partition_days
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.z_threshold = z_threshold
+        self.min_confidence = min_confidence
+
+    def run(self, start_date: str, end_date: str) -> int:
+        """백필 실행 후 이번 실행에서 탐지한 신호 수 반환"""
+        partitions = self.partitions(start_date, end_date)
+        done = self._load_checkpoint()
+        pending = [p for p in partitions if self._partition_key(*p) not in done]
+
+        logger.info(
+            f"백필 파티션: 전체 {len(partitions)}개 / 완료 {len(partitions) - len(pending)}개 "
+            f"/ 대기 {len(pending)}개 (workers={self.workers}, {self.partition_days}일 단위)"
+        )
+        if not pending:
+            return 0
+
+        total_signals = 0
+        failed: List[Tuple[str, str]] = []
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(pending)),
+            initializer=_init_worker,
+            initargs=(self.db_config, self.z_threshold, self.min_confidence)
+        ) as executor:
+            futures = {
+                executor.submit(_scan_partition, start, end): (start, end)
+                for start, end in pending
+            }
+
+            for completed, future in enumerate(as_completed(futures), 1):
+                start, end = futures[future]
+                try:
+                    _, _, count = future.result()
+                except Exception as e:
+                    failed.append((start, end))
+                    logger.error(f"파티션 실패 ({start} ~ {end}): {e}")
+                    continue
+
+                total_signals += count
+                done[self._partition_key(start, end)] = count
+                self._save_checkpoint(done)
+                logger.info(
+                    f"[{completed}/{len(pending)}] 파티션 완료 {start} ~ {end}: {count}개 신호"
+                )
+
+        if failed:
+            logger.warning(f"실패 파티션 {len(failed)}개 → 재실행 시 다시 처리: {failed}")
+
+        return total_signals
+
+    def partitions(self, start_date: str, end_date: str) -> List[Tuple[str, str]]:
+        """[start_date, end_date] 를 partition_days 단위 (YYYYMMDD, YYYYMMDD) 구간으로 분할"""
+        start = datetime.strptime(start_date, "%Y%m%d")
+        end = datetime.strptime(end_date, "%Y%m%d")
+
+        parts = []
+        current = start
+        while current <= end:
+            part_end = min(current + timedelta(days=self.partition_days - 1), end)
+            parts.append((current.strftime("%Y%m%d"), part_end.strftime("%Y%m%d")))
+            current = part_end + timedelta(days=1)
+        return parts
+
+    # --------------------------- checkpoint ---------------------------
+
+    def _run_key(self) -> str:
+        # 임계값이 다르면 결과가 달라지므로 다른 실행으로 취급
+        return f"z={self.z_threshold}|conf={self.min_confidence}"
+
+    @staticmethod
+    def _partition_key(start_date: str, end_date: str) -> str:
+        return f"{start_date}-{end_date}"
+
+    def _load_checkpoint(self) -> Dict[str, int]:
+        if not self.checkpoint_path or not self.checkpoint_path.exists():
+            return {}
+
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"체크포인트 읽기 실패 → 처음부터 실행: {e}")
+            return {}
+
+        if data.get("run_key") != self._run_key():
+            logger.info("체크포인트 설정이 달라 무시합니다")
+            return {}
+
+        return dict(data.get("done", {}))
+
+    def _save_checkpoint(self, done: Dict[str, int]):
+        if not self.checkpoint_path:
+            return
+
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_suffix(self.checkpoint_path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "run_key": self._run_key(),
+                "updated_at": datetime.now().isoformat(timespec='seconds'),
+                "done": done
+            }, f, ensure_ascii=False, indent=2)
+        # 중단되더라도 체크포인트 파일이 깨지지 않도록 원자적 교체
+        os.replace(tmp_path, self.checkpoint_path)
@@ -1,18 +1,35 @@
 
 from __future__ import annotations
 from typing import Optional, Dict, List, Tuple
+import os
+import queue
 import pymysql
 import logging
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 from dataclasses import dataclass
 
-from munci.signal_gap.core.event_price_mapper import EventPriceMapper
-from munci.signal_gap.core.return_calculator import ReturnCalculator
+from munci.signal_gap.core.event_price_mapper import EventPriceMapper, AnchorPrice
+from munci.signal_gap.core.return_calculator import ReturnCalculator, ReturnPath
+from munci.signal_gap.core.price_panel import PricePanel
 from munci.lastsa.event_extractor import StockEventLabelClassifier
 from munci.rumerapi.utils.date_utils import to_yyyymmdd, from_db_date
+from munci.main_utils.bulk_writer import event_returns_history_writer
+from munci.main_utils.db_pool import get_pool
 
 logger = logging.getLogger(__name__)
 
+# 분류 단계 동시 작업자 수 / 단계 간 대기열 크기
+HISTORY_CLASSIFY_WORKERS = int(os.getenv("HISTORY_CLASSIFY_WORKERS", "4"))
+HISTORY_QUEUE_SIZE = int(os.getenv("HISTORY_QUEUE_SIZE", "200"))
+# 배치 가격 패널 로드 구간: 마지막 이벤트일 + N일 (앵커 + 5거래일 여유)
+# 거래정지 등으로 이 구간에 앵커가 없으면 mapper 단건 조회로 다시 찾는다
+RETURN_LOOKAHEAD_DAYS = 20
+# 결과 대기 간격 (분류 작업자 생존 확인 주기)
+HISTORY_POLL_SECONDS = 1.0
+
+_DONE = object()  # 단계 종료 표시
+
 
 @dataclass
 class ProcessingStats:
@@ -25,6 +42,8 @@ class ProcessingStats:
     no_stock_code_count: int = 0
     no_anchor_count: int = 0
     no_return_count: int = 0
+    save_failed_count: int = 0
+    return_failed_count: int = 0
 
 
 class EventReturnsHistoryBuilder:
@@ -36,8 +55,12 @@ class EventReturnsHistoryBuilder:
         self.classifier = None
         self.mapper = None
         self.calculator = None
-        self.conn = None
+        self.pool = None
         self.stats = ProcessingStats()
+        self.writer = event_returns_history_writer()
+        self._pending: List[Tuple] = []
+        self.stock_code_map: Optional[Dict[str, str]] = None
+        self._stats_lock = threading.Lock()
 
     def initialize_components(self):
         """구성 요소 초기화"""
@@ -48,18 +71,14 @@ class EventReturnsHistoryBuilder:
             logger.error(f"AI 분류기 초기화 실패: {e}")
             raise
 
-        self.mapper = EventPriceMapper(self.db_config)
-        self.calculator = ReturnCalculator(self.db_config)
-        self.conn = pymysql.connect(**self.db_config)
-
-    def cleanup(self):
-        """리소스 정리"""
-        if self.conn:
-            self.conn.close()
+        # 조회/저장마다 공유 풀에서 연결을 빌려 씀 (장시간 점유하지 않아 작은 풀에서도 교착 없음)
+        self.pool = get_pool(self.db_config)
+        self.mapper = EventPriceMapper(self.db_config, pool=self.pool)
+        self.calculator = ReturnCalculator(self.db_config, pool=self.pool)
 
     def fetch_events(self, start_date: str, end_date: str) -> List[Dict]:
 
-        with self.conn.cursor(pymysql.cursors.DictCursor) as cursor:
+        with self.pool.connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
             sql = """
                   SELECT corp_code,
                          rcept_dt as event_date,
@@ -84,7 +103,7 @@ class EventReturnsHistoryBuilder:
 
         # summary 체크
         if not event.get('summary'):
-            self.stats.no_summary_count += 1
+            self._count('no_summary_count')
             logger.debug(f"Summary 없음: {event['corp_name']} - {event['report_nm']}")
             return None
 
@@ -96,7 +115,7 @@ class EventReturnsHistoryBuilder:
 
             # 분류 결과 확인
             if not result.labels or result.labels[0] == "other":
-                self.stats.ai_other_count += 1
+                self._count('ai_other_count')
                 logger.debug(
                     f"AI 분류 불가(other): {event['corp_name']} - "
                     f"신뢰도: {result.confidence:.2f}"
@@ -104,7 +123,7 @@ class EventReturnsHistoryBuilder:
                 return None
 
             event_code = result.labels[0]
-            self.stats.ai_classified_count += 1
+            self._count('ai_classified_count')
 
             logger.debug(
                 f"AI 분류: {event['corp_name']} - "
@@ -117,9 +136,34 @@ class EventReturnsHistoryBuilder:
             logger.error(f"AI 분류 실패: {event['corp_name']} - {e}")
             return None
 
+    def _count(self, field_name: str, n: int = 1):
+        # 분류 작업자 스레드에서도 갱신되므로 락 안에서 증가
+        with self._stats_lock:
+            setattr(self.stats, field_name, getattr(self.stats, field_name) + n)
+
+    def load_stock_code_map(self) -> Dict[str, str]:
+        """stock_list 전체 corp_code → stock_code (행마다 SELECT 하지 않도록 1회 로드)"""
+        with self.pool.connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute(
+                "SELECT corp_code, stock_code FROM stock_list "
+                "WHERE corp_code IS NOT NULL AND stock_code IS NOT NULL"
+            )
+            rows = cursor.fetchall()
+
+        self.stock_code_map = {row['corp_code']: row['stock_code'] for row in rows}
+        logger.info(f"종목코드 매핑 로드: {len(self.stock_code_map)}건")
+        return self.stock_code_map
+
     def get_stock_code(self, corp_code: str) -> Optional[str]:
 
-        with self.conn.cursor(pymysql.cursors.DictCursor) as cursor:
+        if self.stock_code_map is not None:
+            stock_code = self.stock_code_map.get(corp_code)
+            if not stock_code:
+                self._count('no_stock_code_count')
+                logger.debug(f"종목코드 없음: {corp_code}")
+            return stock_code
+
+        with self.pool.connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
             cursor.execute(
                 "SELECT stock_code FROM stock_list WHERE corp_code = %s",
                 (corp_code,)
@@ -127,7 +171,7 @@ class EventReturnsHistoryBuilder:
             row = cursor.fetchone()
 
         if not row:
-            self.stats.no_stock_code_count += 1
+            self._count('no_stock_code_count')
             logger.debug(f"종목코드 없음: {corp_code}")
             return None
 
@@ -160,45 +204,45 @@ class EventReturnsHistoryBuilder:
 
     def save_to_database(self, stock_code: str, event_date: str,
                         event_code: str, anchor, returns) -> bool:
-
-
+        """저장 대기열에 추가 (flush_pending 에서 일괄 저장)"""
+        self._pending.append((
+            stock_code,
+            event_date,  # YYYYMMDD 그대로 사용
+            event_code,
+            anchor.anchor_date,
+            anchor.anchor_close,
+            returns.horizons.get(1),
+            returns.horizons.get(3),
+            returns.horizons.get(5),
+            anchor.volume,
+            anchor.market_cap,
+            datetime.now()
+        ))
+        return True
+
+    def flush_pending(self):
+        """대기 중인 행 일괄 저장"""
+        if not self._pending:
+            return
+
+        rows, self._pending = self._pending, []
         try:
-            with self.conn.cursor() as cursor:
-                insert_sql = """
-                    INSERT INTO event_returns_history
-                    (stock_code, event_date, event_code, anchor_date,
-                     anchor_price, return_1d, return_3d, return_5d,
-                     volume, market_cap, created_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
-                    ON DUPLICATE KEY UPDATE
-                        anchor_date = VALUES(anchor_date),
-                        anchor_price = VALUES(anchor_price),
-                        return_1d = VALUES(return_1d),
-                        return_3d = VALUES(return_3d),
-                        return_5d = VALUES(return_5d),
-                        volume = VALUES(volume),
-                        market_cap = VALUES(market_cap),
-                        updated_at = NOW()
-                """
-                cursor.execute(insert_sql, (
-                    stock_code,
-                    event_date,  # YYYYMMDD 그대로 사용
-                    event_code,
-                    anchor.anchor_date,
-                    anchor.anchor_close,
-                    returns.horizons.get(1),
-                    returns.horizons.get(3),
-                    returns.horizons.get(5),
-                    anchor.volume,
-                    anchor.market_cap
-                ))
-
-            self.stats.total_saved += 1
-            return True
-
+            with self.pool.connection() as conn:
+                result = self.writer.write(conn, rows)
+            self.stats.total_saved += result.rows
+            return
         except Exception as e:
-            logger.error(f"DB 저장 실패: {e}")
-            return False
+            logger.warning(f"일괄 저장 실패 ({len(rows)}건) → 행 단위 재시도: {e}")
+
+        # 청크 하나가 실패해도 나머지 행은 살림 (upsert 라 이미 커밋된 행을 다시 써도 무해)
+        for row in rows:
+            try:
+                with self.pool.connection() as conn:
+                    self.writer.write(conn, [row])
+                self.stats.total_saved += 1
+            except Exception as e:
+                self.stats.save_failed_count += 1
+                logger.error(f"DB 저장 실패 ({row[0]} @ {row[1]}, {row[2]}): {e}")
 
     def process_single_event(self, event: Dict) -> bool:
 
@@ -248,6 +292,10 @@ class EventReturnsHistoryBuilder:
         logger.info(" AI 기반 수익률 DB 구축 완료")
         logger.info(f"   - 전체 처리: {stats.total_processed}건")
         logger.info(f"   - 저장 완료: {stats.total_saved}건")
+        if stats.save_failed_count:
+            logger.info(f"   - 저장 실패: {stats.save_failed_count}건")
+        if stats.return_failed_count:
+            logger.info(f"   - 수익률 조회 실패: {stats.return_failed_count}건")
 
         if stats.total_processed > 0:
             save_rate = stats.total_saved / stats.total_processed * 100
@@ -263,6 +311,11 @@ class EventReturnsHistoryBuilder:
             success_rate = stats.ai_classified_count / (stats.ai_classified_count + stats.ai_other_count) * 100
             logger.info(f"   - AI 분류 성공률: {success_rate:.1f}%")
 
+        if self.classifier is not None and hasattr(self.classifier, "get_tier_stats"):
+            tiers = self.classifier.get_tier_stats()
+            logger.info(f"   - 분류 계층({tiers['mode']}): " + ", ".join(
+                f"{k} {tiers['counts'][k]}건({v:.1%})" for k, v in tiers["rates"].items()))
+
         logger.info("")
         logger.info(" 스킵 사유:")
         logger.info(f"   - Summary 없음: {stats.no_summary_count}건")
@@ -272,66 +325,228 @@ class EventReturnsHistoryBuilder:
         logger.info(f"   - 수익률 계산 불가: {stats.no_return_count}건")
         logger.info("=" * 60)
 
-    def build(self, start_date: str, end_date: str, batch_size: int = 10):
-
-        logger.info(f"AI 기반 수익률 DB 구축 시작: {start_date} ~ {end_date}")
-
+    # --------------------------- 파이프라인 ---------------------------
+
+    def _prepare_jobs(self, events: List[Dict]) -> List[Tuple[Dict, str]]:
+        """LLM 호출 전에 걸러낼 수 있는 이벤트(Summary/종목코드 없음) 제외"""
+        if self.stock_code_map is None:
+            self.load_stock_code_map()
+
+        jobs: List[Tuple[Dict, str]] = []
+        for event in events:
+            if not event.get('summary'):
+                self._count('no_summary_count')
+                continue
+            stock_code = self.stock_code_map.get(event['corp_code'])
+            if not stock_code:
+                self._count('no_stock_code_count')
+                continue
+            jobs.append((event, stock_code))
+
+        logger.info(f"분류 대상: {len(jobs)}/{len(events)}건")
+        return jobs
+
+    @staticmethod
+    def _put(q: queue.Queue, item, stop: threading.Event) -> bool:
+        # 대기열이 가득 차면 기다리되, 중단 신호가 오면 포기
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _feed(self, jobs: List[Tuple[Dict, str]], in_q: queue.Queue,
+              workers: int, stop: threading.Event):
+        for job in jobs:
+            if not self._put(in_q, job, stop):
+                return
+        for _ in range(workers):
+            self._put(in_q, _DONE, stop)
+
+    def _classify_worker(self, in_q: queue.Queue, out_q: queue.Queue, stop: threading.Event):
+        while not stop.is_set():
+            try:
+                job = in_q.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if job is _DONE:
+                break
+
+            event, stock_code = job
+            event_code = self.classify_event(event)
+            if not self._put(out_q, (event, stock_code, event_code), stop):
+                return
+
+        self._put(out_q, _DONE, stop)
+
+    def _run_pipeline(self, jobs: List[Tuple[Dict, str]], batch_size: int,
+                      workers: int, queue_size: int):
+        """분류(작업자 N개) → 수익률 계산/저장(메인 스레드) 단계 파이프라인
+
+        단계 사이 대기열은 크기 제한이 있어 저장이 밀리면 분류도 멈춘다.
+        """
+        in_q: queue.Queue = queue.Queue(maxsize=queue_size)
+        out_q: queue.Queue = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+
+        threads = [threading.Thread(target=self._feed, args=(jobs, in_q, workers, stop),
+                                    name="history-feeder", daemon=True)]
+        threads += [
+            threading.Thread(target=self._classify_worker, args=(in_q, out_q, stop),
+                             name=f"history-classify-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for t in threads:
+            t.start()
+
+        classifiers = threads[1:]
+        batch: List[Tuple[Dict, str, str]] = []
+        done = 0
+        idx = 0
         try:
-            # 초기화
-            self.initialize_components()
+            while done < workers:
+                try:
+                    item = out_q.get(timeout=HISTORY_POLL_SECONDS)
+                except queue.Empty:
+                    # 작업자가 예외로 죽으면 _DONE 이 오지 않으므로 생존 여부로 종료 판단
+                    if not any(t.is_alive() for t in classifiers) and out_q.empty():
+                        logger.error(f"분류 작업자 비정상 종료: {workers - done}/{workers}개, "
+                                     f"{idx}/{len(jobs)}건까지 처리")
+                        break
+                    continue
+                if item is _DONE:
+                    done += 1
+                    continue
 
-            # 이벤트 조회
-            events = self.fetch_events(start_date, end_date)
+                idx += 1
+                self.log_progress(idx, len(jobs))
 
-            # 각 이벤트 처리
-            for idx, event in enumerate(events, 1):
-                self.stats.total_processed += 1
+                event, stock_code, event_code = item
+                if not event_code:
+                    continue
+                batch.append((event, stock_code, event_code))
+                if len(batch) >= batch_size:
+                    self._process_return_batch(batch)
+                    batch = []
 
-                # 진행 상황 로그
-                self.log_progress(idx, len(events))
+            self._process_return_batch(batch)
+        finally:
+            stop.set()
+            for t in threads:
+                t.join(timeout=5)
 
-                try:
-                    # 단일 이벤트 처리
-                    self.process_single_event(event)
+    def _process_return_batch(self, batch: List[Tuple[Dict, str, str]]):
+        """분류된 이벤트 묶음의 앵커/수익률을 가격 패널 한 번으로 계산해 저장"""
+        if not batch:
+            return
 
-                    # 배치 커밋
-                    # 배치 커밋 (저장 성공한 건수 기준)
-                    if self.stats.total_saved > 0 and self.stats.total_saved % batch_size == 0:
-                        self.conn.commit()
-                        logger.info(f"DB 커밋: {self.stats.total_saved}건 저장됨")
+        try:
+            event_dates = [event['event_date'] for event, _, _ in batch]
+            end = datetime.strptime(max(event_dates), '%Y%m%d') + timedelta(days=RETURN_LOOKAHEAD_DAYS)
+            panel = PricePanel.from_db_config(
+                self.db_config,
+                {stock_code for _, stock_code, _ in batch},
+                min(event_dates),
+                end.strftime('%Y%m%d')
+            )
+            results = panel.batch_anchor_returns(
+                [(stock_code, event['event_date']) for event, stock_code, _ in batch],
+                horizons=[1, 3, 5]
+            )
+        except Exception as e:
+            # 분류까지 끝난 이벤트를 버리지 않도록 묶음 전체를 단건 경로로 처리
+            logger.error(f"수익률 일괄 계산 실패 ({len(batch)}건) → 단건 조회로 대체: {e}")
+            results = [None] * len(batch)
 
+        for (event, stock_code, event_code), found in zip(batch, results):
+            if not found:
+                # 패널 구간 밖 앵커 (장기 거래정지 등) 나 패널 실패는 기존 단건 경로로 조회
+                try:
+                    fallback = self.calculate_returns(stock_code, event['event_date'])
                 except Exception as e:
-                    logger.error(
-                        f"이벤트 처리 실패: {event.get('corp_name', 'Unknown')} "
-                        f"@ {event.get('event_date', 'Unknown')}: {e}"
-                    )
+                    self.stats.return_failed_count += 1
+                    logger.error(f"수익률 단건 조회 실패: {stock_code} @ {event['event_date']}: {e}")
                     continue
+                if fallback:
+                    self.save_to_database(stock_code, event['event_date'], event_code, *fallback)
+                continue
+
+            anchor_date, anchor_close, horizons = found
+            if all(v is None for v in horizons.values()):
+                self.stats.no_return_count += 1
+                logger.debug(f"수익률 없음: {stock_code}")
+                continue
+
+            anchor = AnchorPrice(
+                stock_code=stock_code,
+                event_date=event['event_date'],
+                anchor_date=anchor_date,
+                anchor_close=anchor_close,
+                volume=0,
+            )
+            returns = ReturnPath(
+                stock_code=stock_code,
+                anchor_date=anchor_date,
+                anchor_price=anchor_close,
+                horizons=horizons,
+            )
+            self.save_to_database(stock_code, event['event_date'], event_code, anchor, returns)
+
+        self.flush_pending()
+        logger.info(f"DB 저장: {self.stats.total_saved}건 저장됨")
+
+    def build(self, start_date: str, end_date: str, batch_size: int = 500,
+              workers: Optional[int] = None, queue_size: Optional[int] = None):
 
-            # 최종 커밋
-            self.conn.commit()
+        logger.info(f"AI 기반 수익률 DB 구축 시작: {start_date} ~ {end_date}")
+
+        try:
+            # 초기화
+            self.initialize_components()
+
+            # 이벤트 조회
+            events = self.fetch_events(start_date, end_date)
+            self.stats.total_processed = len(events)
+
+            # 종목코드 선조회 → 분류 대상만 파이프라인 투입
+            jobs = self._prepare_jobs(events)
+            self._run_pipeline(
+                jobs,
+                batch_size=max(1, batch_size),
+                workers=max(1, workers or HISTORY_CLASSIFY_WORKERS),
+                queue_size=max(1, queue_size or HISTORY_QUEUE_SIZE)
+            )
+
+            # 남은 대기열 저장
+            self.flush_pending()
 
             # 통계 출력
             self.log_final_stats()
 
         except Exception as e:
+            # 미커밋 트랜잭션은 풀 반납 시 롤백됨
             logger.error(f"배치 작업 실패: {e}", exc_info=True)
-            if self.conn:
-                self.conn.rollback()
             raise
 
-        finally:
-            self.cleanup()
-
 
 def build_event_returns_history(
     db_config: dict,
     start_date: str = "20200101",
     end_date: str = "20241231",
-    batch_size: int = 10
+    batch_size: int = 500,
+    refresh_stats: bool = True,
+    workers: Optional[int] = None
 ):
 
     builder = EventReturnsHistoryBuilder(db_config)
-    builder.build(start_date, end_date, batch_size)
+    builder.build(start_date, end_date, batch_size, workers=workers)
+
+    # 새로 적재된 이력을 기대효과 사전 집계에 반영 (변경된 이벤트만)
+    if refresh_stats and builder.stats.total_saved > 0:
+        from munci.signal_gap.models.expectation_refresh import refresh_expectation_stats
+        refresh_expectation_stats(db_config)
 
 
 if __name__ == "__main__":
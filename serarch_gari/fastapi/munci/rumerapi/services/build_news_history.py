@@ -1,20 +1,103 @@
 from __future__ import annotations
 import pymysql
-from datetime import datetime, timedelta
+from contextlib import ExitStack
+from datetime import date, datetime, timedelta
 import math
 import logging
-import json
-from pathlib import Path
+from typing import Optional
 
 from munci.rumerapi.core.config import settings
+from munci.main_utils.db_pool import ConnectionPool, get_pool
+from munci.main_utils.alias_index import get_alias_index
+from munci.main_utils.bulk_writer import news_gaps_writer, news_returns_writer
+from munci.signal_gap.core.price_panel import PricePanel
 
 logger = logging.getLogger(__name__)
 
 
+def _to_date(value) -> Optional[date]:
+    """DB 값 → date 객체 (YYYY-MM-DD / YYYYMMDD 문자열, datetime 허용)"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        if len(value) == 10:  # YYYY-MM-DD
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        if len(value) == 8:  # YYYYMMDD
+            return datetime.strptime(value, '%Y%m%d').date()
+    return None
+
+
+class SlidingPriceWindow:
+    """날짜순 순회용 가격 윈도우
+
+    - 현재 뉴스일 이후 lookahead_days 까지 필요한 가격만 메모리에 유지
+    - 부족해지면 chunk_days 만큼 앞으로 추가 로드, 지난 날짜/빈 종목은 제거
+    - 종목별 (거래일, 종가) 배열은 PricePanel 로 보관 (앵커는 이진 탐색)
+    """
+
+    DEFAULT_CHUNK_DAYS = 30
+
+    def __init__(self, conn, lookahead_days: int = 20, chunk_days: int = DEFAULT_CHUNK_DAYS):
+        self.conn = conn
+        # 앵커 + 5거래일 (연휴 여유 포함)
+        self.lookahead_days = lookahead_days
+        self.chunk_days = max(1, chunk_days)
+        self.cache = PricePanel()
+        self.current: Optional[date] = None
+        self.loaded_until: Optional[date] = None
+
+    def advance(self, news_date) -> PricePanel:
+        """news_date 기준으로 윈도우 이동 후 캐시 반환"""
+        news_date = _to_date(news_date)
+        if news_date is None or (self.current is not None and news_date <= self.current):
+            return self.cache
+
+        self.current = news_date
+        self._evict_before(news_date)
+
+        need_until = news_date + timedelta(days=self.lookahead_days)
+        if self.loaded_until is None or need_until > self.loaded_until:
+            # 뉴스 공백으로 건너뛴 구간은 로드하지 않음
+            load_from = news_date if self.loaded_until is None else max(
+                news_date, self.loaded_until + timedelta(days=1)
+            )
+            load_to = need_until + timedelta(days=self.chunk_days)
+            self._load(load_from, load_to)
+            self.loaded_until = load_to
+
+        return self.cache
+
+    def size(self) -> int:
+        return self.cache.row_count()
+
+    def _evict_before(self, cutoff: date):
+        self.cache.evict_before(cutoff)
+
+    def _load(self, start_date: date, end_date: date):
+        with self.conn.cursor() as cursor:
+            cursor.execute("""
+                           SELECT stock_code, trade_date, close_price
+                           FROM stock_daily_prices
+                           WHERE trade_date BETWEEN %s AND %s
+                           ORDER BY stock_code, trade_date
+                           """, (start_date, end_date))
+            rows = cursor.fetchall()
+
+        self.cache.append_rows(rows, end_date)
+        logger.info(f"가격 윈도우 로드: {start_date} ~ {end_date}, {len(rows)}행 (종목 {len(self.cache)}개)")
+
+
 class NewsGapScanner:
     """뉴스 괴리 스캐너"""
 
-    def __init__(self, z_threshold: float = 2.0, min_samples: int = 10):
+    def __init__(
+        self,
+        z_threshold: float = 2.0,
+        min_samples: int = 10,
+        pool: Optional[ConnectionPool] = None
+    ):
         self.z_threshold = z_threshold
         self.min_samples = min_samples
 
@@ -34,56 +117,43 @@ class NewsGapScanner:
             self.db_config = None
             logger.warning("DB 설정 없음 - Gap 스캔 불가")
 
-    def _load_stock_code_map(self) -> dict:
-        """normalized_aliases.json에서 종목명 -> 종목코드 매핑 로드"""
-        project_root = Path(__file__).parent.parent.parent.parent
-        json_path = project_root / "examples" / "normalized_aliases.json"
-
-        logger.info(f"종목코드 매핑 파일 경로: {json_path}")
-        logger.info(f"파일 존재 여부: {json_path.exists()}")
+        self.pool = pool or (get_pool(self.db_config) if self.db_config else None)
 
-        if not json_path.exists():
-            logger.warning(f"종목코드 매핑 파일 없음: {json_path}")
+    def _load_stock_code_map(self) -> dict:
+        """normalized_aliases.json 종목명 -> 종목코드 매핑 (공유 별칭 인덱스)"""
+        index = get_alias_index()
+        if index is None:
             return {}
 
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        stock_map = {}
-        for main_name, aliases in data.items():
-            if not aliases or len(aliases) == 0:
-                continue
-
-            stock_code = None
-            for alias in aliases:
-                if alias.isdigit():
-                    stock_code = alias
-                    break
-
-            if not stock_code:
-                continue
-
-            stock_map[main_name] = stock_code
-
-            for alias in aliases:
-                if not alias.isdigit():
-                    stock_map[alias] = stock_code
-
-        logger.info(f"종목코드 매핑 로드 완료: {len(stock_map)}개")
-        return stock_map
-
-    def build_history(self, start_date: str, end_date: str, batch_size: int = 1000):
-        """과거 뉴스의 수익률 이력 구축"""
+        logger.info(f"종목코드 매핑 로드 완료: {len(index.name_to_code)}개")
+        return index.name_to_code
+
+    def build_history(
+        self,
+        start_date: str,
+        end_date: str,
+        batch_size: int = 1000,
+        stream: bool = True
+    ):
+        """과거 뉴스의 수익률 이력 구축
+
+        stream=True: 날짜순 SSDictCursor + 슬라이딩 가격 윈도우 (기간과 무관하게 메모리 일정)
+        stream=False: 뉴스/가격을 한 번에 적재 (짧은 기간용)
+        """
         if not self.db_config:
             raise ValueError("DB 설정이 필요합니다")
 
         logger.info(f"{'=' * 60}")
-        logger.info(f"뉴스 수익률 DB 구축: {start_date} ~ {end_date}")
+        logger.info(f"뉴스 수익률 DB 구축: {start_date} ~ {end_date} (stream={stream})")
         logger.info(f"{'=' * 60}")
 
-        conn = pymysql.connect(**self.db_config)
-
+        # 공유 풀에서 대여 (반납 시 미커밋 트랜잭션은 롤백)
+        stack = ExitStack()
         try:
+            conn = stack.enter_context(self.pool.connection())
+            # 스트리밍 커서는 결과를 다 읽을 때까지 연결을 점유 → 가격 조회/저장은 별도 연결 사용
+            news_conn = stack.enter_context(self.pool.connection()) if stream else conn
+
             # 테이블 및 스키마 확인
             with conn.cursor() as cursor:
                 cursor.execute("SHOW TABLES LIKE 'news_returns'")
@@ -109,36 +179,18 @@ class NewsGapScanner:
             start_date_obj = datetime.strptime(start_date, '%Y%m%d').date()
             end_date_obj = datetime.strptime(end_date, '%Y%m%d').date()
 
-            # 뉴스 조회
-            with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute("""
-                               SELECT url        as news_id,
-                                      stock_name as companies,
-                                      event_code as event_code,
-                                      date       as news_date
-                               FROM comprehensive_analyzed_news
-                               WHERE date BETWEEN %s AND %s
-                                 AND stock_name IS NOT NULL
-                                 AND event_code IS NOT NULL
-                               """, (start_date_obj, end_date_obj))
-
-                news_list = cursor.fetchall()
-                logger.info(f"뉴스 {len(news_list)}건 발견")
-
-                if not news_list:
-                    logger.warning("조건에 맞는 뉴스가 없습니다!")
-                    return
-
-            # 가격 데이터 캐싱
-            logger.info("가격 데이터 로딩 중...")
-            price_cache = self._load_price_cache(conn, start_date_obj, end_date_obj)
-            logger.info(f" 가격 캐시 로드 완료: {len(price_cache)}개 종목")
+            # 가격 윈도우 (비스트리밍이면 전체 기간을 한 번에 로드)
+            chunk_days = (
+                SlidingPriceWindow.DEFAULT_CHUNK_DAYS if stream
+                else (end_date_obj - start_date_obj).days
+            )
+            price_window = SlidingPriceWindow(conn, chunk_days=chunk_days)
 
             saved = 0
             processed = 0
             batch_data = []
 
-            for news in news_list:
+            for news in self._iter_news(news_conn, start_date_obj, end_date_obj, stream):
                 processed += 1
 
                 try:
@@ -157,6 +209,9 @@ class NewsGapScanner:
                     if not event_list:
                         continue
 
+                    # 날짜순 순회 → 지난 날짜 제거 / 필요한 구간 선로드
+                    price_cache = price_window.advance(news_date)
+
                     for company_name in company_list:
                         stock_code = self.stock_code_map.get(company_name)
                         if not stock_code:
@@ -179,7 +234,14 @@ class NewsGapScanner:
                 if len(batch_data) >= batch_size:
                     self._batch_insert(conn, batch_data)
                     batch_data = []
-                    logger.info(f"진행: {processed}/{len(news_list)}건 처리, {saved}건 저장")
+                    logger.info(
+                        f"진행: {processed}건 처리, {saved}건 저장 "
+                        f"(가격 윈도우 {price_window.size()}행)"
+                    )
+
+            if processed == 0:
+                logger.warning("조건에 맞는 뉴스가 없습니다!")
+                return
 
             # 남은 데이터 저장
             if batch_data:
@@ -192,103 +254,54 @@ class NewsGapScanner:
 
         except Exception as e:
             logger.exception(f" build_history 실패: {e}")
-            conn.rollback()
             raise
         finally:
-            conn.close()
+            stack.close()
 
-    def _load_price_cache(self, conn, start_date, end_date) -> dict:
-        """가격 데이터를 메모리에 캐싱 (date 객체 사용)"""
-        cache = {}
+    def _iter_news(self, conn, start_date, end_date, stream: bool):
+        """기간 뉴스를 날짜순으로 순회 (stream=True 면 서버 측 커서로 한 행씩)"""
+        cursor_class = pymysql.cursors.SSDictCursor if stream else pymysql.cursors.DictCursor
+
+        with conn.cursor(cursor_class) as cursor:
+            if stream:
+                # 처리 중 읽기가 멈춰 있어도 서버가 연결을 끊지 않도록
+                cursor.execute("SET SESSION net_write_timeout = 3600")
 
-        with conn.cursor(pymysql.cursors.DictCursor) as cursor:
             cursor.execute("""
-                           SELECT stock_code, trade_date, close_price
-                           FROM stock_daily_prices
-                           WHERE trade_date BETWEEN DATE_SUB(%s, INTERVAL 5 DAY)
-                                     AND DATE_ADD(%s, INTERVAL 5 DAY)
-                           ORDER BY stock_code, trade_date
+                           SELECT url        as news_id,
+                                  stock_name as companies,
+                                  event_code as event_code,
+                                  date       as news_date
+                           FROM comprehensive_analyzed_news
+                           WHERE date BETWEEN %s AND %s
+                             AND stock_name IS NOT NULL
+                             AND event_code IS NOT NULL
+                           ORDER BY date
                            """, (start_date, end_date))
 
-            for row in cursor:
-                stock_code = row['stock_code']
-                date = row['trade_date']
-                
-                # trade_date를 date 객체로 변환 (안전 장치)
-                if isinstance(date, str):
-                    if len(date) == 10:  # YYYY-MM-DD
-                        date = datetime.strptime(date, '%Y-%m-%d').date()
-                    elif len(date) == 8:  # YYYYMMDD
-                        date = datetime.strptime(date, '%Y%m%d').date()
-                    else:
-                        continue
-                elif isinstance(date, datetime):
-                    date = date.date()
-                # 이미 date 객체면 그대로 사용
-                
-                price = float(row['close_price'])
-
-                if stock_code not in cache:
-                    cache[stock_code] = []
-                cache[stock_code].append((date, price))
-
-        return cache
-
-    def _calculate_return(self, stock_code: str, news_date, price_cache: dict) -> dict | None:
-        """캐시된 데이터로 수익률 계산 (date 객체 사용)"""
-        if stock_code not in price_cache:
-            return None
-
-        prices = price_cache[stock_code]
+            if not stream:
+                logger.info(f"뉴스 {cursor.rowcount}건 발견")
 
-        # news_date를 date 객체로 변환 (안전 장치)
-        if isinstance(news_date, str):
-            if len(news_date) == 10:  # YYYY-MM-DD
-                news_date = datetime.strptime(news_date, '%Y-%m-%d').date()
-            elif len(news_date) == 8:  # YYYYMMDD
-                news_date = datetime.strptime(news_date, '%Y%m%d').date()
-            else:
-                return None
-        elif isinstance(news_date, datetime):
-            news_date = news_date.date()
-        # 이미 date 객체면 그대로 사용
+            for row in cursor:
+                yield row
 
+    def _calculate_return(self, stock_code: str, news_date, price_cache: PricePanel) -> dict | None:
+        """캐시된 가격 배열로 수익률 계산 (앵커 이진 탐색, horizon 일괄 계산)"""
         # 앵커 가격 찾기 (뉴스 날짜 이후 첫 거래일)
-        anchor_idx = None
-        for idx, (date, price) in enumerate(prices):
-            if date >= news_date:
-                anchor_idx = idx
-                break
-
-        if anchor_idx is None:
+        anchor = price_cache.get_anchor(stock_code, news_date)
+        if anchor is None:
             return None
 
-        anchor_date, anchor_price = prices[anchor_idx]
+        anchor_date, anchor_price = anchor
 
-        # 1일 후 = 앵커 다음 거래일
-        # 3일 후 = 앵커로부터 3거래일 후
-        # 5일 후 = 앵커로부터 5거래일 후
-        r1 = None
-        r3 = None
-        r5 = None
-
-        if anchor_idx + 1 < len(prices):
-            price_1d = prices[anchor_idx + 1][1]
-            r1 = math.log(price_1d / anchor_price)
-
-        if anchor_idx + 3 < len(prices):
-            price_3d = prices[anchor_idx + 3][1]
-            r3 = math.log(price_3d / anchor_price)
-
-        if anchor_idx + 5 < len(prices):
-            price_5d = prices[anchor_idx + 5][1]
-            r5 = math.log(price_5d / anchor_price)
+        # 1/3/5일 후 = 앵커로부터 1/3/5거래일 후
+        returns = price_cache.forward_returns(stock_code, anchor_date, anchor_price, [1, 3, 5])
 
         return {
             'anchor_price': anchor_price,
-            'r1': r1,
-            'r3': r3,
-            'r5': r5
+            'r1': returns[1],
+            'r3': returns[3],
+            'r5': returns[5]
         }
 
     def _batch_insert(self, conn, batch_data: list):
@@ -296,17 +309,7 @@ class NewsGapScanner:
         if not batch_data:
             return
 
-        with conn.cursor() as cursor:
-            cursor.executemany("""
-                               INSERT INTO news_returns
-                               (news_id, stock_code, stock_name, event_code, news_date, anchor_price, return_1d, return_3d, return_5d)
-                               VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s) ON DUPLICATE KEY
-                               UPDATE
-                                   return_1d = VALUES(return_1d), 
-                                   return_3d = VALUES(return_3d),
-                                   return_5d = VALUES(return_5d)
-                               """, batch_data)
-        conn.commit()
+        news_returns_writer().write(conn, batch_data)
 
     def scan_recent(self, hours: int = 48):
         """최근 N시간 뉴스의 괴리 탐지"""
@@ -321,10 +324,9 @@ class NewsGapScanner:
         start = now - timedelta(hours=hours)
         start_date = start.date()  # date 객체로 변환
 
-        conn = pymysql.connect(**self.db_config)
         gaps = []
 
-        try:
+        with self.pool.connection() as conn:
             with conn.cursor(pymysql.cursors.DictCursor) as cursor:
                 cursor.execute("""
                                SELECT url        as news_id,
@@ -383,9 +385,6 @@ class NewsGapScanner:
             logger.info(f"✅ {len(gaps)}개 괴리 신호 탐지")
             logger.info(f"{'=' * 60}")
 
-        finally:
-            conn.close()
-
         return gaps
 
     def _detect_gap(
@@ -497,29 +496,9 @@ class NewsGapScanner:
         if not gaps:
             return
 
-        with conn.cursor() as cursor:
-            for g in gaps:
-                cursor.execute("""
-                               INSERT INTO news_gaps
-                               (news_id, news_title, stock_code, stock_name, event_code,
-                                news_date, horizon, actual_return, expected_return, expected_std,
-                                z_score, direction, magnitude, sample_count)
-                               VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) ON DUPLICATE KEY
-                               UPDATE
-                                   z_score =
-                               VALUES (z_score), direction =
-                               VALUES (direction), magnitude =
-                               VALUES (magnitude)
-                               """, (
-                                   g['news_id'], g['news_title'], g['stock_code'], g['stock_name'],
-                                   g['event_code'], g['news_date'], g['horizon'],
-                                   g['actual_return'], g['expected_return'], g['expected_std'],
-                                   g['z_score'], g['direction'], g['magnitude'], g['sample_count']
-                               ))
-
-        conn.commit()
-        logger.info(f"DB 저장 완료: {len(gaps)}건")
-
+        # 이 경로는 calc_mode 를 계산하지 않으므로 기존 값을 덮어쓰지 않음
+        result = news_gaps_writer(conn, with_calc_mode=False).write_dicts(conn, gaps)
+        logger.info(f"DB 저장 완료: {result.rows}건")
 
 if __name__ == "__main__":
     logging.basicConfig(
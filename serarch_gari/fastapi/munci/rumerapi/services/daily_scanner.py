@@ -12,10 +12,11 @@ from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 import pymysql
 import logging
-import math
-import json
 
 from munci.rumerapi.utils.date_utils import to_yyyymmdd, to_db_date, from_db_date
+from munci.main_utils.db_pool import ConnectionPool, get_pool
+from munci.main_utils.alias_index import get_alias_index
+from munci.main_utils.bulk_writer import news_gaps_writer
 
 logger = logging.getLogger(__name__)
 
@@ -23,18 +24,25 @@ logger = logging.getLogger(__name__)
 class DailyGapScanner:
     """일일 괴리 스캐너 (뉴스 테이블을 읽되, 공시형 계산 경로 사용)"""
 
+    # 가격 패널 로드 구간: 스캔일 ~ 스캔일 + N일 (최대 horizon + 휴장일 여유)
+    PRICE_PANEL_LOOKAHEAD_DAYS = 30
+
     def __init__(
         self,
         db_config: dict,
         z_threshold: float = 2.0,        # 기본 2.0
         min_samples: int = 10,           # 간단 계산용 최소 샘플 수
-        min_confidence: float = 0.5      # 히스토리 계산용 최소 신뢰도
+        min_confidence: float = 0.5,     # 히스토리 계산용 최소 신뢰도
+        pool: Optional[ConnectionPool] = None,
+        strict: bool = False             # True: 조회/저장 실패를 로그만 남기지 않고 예외로 전파 (백필용)
     ):
 
         self.db_config = db_config
+        self.pool = pool or get_pool(db_config)
         self.z_threshold = z_threshold
         self.min_samples = min_samples
         self.min_confidence = min_confidence
+        self.strict = strict
 
         # 종목코드 매핑 로드
         self.stock_code_map = self._load_stock_code_map()
@@ -45,17 +53,14 @@ class DailyGapScanner:
             from munci.signal_gap.core.event_price_mapper import EventPriceMapper
             from munci.signal_gap.core.return_calculator import ReturnCalculator
             from munci.signal_gap.core.gap_detector import GapDetector
-            self._mapper = EventPriceMapper(db_config)
-            self._calculator = ReturnCalculator(db_config)
-            self._detector = GapDetector(db_config, z_threshold, min_confidence)
+            self._mapper = EventPriceMapper(db_config, pool=self.pool)
+            self._calculator = ReturnCalculator(db_config, pool=self.pool)
+            self._detector = GapDetector(db_config, z_threshold, min_confidence, pool=self.pool)
             self.use_history_calc = True
             logger.info("히스토리 기반 계산 경로 활성화 (event_returns_history 사용)")
         except Exception as e:
             logger.warning(f"히스토리 기반 계산 모듈 로딩 실패 → 간단 계산 사용: {e}")
 
-        # news_gaps 테이블의 칼럼(특히 calc_mode) 존재 여부 캐시
-        self._news_gaps_columns: Optional[set] = None
-
     # --------------------------- public API ---------------------------
 
     def scan(self, scan_date: str = None) -> List[dict]:
@@ -81,118 +86,181 @@ class DailyGapScanner:
 
     def _scan_news(self, scan_date: str) -> List[dict]:
 
-        conn = None
+        return self._scan_range(scan_date, scan_date)
+
+    def scan_range(self, start_date: str, end_date: str, save: bool = True) -> List[dict]:
+        """기간 스캔 (뉴스 조회/가격 패널 로드 1회, 백필용)"""
+        signals = self._scan_range(start_date, end_date)
+
+        if save:
+            self._save_signals(signals)
+
+        return signals
+
+    def _scan_range(self, start_date: str, end_date: str) -> List[dict]:
+
         signals = []
 
+        # mapper/calculator/detector 도 같은 풀에서 연결을 빌리므로 스캔 내내 연결을 잡고 있지 않음
+        # (작은 풀에서 자기 자신을 기다리는 교착 방지)
         try:
-            conn = pymysql.connect(**self.db_config)
-
-            # YYYYMMDD -> YYYY-MM-DD (DB 쿼리용)
-            db_date = to_db_date(scan_date)
-
-            with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-                # Step 1: 당일 뉴스 이벤트 조회
-                sql = """
-                      SELECT url        as news_id,
-                             title      as title,
-                             stock_name as companies,
-                             event_code as event_code,
-                             date       as news_date
-                      FROM comprehensive_analyzed_news
-                      WHERE date = %s
-                        AND stock_name IS NOT NULL
-                        AND event_code IS NOT NULL
-                      ORDER BY date
-                      """
-                cursor.execute(sql, (db_date,))
-                news_list = cursor.fetchall()
-
-                logger.info(f"[뉴스] {len(news_list)}건의 이벤트 발견")
-
-                if not news_list:
-                    logger.warning("뉴스 이벤트가 없습니다")
-                    return []
-
-            # Step 2: 캐시 준비 (지연 로딩)
-            price_cache = None
-            stats_cache = None
-
-            # Step 3: 각 뉴스 처리
-            for idx, news in enumerate(news_list, 1):
-                try:
-                    news_id = news['news_id']
-                    news_title = news.get('title', '')
-                    companies = news.get('companies', '')
-                    event_code_list = news.get('event_code', '')
-                    # DB에서 가져온 날짜를 YYYYMMDD로 통일
-                    news_date = from_db_date(news['news_date'])
-
-                    if not companies or not event_code_list:
-                        continue
+            # Step 1: 기간 뉴스 이벤트 조회
+            with self.pool.connection() as conn:
+                news_list = self._fetch_news(conn, start_date, end_date)
 
-                    company_list = [c.strip() for c in str(companies).split(',') if c.strip()]
-                    event_list = [e.strip() for e in str(event_code_list).split(',')
-                                  if e.strip() and e.strip().lower() != 'other']
+            logger.info(f"[뉴스] {len(news_list)}건의 이벤트 발견")
 
-                    if not event_list:
-                        continue
+            if not news_list:
+                logger.warning("뉴스 이벤트가 없습니다")
+                return []
 
-                    # 종목코드 변환
-                    for company_name in company_list:
-                        stock_code = self.stock_code_map.get(company_name)
-                        if not stock_code:
-                            continue
-
-                        for event_code in event_list:
-                            gap = None
-
-                            # 1) 히스토리 기반 계산 경로 시도
-                            if self.use_history_calc:
-                                gap = self._detect_gap_history_based(
-                                    news_id, news_title, stock_code,
-                                    company_name, event_code, news_date
-                                )
-
-                            # 2) 실패 시 간단 계산으로 폴백 (지연 캐시 로딩)
-                            if not gap:
-                                if price_cache is None or stats_cache is None:
-                                    logger.info("폴백 대비 가격/통계 캐시 로딩 중...")
-                                    price_cache = self._load_price_cache(conn, db_date)
-                                    stats_cache = self._load_stats_cache(conn, db_date)
-                                    logger.info(f" 캐시 로드 완료: {len(price_cache)}종목 / {len(stats_cache)}이벤트")
-
-                                gap = self._detect_gap_simple(
-                                    news_id, news_title, stock_code,
-                                    company_name, event_code, news_date,
-                                    price_cache, stats_cache
-                                )
-
-                            if gap:
-                                signals.append(gap)
-                                mode_tag = gap.get('calc_mode', 'NA')
-                                logger.info(
-                                    f"[{idx}/{len(news_list)}] "
-                                    f" [{mode_tag}] {gap['stock_name']}: {gap['event_code']}, "
-                                    f"Z={gap['z_score']:.2f} "
-                                    f"({gap['direction']}/{gap['magnitude']})"
-                                )
-
-                except Exception as e:
-                    logger.error(
-                        f"[{idx}/{len(news_list)}] 뉴스 처리 실패: {e}"
-                    )
-                    continue
+            # Step 1-1: 히스토리 경로용 가격 패널 일괄 로드 (종목당 DB 왕복 제거)
+            if self.use_history_calc:
+                with self.pool.connection() as conn:
+                    self._prepare_price_panel(conn, news_list, start_date, end_date)
+
+            # Step 2: 날짜별 처리 (폴백 캐시는 날짜 기준 포인트-인-타임)
+            news_by_date: Dict[str, List[dict]] = {}
+            for news in news_list:
+                news_by_date.setdefault(from_db_date(news['news_date']), []).append(news)
+
+            for scan_date, day_news in news_by_date.items():
+                signals.extend(self._process_news(day_news, scan_date))
 
         except Exception as e:
             logger.error(f"뉴스 스캔 실패: {e}", exc_info=True)
-
-        finally:
-            if conn:
-                conn.close()
+            if self.strict:
+                raise
 
         logger.info(f"[뉴스] {len(signals)}개 괴리 신호 탐지")
         return signals
 
+    def _fetch_news(self, conn, start_date: str, end_date: str) -> List[dict]:
+        """[start_date, end_date] 구간 뉴스 이벤트 (YYYYMMDD)"""
+        with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            sql = """
+                  SELECT url        as news_id,
+                         title      as title,
+                         stock_name as companies,
+                         event_code as event_code,
+                         date       as news_date
+                  FROM comprehensive_analyzed_news
+                  WHERE date BETWEEN %s AND %s
+                    AND stock_name IS NOT NULL
+                    AND event_code IS NOT NULL
+                  ORDER BY date
+                  """
+            cursor.execute(sql, (to_db_date(start_date), to_db_date(end_date)))
+            return cursor.fetchall()
+
+    def _process_news(self, news_list: List[dict], scan_date: str) -> List[dict]:
+        """하루치 뉴스 → 괴리 신호"""
+        signals = []
+
+        # YYYYMMDD -> YYYY-MM-DD (DB 쿼리용)
+        db_date = to_db_date(scan_date)
+
+        # 캐시 준비 (지연 로딩)
+        price_cache = None
+        stats_cache = None
+
+        for idx, news in enumerate(news_list, 1):
+            try:
+                news_id = news['news_id']
+                news_title = news.get('title', '')
+                companies = news.get('companies', '')
+                event_code_list = news.get('event_code', '')
+                # DB에서 가져온 날짜를 YYYYMMDD로 통일
+                news_date = from_db_date(news['news_date'])
+
+                if not companies or not event_code_list:
+                    continue
+
+                company_list = [c.strip() for c in str(companies).split(',') if c.strip()]
+                event_list = [e.strip() for e in str(event_code_list).split(',')
+                              if e.strip() and e.strip().lower() != 'other']
+
+                if not event_list:
+                    continue
+
+                # 종목코드 변환
+                for company_name in company_list:
+                    stock_code = self.stock_code_map.get(company_name)
+                    if not stock_code:
+                        continue
+
+                    for event_code in event_list:
+                        gap = None
+
+                        # 1) 히스토리 기반 계산 경로 시도
+                        if self.use_history_calc:
+                            gap = self._detect_gap_history_based(
+                                news_id, news_title, stock_code,
+                                company_name, event_code, news_date
+                            )
+
+                        # 2) 실패 시 간단 계산으로 폴백 (지연 캐시 로딩)
+                        if not gap:
+                            if price_cache is None or stats_cache is None:
+                                logger.info("폴백 대비 가격/통계 캐시 로딩 중...")
+                                with self.pool.connection() as conn:
+                                    price_cache = self._load_price_cache(conn, db_date)
+                                    stats_cache = self._load_stats_cache(conn, db_date)
+                                logger.info(f" 캐시 로드 완료: {len(price_cache)}종목 / {len(stats_cache)}이벤트")
+
+                            gap = self._detect_gap_simple(
+                                news_id, news_title, stock_code,
+                                company_name, event_code, news_date,
+                                price_cache, stats_cache
+                            )
+
+                        if gap:
+                            signals.append(gap)
+                            mode_tag = gap.get('calc_mode', 'NA')
+                            logger.info(
+                                f"[{idx}/{len(news_list)}] "
+                                f" [{mode_tag}] {gap['stock_name']}: {gap['event_code']}, "
+                                f"Z={gap['z_score']:.2f} "
+                                f"({gap['direction']}/{gap['magnitude']})"
+                            )
+
+            except Exception as e:
+                logger.error(
+                    f"[{idx}/{len(news_list)}] 뉴스 처리 실패: {e}"
+                )
+                continue
+
+        return signals
+
+    def _collect_stock_codes(self, news_list: List[dict]) -> set:
+        """뉴스 목록에 등장하는 종목코드 집합"""
+        codes = set()
+        for news in news_list:
+            companies = news.get('companies') or ''
+            for name in str(companies).split(','):
+                code = self.stock_code_map.get(name.strip())
+                if code:
+                    codes.add(code)
+        return codes
+
+    def _prepare_price_panel(self, conn, news_list: List[dict], start_date: str, end_date: str):
+        """스캔 구간 가격 패널을 로드해 mapper/calculator 에 주입 (실패 시 DB 조회 경로 유지)"""
+        from munci.signal_gap.core.price_panel import PricePanel
+
+        try:
+            panel_end = (
+                datetime.strptime(end_date, "%Y%m%d")
+                + timedelta(days=self.PRICE_PANEL_LOOKAHEAD_DAYS)
+            ).strftime("%Y%m%d")
+            panel = PricePanel.load(
+                conn, self._collect_stock_codes(news_list), start_date, panel_end
+            )
+        except Exception as e:
+            logger.warning(f"가격 패널 로드 실패 → 종목별 DB 조회 사용: {e}")
+            panel = None
+
+        self._mapper.price_panel = panel
+        self._calculator.price_panel = panel
 
     def _detect_gap_history_based(
         self, news_id: str, news_title: str,
@@ -253,45 +321,19 @@ class DailyGapScanner:
     # --------------------------- 간단 계산(폴백) ---------------------------
 
     def _load_stock_code_map(self) -> dict:
-        """normalized_aliases.json에서 종목명 -> 종목코드 매핑 로드"""
-        project_root = Path(__file__).parent.parent.parent.parent
-        json_path = project_root / "examples" / "normalized_aliases.json"
-
-        if not json_path.exists():
-            logger.warning(f"종목코드 매핑 파일 없음: {json_path}")
+        """normalized_aliases.json 종목명 -> 종목코드 매핑 (공유 별칭 인덱스)"""
+        index = get_alias_index()
+        if index is None:
             return {}
 
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        stock_map = {}
-        for main_name, aliases in data.items():
-            if not aliases or len(aliases) == 0:
-                continue
-
-            stock_code = None
-            for alias in aliases:
-                if alias.isdigit():
-                    stock_code = alias
-                    break
-
-            if not stock_code:
-                continue
-
-            stock_map[main_name] = stock_code
-
-            for alias in aliases:
-                if not alias.isdigit():
-                    stock_map[alias] = stock_code
+        logger.info(f"종목코드 매핑 로드 완료: {len(index.name_to_code)}개")
+        return index.name_to_code
 
-        logger.info(f"종목코드 매핑 로드 완료: {len(stock_map)}개")
-        return stock_map
-
-    def _load_price_cache(self, conn, scan_date: str) -> dict:
-        """가격 데이터를 메모리에 캐싱 (간단 계산에서 사용)"""
-        cache = {}
+    def _load_price_cache(self, conn, scan_date: str):
+        """가격 데이터를 종목별 배열로 캐싱 (간단 계산에서 사용)"""
+        from munci.signal_gap.core.price_panel import PricePanel
 
-        with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+        with conn.cursor() as cursor:
             cursor.execute("""
                            SELECT stock_code, trade_date, close_price
                            FROM stock_daily_prices
@@ -299,17 +341,9 @@ class DailyGapScanner:
                                      AND DATE_ADD(%s, INTERVAL 5 DAY)
                            ORDER BY stock_code, trade_date
                            """, (scan_date, scan_date))
+            rows = cursor.fetchall()
 
-            for row in cursor:
-                stock_code = row['stock_code']
-                date = row['trade_date']
-                price = float(row['close_price'])
-
-                if stock_code not in cache:
-                    cache[stock_code] = []
-                cache[stock_code].append((date, price))
-
-        return cache
+        return PricePanel.from_rows(rows)
 
     def _load_stats_cache(self, conn, scan_date: str) -> dict:
         """이벤트별 통계를 메모리에 캐싱 (포인트-인-타임; 간단 계산에서 사용)"""
@@ -339,34 +373,20 @@ class DailyGapScanner:
     def _detect_gap_simple(
         self, news_id: str, news_title: str,
         stock_code: str, stock_name: str, event_code: str, news_date: str,
-        price_cache: dict, stats_cache: dict
+        price_cache, stats_cache: dict
     ) -> dict | None:
 
 
-        # 가격 데이터 확인
-        if stock_code not in price_cache:
+        # 앵커 가격 찾기 (뉴스일자 이상 첫 거래일, 이진 탐색)
+        anchor = price_cache.get_anchor(stock_code, news_date)
+        if anchor is None:
             return None
 
-        prices = price_cache[stock_code]
-        # YYYYMMDD -> date 객체
-        news_date_obj = datetime.strptime(news_date, '%Y%m%d').date()
-
-        # 앵커 가격 찾기 (뉴스일자 이상 첫 거래일)
-        anchor_idx = None
-        for idx, (date, price) in enumerate(prices):
-            if date >= news_date_obj:
-                anchor_idx = idx
-                break
-
-        if anchor_idx is None or anchor_idx + 1 >= len(prices):
+        # 실제 수익률 (로그, 앵커 다음 거래일)
+        actual = price_cache.forward_returns(stock_code, anchor[0], anchor[1], [1])[1]
+        if actual is None:
             return None
 
-        anchor_price = prices[anchor_idx][1]
-        price_1d = prices[anchor_idx + 1][1]
-
-        # 실제 수익률 (로그)
-        actual = math.log(price_1d / anchor_price)
-
         # 통계 확인 (event_code 그대로 사용)
         if event_code not in stats_cache:
             return None
@@ -418,89 +438,26 @@ class DailyGapScanner:
 
     # --------------------------- 저장/요약 ---------------------------
 
-    def _get_news_gaps_columns(self, conn) -> set:
-        """news_gaps 테이블 컬럼 목록 (자동 감지)"""
-        if self._news_gaps_columns is not None:
-            return self._news_gaps_columns
-
-        cols = set()
-        with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute("SHOW COLUMNS FROM news_gaps")
-            for row in cursor:
-                cols.add(row['Field'])
-        self._news_gaps_columns = cols
-        logger.info(f"news_gaps columns: {sorted(cols)}")
-        return cols
-
     def _save_signals(self, signals: List[dict]):
 
         if not signals:
             logger.info("저장할 신호가 없습니다")
             return
 
-        conn = None
         try:
-            conn = pymysql.connect(**self.db_config)
-            cols = self._get_news_gaps_columns(conn)
-            has_calc_mode = 'calc_mode' in cols
-
-            with conn.cursor() as cursor:
-                for s in signals:
-                    # YYYYMMDD 그대로 사용 (이미 통일된 형식)
-                    news_date_str = s['news_date']
-
-                    if has_calc_mode:
-                        sql = """
-                            INSERT INTO news_gaps
-                            (news_id, news_title, stock_code, stock_name, event_code,
-                             news_date, horizon, actual_return, expected_return, expected_std,
-                             z_score, direction, magnitude, sample_count, calc_mode)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                            ON DUPLICATE KEY UPDATE
-                                z_score = VALUES(z_score),
-                                direction = VALUES(direction),
-                                magnitude = VALUES(magnitude),
-                                calc_mode = VALUES(calc_mode)
-                        """
-                        values = (
-                            s['news_id'], s['news_title'], s['stock_code'], s['stock_name'],
-                            s['event_code'], news_date_str, s['horizon'],
-                            s['actual_return'], s['expected_return'], s['expected_std'],
-                            s['z_score'], s['direction'], s['magnitude'], s['sample_count'],
-                            s.get('calc_mode', None)
-                        )
-                    else:
-                        sql = """
-                            INSERT INTO news_gaps
-                            (news_id, news_title, stock_code, stock_name, event_code,
-                             news_date, horizon, actual_return, expected_return, expected_std,
-                             z_score, direction, magnitude, sample_count)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                            ON DUPLICATE KEY UPDATE
-                                z_score = VALUES(z_score),
-                                direction = VALUES(direction),
-                                magnitude = VALUES(magnitude)
-                        """
-                        values = (
-                            s['news_id'], s['news_title'], s['stock_code'], s['stock_name'],
-                            s['event_code'], news_date_str, s['horizon'],
-                            s['actual_return'], s['expected_return'], s['expected_std'],
-                            s['z_score'], s['direction'], s['magnitude'], s['sample_count']
-                        )
-
-                    cursor.execute(sql, values)
-
-                conn.commit()
-                logger.info(f" DB 저장 완료: {len(signals)}건 (calc_mode column: {'YES' if has_calc_mode else 'NO'})")
+            with self.pool.connection() as conn:
+                # news_date 는 YYYYMMDD 그대로 사용 (이미 통일된 형식)
+                writer = news_gaps_writer(conn)
+                result = writer.write_dicts(conn, signals)
+                logger.info(
+                    f" DB 저장 완료: {result.rows}건 "
+                    f"(calc_mode column: {'YES' if 'calc_mode' in writer.columns else 'NO'})"
+                )
 
         except Exception as e:
             logger.error(f"DB 저장 실패: {e}", exc_info=True)
-            if conn:
-                conn.rollback()
-
-        finally:
-            if conn:
-                conn.close()
+            if self.strict:
+                raise
 
     def _print_summary(self, signals: List[dict], scan_date: str):
         """스캔 결과 요약 출력 (calc_mode 요약 포함)"""
@@ -579,34 +536,25 @@ def run_backfill_scan(
     start_date: str,
     end_date: str,
     z_threshold: float = 2.0,
-    min_confidence: float = 0.5
-):
-
-    from datetime import datetime, timedelta
+    min_confidence: float = 0.5,
+    workers: Optional[int] = None,
+    partition_days: int = 7,
+    checkpoint_path: Optional[str] = None
+) -> int:
+    """기간 백필 (파티션 단위 병렬 스캔, checkpoint_path 지정 시 중단 지점부터 재개)"""
+    from munci.rumerapi.services.backfill_engine import BackfillEngine
 
     logger.info(f"백필 스캔 시작: {start_date} ~ {end_date}")
 
-    scanner = DailyGapScanner(
-        db_config, z_threshold=z_threshold, min_confidence=min_confidence
+    engine = BackfillEngine(
+        db_config,
+        workers=workers,
+        partition_days=partition_days,
+        checkpoint_path=checkpoint_path,
+        z_threshold=z_threshold,
+        min_confidence=min_confidence
     )
-
-    # 날짜 범위 생성
-    start = datetime.strptime(start_date, "%Y%m%d")
-    end = datetime.strptime(end_date, "%Y%m%d")
-
-    current = start
-    total_signals = 0
-
-    while current <= end:
-        scan_date_str = current.strftime("%Y%m%d")
-
-        try:
-            signals = scanner.scan(scan_date=scan_date_str)
-            total_signals += len(signals)
-        except Exception as e:
-            logger.error(f"스캔 실패 ({scan_date_str}): {e}")
-
-        current += timedelta(days=1)
+    total_signals = engine.run(start_date, end_date)
 
     logger.info(f"{'=' * 60}")
     logger.info(f"백필 스캔 완료")
@@ -614,6 +562,8 @@ def run_backfill_scan(
     logger.info(f"  - 총 신호: {total_signals}개")
     logger.info(f"{'=' * 60}")
 
+    return total_signals
+
 
 # --------------------------- CLI ---------------------------
 
@@ -658,7 +608,14 @@ if __name__ == "__main__":
             # 백필 모드
             start_date = sys.argv[2]
             end_date = sys.argv[3]
-            run_backfill_scan(db_config, start_date, end_date)
+            workers = int(sys.argv[4]) if len(sys.argv) >= 5 else None
+            run_backfill_scan(
+                db_config, start_date, end_date,
+                workers=workers,
+                checkpoint_path=os.getenv(
+                    'BACKFILL_CHECKPOINT', f"backfill_{start_date}_{end_date}.json"
+                )
+            )
 
         elif mode == "date" and len(sys.argv) >= 3:
             # 특정 날짜 스캔
@@ -670,6 +627,7 @@ if __name__ == "__main__":
             print("  python daily_scanner.py                    # 어제 스캔")
             print("  python daily_scanner.py date 20240101      # 특정 날짜")
             print("  python daily_scanner.py backfill 20240101 20241012  # 백필")
+            print("  python daily_scanner.py backfill 20240101 20241012 8  # 백필 (워커 8개)")
 
     else:
         # 기본: 어제 스캔
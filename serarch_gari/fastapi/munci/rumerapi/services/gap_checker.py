@@ -5,13 +5,14 @@ import pymysql
 import logging
 
 from munci.rumerapi.core.config import settings
+from munci.main_utils.db_pool import ConnectionPool, get_pool
 
 logger = logging.getLogger(__name__)
 
 
 class NewsGapChecker:
 
-    def __init__(self):
+    def __init__(self, pool: Optional[ConnectionPool] = None):
         if all([settings.db_host, settings.db_username, settings.db_password, settings.db_database]):
             self.db_config = {
                 'host': settings.db_host,
@@ -24,6 +25,8 @@ class NewsGapChecker:
             self.db_config = None
             logger.warning("DB 설정 없음 - Gap 체크 불가")
 
+        self.pool = pool or (get_pool(self.db_config) if self.db_config else None)
+
     def check(self, stock_code: str, days: int = 3) -> Dict[str, Any]:
 
         if not self.db_config:
@@ -53,10 +56,8 @@ class NewsGapChecker:
         if not self.db_config:
             return []
 
-        conn = pymysql.connect(**self.db_config)
-
         try:
-            with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            with self.pool.connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
                 start_date = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d")
 
                 cursor.execute("""
@@ -99,18 +100,13 @@ class NewsGapChecker:
             logger.exception(f"Gap check failed: {e}")
             return []
 
-        finally:
-            conn.close()
-
     def _get_price_change(self, stock_code: str, days: int) -> Optional[float]:
         """가격 변동률"""
         if not self.db_config:
             return None
 
-        conn = pymysql.connect(**self.db_config)
-
         try:
-            with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            with self.pool.connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
                 start_date = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d")
 
                 cursor.execute("""
@@ -128,9 +124,6 @@ class NewsGapChecker:
             logger.exception(f"Price change failed: {e}")
             return None
 
-        finally:
-            conn.close()
-
         return None
 
     def list_gaps(
@@ -145,8 +138,6 @@ class NewsGapChecker:
         if not self.db_config:
             return []
 
-        conn = pymysql.connect(**self.db_config)
-
         try:
             start_date = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d")
 
@@ -163,7 +154,7 @@ class NewsGapChecker:
 
             where_sql = " AND ".join(where_clauses)
 
-            with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            with self.pool.connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
                 cursor.execute(f"""
                     SELECT
                         id,
@@ -213,9 +204,6 @@ class NewsGapChecker:
             logger.exception(f"List gaps failed: {e}")
             return []
 
-        finally:
-            conn.close()
-
     def get_stats(self, days: int = 7) -> Dict[str, Any]:
 
         if not self.db_config:
@@ -227,12 +215,10 @@ class NewsGapChecker:
                 "by_event_code": {}
             }
 
-        conn = pymysql.connect(**self.db_config)
-
         try:
             start_date = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d")
 
-            with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            with self.pool.connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
                 # 전체 개수
                 cursor.execute("""
                                SELECT COUNT(*) as total
@@ -287,6 +273,3 @@ class NewsGapChecker:
                 "by_magnitude": {},
                 "by_event_code": {}
             }
-
-        finally:
-            conn.close()
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import asyncio
 import logging
 import uuid
 from typing import List, Dict, Any
@@ -10,7 +11,7 @@ from munci.rumerapi.models.schemas import (
     SimilarCase, PatternInsight
 )
 from munci.rumerapi.extractors.companyGpt import extract_companies
-from munci.lastsa.event_with_translate import classify_event
+from munci.lastsa.event_with_translate import classify_event, classify_event_async
 from munci.rumerapi.core.config import settings
 from munci.news_es.es_client import create_es_client
 
@@ -200,9 +201,20 @@ class PatternAnalysisService:
 
         # 1. 쿼리에서 회사명/이벤트 추출
         extraction_result = extract_companies(req.query_text)
-        query_companies = extraction_result.get('companies', [])
-
         event_result = classify_event(req.query_text)
+        return self._analyze_with(req, extraction_result, event_result)
+
+    async def analyze_async(self, req: PatternAnalysisRequest) -> PatternAnalysisResponse:
+        """analyze 의 비동기 버전 (이벤트 분류는 await, 회사 추출/검색은 스레드에서)"""
+        extraction_result, event_result = await asyncio.gather(
+            asyncio.to_thread(extract_companies, req.query_text),
+            classify_event_async(req.query_text)
+        )
+        return await asyncio.to_thread(self._analyze_with, req, extraction_result, event_result)
+
+    def _analyze_with(self, req: PatternAnalysisRequest, extraction_result: Dict[str, Any],
+                      event_result) -> PatternAnalysisResponse:
+        query_companies = extraction_result.get('companies', [])
         event_labels = event_result.labels
 
         # 필터 회사 (사용자 지정)
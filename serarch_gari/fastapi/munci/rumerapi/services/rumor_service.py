@@ -1,4 +1,5 @@
 from __future__ import annotations
+import asyncio
 import logging, uuid
 from typing import Any, Dict, List
 from datetime import datetime
@@ -7,12 +8,13 @@ from munci.rumerapi.models.schemas import (
     RumorVerifyRequest, RumorVerifyResponse, Evidence, EvidenceType, TrustLevelEnum
 )
 from munci.rumerapi.extractors.companyGpt import extract_companies, initialize_extractor
-from munci.lastsa.event_with_translate import classify_event, initialize_event_classifier
+from munci.lastsa.event_with_translate import classify_event, classify_event_async, initialize_event_classifier
 from munci.main_utils.date_context import extract_date_context
 from munci.main_utils.optional_imports import try_import_trust_evaluator, try_import_dart_verifier
 from munci.rumerapi.core.config import settings
 from munci.news_es.search import search_with_api_params
 from munci.news_es.es_client import create_es_client
+from munci.news_es.near_dup import collapse_near_duplicates
 
 # optional modules
 TrustEvaluator = try_import_trust_evaluator()
@@ -300,10 +302,25 @@ class RumorVerificationServiceES:
         initialize_event_classifier()
 
         extraction_result = extract_companies(req.query_text)
+        event_result = classify_event(req.query_text)
+        return self._verify_with(req, extraction_result, event_result)
+
+    async def verify_async(self, req: RumorVerifyRequest) -> RumorVerifyResponse:
+        """verify 의 비동기 버전 (이벤트 분류는 await, 회사 추출/검색 등 블로킹 단계는 스레드에서)"""
+        await asyncio.to_thread(initialize_extractor)
+        await asyncio.to_thread(initialize_event_classifier)
+
+        extraction_result, event_result = await asyncio.gather(
+            asyncio.to_thread(extract_companies, req.query_text),
+            classify_event_async(req.query_text)
+        )
+        return await asyncio.to_thread(self._verify_with, req, extraction_result, event_result)
+
+    def _verify_with(self, req: RumorVerifyRequest, extraction_result: Dict[str, Any],
+                     event_result) -> RumorVerifyResponse:
         companies = extraction_result.get('companies', [])
         company_details = extraction_result.get('company_details', {})
 
-        event_result = classify_event(req.query_text)
         date_range = extract_date_context(req.query_text)
 
         logger.info(f"Extracted companies: {companies}")
@@ -328,7 +345,11 @@ class RumorVerificationServiceES:
         if search_result.get('results'):
             logger.info(f"First result score: {search_result['results'][0].get('score', 0)}")
 
-        results = search_result.get("results", [])
+        # 통신사 기사 재전송/복사본은 독립 출처가 아니므로 근사 중복 묶음당 1건만 평가
+        results = collapse_near_duplicates(search_result.get("results", []))
+        collapsed = len(search_result.get("results", [])) - len(results)
+        if collapsed:
+            logger.info(f"Near-duplicate collapse: {collapsed} copies removed, {len(results)} clusters left")
 
         exact_matches = []
         partial_matches = []
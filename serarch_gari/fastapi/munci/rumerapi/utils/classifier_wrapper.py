@@ -1,9 +1,10 @@
 
 from __future__ import annotations
+import asyncio
 import logging
 import os
 from typing import List, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,8 @@ class SafeClassifierWrapper:
         self.hcx_classifier = None
         self.gpt_available = bool(os.getenv("OPENAI_API_KEY"))
         self._init_failed = False
+        self._gpt_cache = None
+        self._gpt_cache_ready = False
 
     def initialize_hyperclova(self) -> bool:
 
@@ -59,33 +62,25 @@ class SafeClassifierWrapper:
             return ClassificationResult(error="HyperCLOVA not available")
 
         try:
-            result = self.hcx_classifier.classify_event(text)
-
-            labels = getattr(result, "labels", None)
-            if labels is None or not isinstance(labels, list):
-                logger.warning(f"[HCX] Invalid labels format: {labels}")
-                labels = []
-
-            confidence = getattr(result, "confidence", 0.0)
-            try:
-                confidence = float(confidence)
-                if not (0.0 <= confidence <= 1.0):
-                    logger.warning(f"[HCX] Confidence out of range: {confidence}")
-                    confidence = max(0.0, min(1.0, confidence))
-            except (TypeError, ValueError):
-                logger.warning(f"[HCX] Invalid confidence value: {confidence}")
-                confidence = 0.0
+            return self._to_hcx_result(self.hcx_classifier.classify_event(text))
+        except AttributeError as e:
+            logger.error(f"[HCX] Result attribute error: {e}")
+            return ClassificationResult(error=f"Invalid result format: {e}")
+        except Exception as e:
+            logger.error(f"[HCX] Classification error: {e}", exc_info=True)
+            return ClassificationResult(error=str(e))
 
-            raw = str(getattr(result, "raw_response", ""))
+    async def classify_with_hyperclova_async(self, text: str) -> ClassificationResult:
+        """classify_with_hyperclova 의 비동기 버전 (keep-alive 연결 풀 사용)"""
+        if not text or not text.strip():
+            logger.warning("[HCX] Empty text provided")
+            return ClassificationResult(error="Empty input text")
 
-            logger.info(f"[HCX] Success: labels={labels}, conf={confidence:.2f}")
-            return ClassificationResult(
-                labels=labels,
-                confidence=confidence,
-                raw_response=raw,
-                source="hyperclova"
-            )
+        if not self.initialize_hyperclova():
+            return ClassificationResult(error="HyperCLOVA not available")
 
+        try:
+            return self._to_hcx_result(await self.hcx_classifier.classify_event_async(text))
         except AttributeError as e:
             logger.error(f"[HCX] Result attribute error: {e}")
             return ClassificationResult(error=f"Invalid result format: {e}")
@@ -93,6 +88,32 @@ class SafeClassifierWrapper:
             logger.error(f"[HCX] Classification error: {e}", exc_info=True)
             return ClassificationResult(error=str(e))
 
+    def _to_hcx_result(self, result) -> ClassificationResult:
+        labels = getattr(result, "labels", None)
+        if labels is None or not isinstance(labels, list):
+            logger.warning(f"[HCX] Invalid labels format: {labels}")
+            labels = []
+
+        confidence = getattr(result, "confidence", 0.0)
+        try:
+            confidence = float(confidence)
+            if not (0.0 <= confidence <= 1.0):
+                logger.warning(f"[HCX] Confidence out of range: {confidence}")
+                confidence = max(0.0, min(1.0, confidence))
+        except (TypeError, ValueError):
+            logger.warning(f"[HCX] Invalid confidence value: {confidence}")
+            confidence = 0.0
+
+        raw = str(getattr(result, "raw_response", ""))
+
+        logger.info(f"[HCX] Success: labels={labels}, conf={confidence:.2f}")
+        return ClassificationResult(
+            labels=labels,
+            confidence=confidence,
+            raw_response=raw,
+            source="hyperclova"
+        )
+
     def classify_with_chatgpt(self, text: str) -> ClassificationResult:
 
         if not text or not text.strip():
@@ -109,6 +130,32 @@ class SafeClassifierWrapper:
             logger.error(f"[GPT] Module import failed: {e}")
             return ClassificationResult(error=f"Import error: {e}")
 
+        cache = self._get_gpt_cache()
+        if cache is not None:
+            cached = cache.get(text)
+            if cached is not None:
+                logger.info(f"[GPT] Cache hit: phrases={cached.get('phrases')}")
+                return ClassificationResult(**cached)
+
+        gpt_result = self._call_chatgpt(classify_event_by_chatgpt, text)
+        if cache is not None and gpt_result.phrases and not gpt_result.error:
+            cache.set(text, asdict(gpt_result))
+        return gpt_result
+
+    def _get_gpt_cache(self):
+        """ChatGPT 이벤트 추출 결과 캐시 (HCX 라벨 캐시와 같은 저장소, namespace 만 다름)"""
+        if not self._gpt_cache_ready:
+            self._gpt_cache_ready = True
+            try:
+                from munci.lastsa.event_with_translate import gpt_event_prompt_version
+                from munci.lastsa.event_extractor.label_cache import get_label_cache
+                # phrases 는 제목 문구를 그대로 옮긴 값이라 근사 중복 제목의 결과는 재사용 불가 → 정확 일치만
+                self._gpt_cache = get_label_cache("gpt", gpt_event_prompt_version(), max_distance=0)
+            except ImportError as e:
+                logger.warning(f"[GPT] Cache unavailable: {e}")
+        return self._gpt_cache
+
+    def _call_chatgpt(self, classify_event_by_chatgpt, text: str) -> ClassificationResult:
         try:
             result = classify_event_by_chatgpt(text)
 
@@ -171,6 +218,38 @@ class SafeClassifierWrapper:
 
         return merged
 
+    async def classify_async(self, text: str) -> ClassificationResult:
+        """classify 의 비동기 버전
+
+        HCX 는 이벤트 루프의 keep-alive 연결 풀로, ChatGPT(동기 SDK)는 스레드에서 동시에 실행한다.
+        """
+        if not text or not text.strip():
+            logger.warning("[CLASSIFY] Empty text provided")
+            return ClassificationResult(
+                labels=["other"],
+                error="Empty input text"
+            )
+
+        logger.info(f"[CLASSIFY] Starting (async): '{text[:50]}...'")
+
+        hcx_result, gpt_result = await asyncio.gather(
+            self.classify_with_hyperclova_async(text),
+            asyncio.to_thread(self.classify_with_chatgpt, text)
+        )
+        merged = self._merge_results(hcx_result, gpt_result)
+
+        logger.info(
+            f"[CLASSIFY] Final: source={merged.source}, "
+            f"labels={merged.labels}, phrases={merged.phrases}"
+        )
+
+        return merged
+
+    async def aclose(self):
+        """현재 이벤트 루프에 열린 HCX 연결 정리"""
+        if self.hcx_classifier is not None and hasattr(self.hcx_classifier, "aclose"):
+            await self.hcx_classifier.aclose()
+
     def _merge_results(
             self,
             hcx: ClassificationResult,
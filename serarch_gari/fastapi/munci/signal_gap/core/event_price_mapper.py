@@ -1,11 +1,16 @@
 
 from __future__ import annotations
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, TYPE_CHECKING
 import pymysql
 from dataclasses import dataclass
 import logging
 
+from munci.main_utils.db_pool import ConnectionPool, get_pool
+
+if TYPE_CHECKING:
+    from munci.signal_gap.core.price_panel import PricePanel
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,9 +28,17 @@ class AnchorPrice:
 class EventPriceMapper:
     """이벤트 → 주가 앵커 매핑"""
     
-    def __init__(self, db_config: dict):
+    def __init__(
+        self,
+        db_config: dict,
+        price_panel: Optional[PricePanel] = None,
+        pool: Optional[ConnectionPool] = None
+    ):
 
         self.db_config = db_config
+        self.pool = pool or get_pool(db_config)
+        # 가격 패널이 주입되면 패널 구간 내 조회는 메모리에서 처리
+        self.price_panel = price_panel
     
     def get_anchor_price(
         self,
@@ -33,14 +46,14 @@ class EventPriceMapper:
         event_date: str  # YYYYMMDD
     ) -> Optional[AnchorPrice]:
 
-        conn = None
+        if self.price_panel is not None and self.price_panel.covers(stock_code, event_date):
+            return self._get_anchor_from_panel(stock_code, event_date)
+
         try:
-            conn = pymysql.connect(**self.db_config)
-            
             # 종목코드 6자리 패딩 추가
             stock_code_padded = stock_code.zfill(6)
             
-            with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            with self.pool.connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
                 # 이벤트일 이후 첫 거래일 찾기
                 # 날짜 형식 변환: YYYYMMDD -> YYYY-MM-DD
                 event_date_formatted = f"{event_date[:4]}-{event_date[4:6]}-{event_date[6:]}" if len(event_date) == 8 else event_date
@@ -93,9 +106,25 @@ class EventPriceMapper:
         except Exception as e:
             logger.error(f"앵커 가격 조회 실패: {e}", exc_info=True)
             return None
-        finally:
-            if conn:
-                conn.close()
+
+    def _get_anchor_from_panel(self, stock_code: str, event_date: str) -> Optional[AnchorPrice]:
+        """가격 패널에서 앵커 조회 (DB 왕복 없음)"""
+        found = self.price_panel.get_anchor(stock_code, event_date)
+        if not found:
+            logger.warning(
+                f"앵커 가격 없음(패널): stock={stock_code}, date={event_date}"
+            )
+            return None
+
+        anchor_date, anchor_close = found
+        return AnchorPrice(
+            stock_code=stock_code,
+            event_date=event_date,
+            anchor_date=anchor_date,
+            anchor_close=anchor_close,
+            volume=0,
+            market_cap=0.0
+        )
     
     def get_anchor_prices_batch(
         self,
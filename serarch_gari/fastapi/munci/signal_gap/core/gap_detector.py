@@ -6,6 +6,7 @@ import logging
 
 from munci.signal_gap.models.expectation_model import ExpectationModel, ExpectationStats
 from munci.signal_gap.core.return_calculator import ReturnPath
+from munci.main_utils.db_pool import ConnectionPool
 
 logger = logging.getLogger(__name__)
 
@@ -48,10 +49,11 @@ class GapDetector:
         self,
         db_config: dict,
         z_threshold: float = 2.0,
-        min_confidence: float = 0.5
+        min_confidence: float = 0.5,
+        pool: Optional[ConnectionPool] = None
     ):
 
-        self.model = ExpectationModel(db_config)
+        self.model = ExpectationModel(db_config, pool=pool)
         self.z_threshold = z_threshold
         self.min_confidence = min_confidence
     
@@ -65,6 +67,27 @@ class GapDetector:
         horizon: int = 1
     ) -> Optional[GapSignal]:
 
+        signal = self._evaluate(
+            stock_code, stock_name, event_code, event_date, returns, horizon
+        )
+        if signal:
+            # Step 7: 백분위 계산 (실제 수익률의 역사적 위치)
+            signal.percentile = self._calculate_percentile(
+                signal.actual_return, event_code, horizon
+            )
+        return signal
+
+    def _evaluate(
+        self,
+        stock_code: str,
+        stock_name: str,
+        event_code: str,
+        event_date: str,
+        returns: ReturnPath,
+        horizon: int
+    ) -> Optional[GapSignal]:
+        """Step 1~6: 기대효과 대비 괴리 판정 (백분위는 호출 측에서 채움)"""
+
         # Step 1: 기대효과 조회
         expectation = self.model.get_expectation(event_code, horizon)
         if not expectation:
@@ -118,11 +141,6 @@ class GapDetector:
         else:
             magnitude = "MODERATE"
         
-        # Step 7: 백분위 계산 (실제 수익률의 역사적 위치)
-        percentile = self._calculate_percentile(
-            actual_return, event_code, horizon
-        )
-        
         signal = GapSignal(
             stock_code=stock_code,
             stock_name=stock_name,
@@ -137,7 +155,7 @@ class GapDetector:
             expected_q25=expectation.q25,
             expected_q75=expectation.q75,
             z_score=z_score,
-            percentile=percentile,
+            percentile=0.5,          # detect_gap / detect_gaps_batch 에서 채움
             confidence=expectation.confidence,
             direction=direction,
             magnitude=magnitude,
@@ -165,12 +183,24 @@ class GapDetector:
         
         for stock_code, stock_name, event_code, event_date, returns in events:
             for H in horizons:
-                signal = self.detect_gap(
+                signal = self._evaluate(
                     stock_code, stock_name, event_code,
                     event_date, returns, H
                 )
                 if signal:
                     all_signals.append(signal)
+
+        # 백분위: (event_code, horizon) 별로 묶어 한 번에 계산
+        groups: Dict[tuple, List[GapSignal]] = {}
+        for signal in all_signals:
+            groups.setdefault((signal.event_code, signal.horizon), []).append(signal)
+
+        for (event_code, horizon), group in groups.items():
+            percentiles = self.model.get_percentiles(
+                event_code, horizon, [sig.actual_return for sig in group]
+            )
+            for sig, pct in zip(group, percentiles):
+                sig.percentile = float(pct)
         
         logger.info(f"배치 탐지 완료: {len(all_signals)}개 신호")
         return all_signals
@@ -182,50 +212,16 @@ class GapDetector:
         horizon: int
     ) -> float:
 
-        import pymysql
-        
-        conn = None
         try:
-            conn = pymysql.connect(**self.model.db_config)
-            
-            with conn.cursor() as cursor:
-                # 현재 값보다 작은 샘플 수
-                sql_below = f"""
-                    SELECT COUNT(*) as count
-                    FROM event_returns_history
-                    WHERE event_code = %s
-                      AND return_{horizon}d IS NOT NULL
-                      AND return_{horizon}d < %s
-                """
-                cursor.execute(sql_below, (event_code, value))
-                below_count = cursor.fetchone()[0]
-                
-                # 전체 샘플 수
-                sql_total = f"""
-                    SELECT COUNT(*) as count
-                    FROM event_returns_history
-                    WHERE event_code = %s
-                      AND return_{horizon}d IS NOT NULL
-                """
-                cursor.execute(sql_total, (event_code,))
-                total_count = cursor.fetchone()[0]
-                
-                if total_count == 0:
-                    return 0.5  # 중립
-                
-                percentile = below_count / total_count
-                
-                logger.debug(
-                    f"백분위 계산: {event_code} H={horizon}, "
-                    f"val={value:.4f}, pct={percentile:.2f}"
-                )
-                
-                return percentile
-        
+            percentile = float(self.model.get_percentiles(event_code, horizon, [value])[0])
+
+            logger.debug(
+                f"백분위 계산: {event_code} H={horizon}, "
+                f"val={value:.4f}, pct={percentile:.2f}"
+            )
+
+            return percentile
+
         except Exception as e:
             logger.error(f"백분위 계산 실패: {e}", exc_info=True)
             return 0.5  # 실패 시 중립
-        
-        finally:
-            if conn:
-                conn.close()
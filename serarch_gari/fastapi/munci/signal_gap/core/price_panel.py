@@ -0,0 +1,283 @@
+from __future__ import annotations
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Any
+import numpy as np
+import logging
+
+from munci.main_utils.db_pool import get_pool
+
+logger = logging.getLogger(__name__)
+
+
+def to_int_date(value: Any) -> int:
+    """date / datetime / 'YYYY-MM-DD' / 'YYYYMMDD' → YYYYMMDD 정수"""
+    if isinstance(value, (date, datetime)):
+        return value.year * 10000 + value.month * 100 + value.day
+    return int(str(value).replace('-', '')[:8])
+
+
+def _int_to_yyyymmdd(value: int) -> str:
+    return f"{int(value):08d}"
+
+
+def _int_to_db_date(value: int) -> str:
+    s = _int_to_yyyymmdd(value)
+    return f"{s[:4]}-{s[4:6]}-{s[6:]}"
+
+
+class PricePanel:
+    """종목별 정렬된 (거래일, 종가) 배열을 메모리에 보관하는 가격 패널
+
+    - 종목코드는 6자리 패딩 기준으로 보관
+    - 거래일은 YYYYMMDD 정수(int64), 종가는 float64 배열
+    - 앵커/H일 수익률은 np.searchsorted 로 조회 (DB 왕복 없음)
+    """
+
+    def __init__(self, start_date: Optional[str] = None, end_date: Optional[str] = None):
+        self._dates: Dict[str, np.ndarray] = {}
+        self._closes: Dict[str, np.ndarray] = {}
+        self.start_date: Optional[int] = to_int_date(start_date) if start_date else None
+        self.end_date: Optional[int] = to_int_date(end_date) if end_date else None
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def __contains__(self, stock_code: str) -> bool:
+        return str(stock_code).zfill(6) in self._dates
+
+    # --------------------------- 구성 ---------------------------
+
+    @classmethod
+    def load(
+        cls,
+        conn,
+        stock_codes: Iterable[str],
+        start_date: str,
+        end_date: str,
+        chunk_size: int = 500
+    ) -> PricePanel:
+        """stock_daily_prices 에서 [start_date, end_date] 구간을 종목 묶음 단위로 일괄 로드"""
+        panel = cls(start_date, end_date)
+        codes = sorted({str(c).zfill(6) for c in stock_codes if c})
+        if not codes:
+            return panel
+
+        start_db = _int_to_db_date(panel.start_date)
+        end_db = _int_to_db_date(panel.end_date)
+
+        rows: List[Tuple[str, Any, float]] = []
+        with conn.cursor() as cursor:
+            for i in range(0, len(codes), chunk_size):
+                chunk = codes[i:i + chunk_size]
+                placeholders = ','.join(['%s'] * len(chunk))
+                cursor.execute(f"""
+                    SELECT stock_code, trade_date, close_price
+                    FROM stock_daily_prices
+                    WHERE stock_code IN ({placeholders})
+                      AND trade_date BETWEEN %s AND %s
+                    ORDER BY stock_code, trade_date
+                """, (*chunk, start_db, end_db))
+                rows.extend(cursor.fetchall())
+
+        panel._build(rows, codes)
+        logger.info(
+            f"가격 패널 로드: {len(codes)}종목, {len(rows)}행 "
+            f"({start_db} ~ {end_db})"
+        )
+        return panel
+
+    @classmethod
+    def from_db_config(
+        cls,
+        db_config: dict,
+        stock_codes: Iterable[str],
+        start_date: str,
+        end_date: str
+    ) -> PricePanel:
+        with get_pool(db_config).connection() as conn:
+            return cls.load(conn, stock_codes, start_date, end_date)
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Tuple[str, Any, float]],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> PricePanel:
+        """(stock_code, trade_date, close) 행 목록으로 패널 구성 (정렬 불필요)"""
+        panel = cls(start_date, end_date)
+        panel._build(list(rows), ())
+        return panel
+
+    def _build(self, rows: List[Tuple[str, Any, float]], requested: Iterable[str]):
+        grouped: Dict[str, Tuple[List[int], List[float]]] = {}
+        for stock_code, trade_date, close in rows:
+            if close is None:
+                continue
+            dates, closes = grouped.setdefault(str(stock_code).zfill(6), ([], []))
+            dates.append(to_int_date(trade_date))
+            closes.append(float(close))
+
+        for code, (dates, closes) in grouped.items():
+            d = np.asarray(dates, dtype=np.int64)
+            c = np.asarray(closes, dtype=np.float64)
+            if d.size > 1 and np.any(d[1:] < d[:-1]):
+                order = np.argsort(d, kind='stable')
+                d, c = d[order], c[order]
+            self._dates[code] = d
+            self._closes[code] = c
+
+        # 요청했지만 가격이 없는 종목도 "로드됨"으로 기록 → DB 폴백 방지
+        empty_d = np.empty(0, dtype=np.int64)
+        empty_c = np.empty(0, dtype=np.float64)
+        for code in requested:
+            if code not in self._dates:
+                self._dates[code] = empty_d
+                self._closes[code] = empty_c
+
+    def append_rows(self, rows: Iterable[Tuple[str, Any, float]], end_date: Optional[Any] = None):
+        """기존 마지막 거래일 이후 구간의 행 추가 (슬라이딩 윈도우용)"""
+        chunk = PricePanel()
+        chunk._build(list(rows), ())
+
+        for code, dates in chunk._dates.items():
+            if code in self._dates and self._dates[code].size:
+                self._dates[code] = np.concatenate([self._dates[code], dates])
+                self._closes[code] = np.concatenate([self._closes[code], chunk._closes[code]])
+            else:
+                self._dates[code] = dates
+                self._closes[code] = chunk._closes[code]
+
+        if end_date is not None:
+            self.end_date = to_int_date(end_date)
+
+    def evict_before(self, date_value: Any):
+        """date_value 이전 거래일 제거 (남은 가격이 없는 종목은 삭제)"""
+        cutoff = to_int_date(date_value)
+
+        for code in list(self._dates):
+            dates = self._dates[code]
+            idx = int(np.searchsorted(dates, cutoff, side='left'))
+            if idx >= dates.size:
+                del self._dates[code]
+                del self._closes[code]
+            elif idx:
+                self._dates[code] = dates[idx:]
+                self._closes[code] = self._closes[code][idx:]
+
+        self.start_date = cutoff
+
+    def row_count(self) -> int:
+        return int(sum(d.size for d in self._dates.values()))
+
+    # --------------------------- 조회 ---------------------------
+
+    def covers(self, stock_code: str, date_value: Any) -> bool:
+        """해당 종목이 로드되어 있고 날짜가 패널 구간 안에 있는지"""
+        if stock_code not in self:
+            return False
+        d = to_int_date(date_value)
+        if self.start_date is not None and d < self.start_date:
+            return False
+        if self.end_date is not None and d > self.end_date:
+            return False
+        return True
+
+    def series(self, stock_code: str) -> Tuple[np.ndarray, np.ndarray]:
+        code = str(stock_code).zfill(6)
+        return self._dates[code], self._closes[code]
+
+    def get_anchor(self, stock_code: str, event_date: Any) -> Optional[Tuple[str, float]]:
+        """이벤트일 이후(포함) 첫 거래일과 종가 → (YYYYMMDD, close)"""
+        code = str(stock_code).zfill(6)
+        dates = self._dates.get(code)
+        if dates is None:
+            return None
+
+        idx = int(np.searchsorted(dates, to_int_date(event_date), side='left'))
+        if idx >= dates.size:
+            return None
+
+        return _int_to_yyyymmdd(dates[idx]), float(self._closes[code][idx])
+
+    def forward_returns(
+        self,
+        stock_code: str,
+        anchor_date: Any,
+        anchor_price: float,
+        horizons: List[int]
+    ) -> Dict[int, Optional[float]]:
+        """앵커 이후 H번째 거래일 종가 기준 로그수익률 (모든 horizon 일괄 계산)"""
+        code = str(stock_code).zfill(6)
+        dates = self._dates.get(code)
+        if dates is None or not anchor_price:
+            return {H: None for H in horizons}
+
+        # trade_date > anchor_date 인 첫 위치 + (H - 1)
+        base = int(np.searchsorted(dates, to_int_date(anchor_date), side='right'))
+        h = np.asarray(horizons, dtype=np.int64)
+        idx = base + h - 1
+        valid = idx < dates.size
+
+        out = np.full(h.shape, np.nan)
+        if np.any(valid):
+            out[valid] = np.log(self._closes[code][idx[valid]] / anchor_price)
+
+        return {
+            int(H): (None if np.isnan(r) else float(r))
+            for H, r in zip(h, out)
+        }
+
+    def batch_anchor_returns(
+        self,
+        pairs: Sequence[Tuple[str, Any]],
+        horizons: List[int]
+    ) -> List[Optional[Tuple[str, float, Dict[int, Optional[float]]]]]:
+        """(종목, 이벤트일) 목록의 앵커 + H일 로그수익률 일괄 계산
+
+        get_anchor + forward_returns 와 같은 결과를 종목별 searchsorted 한 번으로 계산.
+        앵커가 없으면 None, 있으면 (앵커일 YYYYMMDD, 앵커 종가, {H: 수익률 or None}).
+        """
+        out: List[Optional[Tuple[str, float, Dict[int, Optional[float]]]]] = [None] * len(pairs)
+        h = np.asarray(horizons, dtype=np.int64)
+
+        by_code: Dict[str, List[int]] = {}
+        for i, (stock_code, _) in enumerate(pairs):
+            by_code.setdefault(str(stock_code).zfill(6), []).append(i)
+
+        for code, positions in by_code.items():
+            dates = self._dates.get(code)
+            if dates is None or dates.size == 0:
+                continue
+            closes = self._closes[code]
+
+            event_dates = np.fromiter(
+                (to_int_date(pairs[i][1]) for i in positions), dtype=np.int64, count=len(positions)
+            )
+            anchor = np.searchsorted(dates, event_dates, side='left')
+            found = anchor < dates.size
+            anchor = np.minimum(anchor, dates.size - 1)
+            anchor_close = closes[anchor]
+
+            # trade_date > anchor_date 인 첫 위치 + (H - 1)
+            base = np.searchsorted(dates, dates[anchor], side='right')
+            idx = base[:, None] + h[None, :] - 1
+            valid = (idx < dates.size) & found[:, None] & (anchor_close[:, None] != 0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rets = np.where(
+                    valid,
+                    np.log(closes[np.minimum(idx, dates.size - 1)] / anchor_close[:, None]),
+                    np.nan
+                )
+
+            for row, i in enumerate(positions):
+                if not found[row]:
+                    continue
+                out[i] = (
+                    _int_to_yyyymmdd(dates[anchor[row]]),
+                    float(anchor_close[row]),
+                    {int(H): (None if np.isnan(r) else float(r)) for H, r in zip(h, rets[row])}
+                )
+
+        return out
+
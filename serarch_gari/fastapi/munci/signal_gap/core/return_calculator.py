@@ -1,11 +1,16 @@
 
 from __future__ import annotations
 import math
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, TYPE_CHECKING
 import pymysql
 from dataclasses import dataclass, field
 import logging
 
+from munci.main_utils.db_pool import ConnectionPool, get_pool
+
+if TYPE_CHECKING:
+    from munci.signal_gap.core.price_panel import PricePanel
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,9 +28,17 @@ class ReturnPath:
 class ReturnCalculator:
     """수익률 계산기"""
     
-    def __init__(self, db_config: dict):
+    def __init__(
+        self,
+        db_config: dict,
+        price_panel: Optional[PricePanel] = None,
+        pool: Optional[ConnectionPool] = None
+    ):
 
         self.db_config = db_config
+        self.pool = pool or get_pool(db_config)
+        # 가격 패널이 주입되면 패널 구간 내 계산은 메모리에서 처리
+        self.price_panel = price_panel
     
     def calculate_returns(
         self,
@@ -37,17 +50,24 @@ class ReturnCalculator:
 
         if horizons is None:
             horizons = [1, 3, 5]
+
+        if self.price_panel is not None and self.price_panel.covers(stock_code, anchor_date):
+            return ReturnPath(
+                stock_code=stock_code,
+                anchor_date=anchor_date,
+                anchor_price=anchor_price,
+                horizons=self.price_panel.forward_returns(
+                    stock_code, anchor_date, anchor_price, horizons
+                )
+            )
         
-        conn = None
         returns = {}
         
         try:
-            conn = pymysql.connect(**self.db_config)
-            
             # 종목코드 6자리 패딩 추가
             stock_code_padded = stock_code.zfill(6)
             
-            with conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            with self.pool.connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
                 # anchor_date 형식 변환: YYYYMMDD -> YYYY-MM-DD
                 anchor_date_formatted = f"{anchor_date[:4]}-{anchor_date[4:6]}-{anchor_date[6:]}" if len(anchor_date) == 8 else anchor_date
                 
@@ -90,10 +110,6 @@ class ReturnCalculator:
             # 실패 시 모든 horizon을 None으로
             returns = {H: None for H in horizons}
         
-        finally:
-            if conn:
-                conn.close()
-        
         return ReturnPath(
             stock_code=stock_code,
             anchor_date=anchor_date,
@@ -108,30 +124,22 @@ class ReturnCalculator:
         days: int = 10
     ) -> List[tuple[str, float]]:
 
-        conn = None
-        try:
-            conn = pymysql.connect(**self.db_config)
+        # 종목코드 6자리 패딩 추가
+        stock_code_padded = stock_code.zfill(6)
+        
+        with self.pool.connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
+            # start_date 형식 변환: YYYYMMDD -> YYYY-MM-DD
+            start_date_formatted = f"{start_date[:4]}-{start_date[4:6]}-{start_date[6:]}" if len(start_date) == 8 else start_date
             
-            # 종목코드 6자리 패딩 추가
-            stock_code_padded = stock_code.zfill(6)
+            sql = """
+                SELECT trade_date as date, close_price
+                FROM stock_daily_prices
+                WHERE stock_code = %s
+                  AND trade_date >= %s
+                ORDER BY trade_date ASC
+                LIMIT %s
+            """
+            cursor.execute(sql, (stock_code_padded, start_date_formatted, days))
+            rows = cursor.fetchall()
             
-            with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-                # start_date 형식 변환: YYYYMMDD -> YYYY-MM-DD
-                start_date_formatted = f"{start_date[:4]}-{start_date[4:6]}-{start_date[6:]}" if len(start_date) == 8 else start_date
-                
-                sql = """
-                    SELECT trade_date as date, close_price
-                    FROM stock_daily_prices
-                    WHERE stock_code = %s
-                      AND trade_date >= %s
-                    ORDER BY trade_date ASC
-                    LIMIT %s
-                """
-                cursor.execute(sql, (stock_code_padded, start_date_formatted, days))
-                rows = cursor.fetchall()
-                
-                return [(row['date'], float(row['close_price'])) for row in rows]
-        
-        finally:
-            if conn:
-                conn.close()
+            return [(row['date'], float(row['close_price'])) for row in rows]
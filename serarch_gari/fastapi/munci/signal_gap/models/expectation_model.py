@@ -1,10 +1,14 @@
 
 from __future__ import annotations
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import pymysql
 import numpy as np
 import logging
+import threading
+
+from munci.main_utils.db_pool import ConnectionPool, get_pool
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,21 @@ class ExpectationStats:
     confidence: float        # 신뢰도 (샘플 수 기반)
 
 
+def summarize_returns(returns: np.ndarray) -> Dict[str, float]:
+    """수익률 표본 요약 통계 (모델 조회/사전 집계 공용)"""
+    q25 = float(np.percentile(returns, 25))
+    q75 = float(np.percentile(returns, 75))
+    return {
+        "mean": float(np.mean(returns)),
+        "median": float(np.median(returns)),
+        "std": float(np.std(returns, ddof=1)) if len(returns) > 1 else 0.0,  # 표본 표준편차
+        "q25": q25,
+        "q75": q75,
+        "iqr": q75 - q25,
+        "count": int(len(returns)),
+    }
+
+
 class ExpectationModel:
     """기대효과 계산 모델"""
     
@@ -31,13 +50,25 @@ class ExpectationModel:
         self, 
         db_config: dict, 
         min_samples: int = 10,
-        lookback_days: int = 365
+        lookback_days: int = 365,
+        pool: Optional[ConnectionPool] = None,
+        use_stats_table: bool = True,
+        stats_max_age_days: int = 1,
+        sample_cache_size: int = 256
     ):
 
         self.db_config = db_config
+        self.pool = pool or get_pool(db_config)
         self.min_samples = min_samples
         self.lookback_days = lookback_days
+        # event_expectation_stats (사전 집계) 우선 조회, 없거나 오래되면 원시 이력 집계
+        self.use_stats_table = use_stats_table
+        self.stats_max_age_days = stats_max_age_days
         self._cache: Dict[str, ExpectationStats] = {}
+        # 백분위 계산용 정렬 표본 LRU 캐시: (event_code, horizon) → 오름차순 ndarray
+        self.sample_cache_size = sample_cache_size
+        self._sorted_samples: "OrderedDict[Tuple[str, int], np.ndarray]" = OrderedDict()
+        self._samples_lock = threading.Lock()  # API 스레드풀에서 동시에 접근
     
     def get_expectation(
         self,
@@ -51,13 +82,18 @@ class ExpectationModel:
         if cache_key in self._cache:
             logger.debug(f"캐시 히트: {cache_key}")
             return self._cache[cache_key]
+
+        # 사전 집계 테이블 조회 (한 행)
+        if self.use_stats_table:
+            found, stats = self._get_precomputed(event_code, horizon)
+            if found:
+                if stats:
+                    self._cache[cache_key] = stats
+                return stats
         
-        # DB 조회
-        conn = None
+        # DB 조회 (원시 이력 폴백)
         try:
-            conn = pymysql.connect(**self.db_config)
-            
-            with conn.cursor() as cursor:
+            with self.pool.connection() as conn, conn.cursor() as cursor:
                 # 과거 동일 이벤트의 수익률 조회
                 sql = f"""
                     SELECT return_{horizon}d as ret
@@ -80,21 +116,7 @@ class ExpectationModel:
                 returns = np.array([float(r[0]) for r in rows])
                 
                 # 통계 계산
-                q25 = float(np.percentile(returns, 25))
-                q75 = float(np.percentile(returns, 75))
-                
-                stats = ExpectationStats(
-                    event_code=event_code,
-                    horizon=horizon,
-                    mean=float(np.mean(returns)),
-                    median=float(np.median(returns)),
-                    std=float(np.std(returns, ddof=1)),  # 표본 표준편차
-                    q25=q25,
-                    q75=q75,
-                    iqr=q75 - q25,
-                    count=len(returns),
-                    confidence=self._calculate_confidence(len(returns))
-                )
+                stats = self._to_stats(event_code, horizon, summarize_returns(returns))
                 
                 # 캐시 저장
                 self._cache[cache_key] = stats
@@ -110,18 +132,109 @@ class ExpectationModel:
         except Exception as e:
             logger.error(f"기대효과 계산 실패: {e}", exc_info=True)
             return None
-        
-        finally:
-            if conn:
-                conn.close()
     
+    def _get_precomputed(
+        self,
+        event_code: str,
+        horizon: int
+    ) -> Tuple[bool, Optional[ExpectationStats]]:
+        """event_expectation_stats 에서 최신 집계 조회 → (행 존재 여부, 통계)"""
+        try:
+            with self.pool.connection() as conn, conn.cursor(pymysql.cursors.DictCursor) as cursor:
+                cursor.execute("""
+                    SELECT mean_return, median_return, std_return,
+                           q25, q75, iqr, sample_count
+                    FROM event_expectation_stats
+                    WHERE event_code = %s
+                      AND horizon = %s
+                      AND lookback_days = %s
+                      AND as_of_date >= DATE_SUB(CURDATE(), INTERVAL %s DAY)
+                    ORDER BY as_of_date DESC
+                    LIMIT 1
+                """, (event_code, horizon, self.lookback_days, self.stats_max_age_days))
+                row = cursor.fetchone()
+        except Exception as e:
+            logger.warning(f"사전 집계 조회 실패 → 원시 이력 집계 사용: {e}")
+            self.use_stats_table = False
+            return False, None
+
+        if not row:
+            return False, None
+
+        if int(row['sample_count']) < self.min_samples:
+            logger.warning(
+                f"샘플 부족: {event_code} H={horizon}, "
+                f"n={row['sample_count']} < {self.min_samples}"
+            )
+            return True, None
+
+        stats = self._to_stats(event_code, horizon, {
+            "mean": float(row['mean_return']),
+            "median": float(row['median_return']),
+            "std": float(row['std_return']),
+            "q25": float(row['q25']),
+            "q75": float(row['q75']),
+            "iqr": float(row['iqr']),
+            "count": int(row['sample_count']),
+        })
+        logger.debug(f"사전 집계 기대효과: {event_code} H={horizon}, n={stats.count}")
+        return True, stats
+
+    def _to_stats(self, event_code: str, horizon: int, summary: Dict[str, float]) -> ExpectationStats:
+        return ExpectationStats(
+            event_code=event_code,
+            horizon=horizon,
+            confidence=self._calculate_confidence(summary["count"]),
+            **summary
+        )
+
     def _calculate_confidence(self, n: int) -> float:
 
         return min(1.0, n / 100.0)
     
+    def get_sorted_returns(self, event_code: str, horizon: int) -> Optional[np.ndarray]:
+        """event_code/horizon 전체 이력 수익률 (오름차순, LRU 캐시)"""
+        key = (event_code, horizon)
+        with self._samples_lock:
+            cached = self._sorted_samples.get(key)
+            if cached is not None:
+                self._sorted_samples.move_to_end(key)
+                return cached
+
+        try:
+            with self.pool.connection() as conn, conn.cursor() as cursor:
+                cursor.execute(f"""
+                    SELECT return_{horizon}d
+                    FROM event_returns_history
+                    WHERE event_code = %s
+                      AND return_{horizon}d IS NOT NULL
+                """, (event_code,))
+                rows = cursor.fetchall()
+        except Exception as e:
+            logger.error(f"수익률 표본 조회 실패: {e}", exc_info=True)
+            return None
+
+        arr = np.sort(np.fromiter((float(r[0]) for r in rows), dtype=np.float64, count=len(rows)))
+        # 조회는 잠금 밖에서 하므로 다른 스레드가 먼저 넣었을 수 있음 (같은 값, 덮어써도 무방)
+        with self._samples_lock:
+            self._sorted_samples[key] = arr
+            self._sorted_samples.move_to_end(key)
+            while len(self._sorted_samples) > self.sample_cache_size:
+                self._sorted_samples.popitem(last=False)
+        return arr
+
+    def get_percentiles(self, event_code: str, horizon: int, values) -> np.ndarray:
+        """값들의 역사적 백분위 (값보다 작은 표본 비율, 표본 없으면 0.5)"""
+        values = np.asarray(values, dtype=np.float64)
+        sample = self.get_sorted_returns(event_code, horizon)
+        if sample is None or sample.size == 0:
+            return np.full(values.shape, 0.5)
+        return np.searchsorted(sample, values, side='left') / sample.size
+
     def clear_cache(self):
         """캐시 초기화 (일일 배치 시작 시 호출)"""
         self._cache.clear()
+        self._sorted_samples.clear()
         logger.info("기대효과 캐시 초기화")
     
     def get_all_expectations(
@@ -0,0 +1,193 @@
+from __future__ import annotations
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Iterable
+import numpy as np
+import logging
+
+from munci.main_utils.db_pool import ConnectionPool, get_pool
+from munci.signal_gap.models.expectation_model import summarize_returns
+
+logger = logging.getLogger(__name__)
+
+
+class ExpectationStatsRefresher:
+    """event_returns_history → event_expectation_stats 사전 집계 (증분 갱신)
+
+    - as_of_date 별로 (event_code, horizon, lookback_days) 한 행씩 저장
+    - 같은 as_of_date 집계가 이미 있으면, 마지막 집계 이후 updated_at 이 바뀐
+      event_code 만 다시 집계
+    - 새 as_of_date 면 윈도우가 이동하므로 horizon 당 한 번의 스캔으로 전체 집계
+    """
+
+    def __init__(
+        self,
+        db_config: dict,
+        horizons: List[int] = None,
+        lookback_days: int = 365,
+        pool: Optional[ConnectionPool] = None,
+        batch_size: int = 1000
+    ):
+
+        self.db_config = db_config
+        self.pool = pool or get_pool(db_config)
+        self.horizons = horizons or [1, 3, 5]
+        self.lookback_days = lookback_days
+        self.batch_size = batch_size
+
+    def refresh(self, as_of_date: Optional[date] = None, full: bool = False) -> int:
+        """집계 갱신 후 저장한 행 수 반환"""
+        as_of_date = as_of_date or date.today()
+
+        with self.pool.connection() as conn:
+            # 집계 시작 전 워터마크를 먼저 읽어 두어, 집계 중 들어온 행은 다음 회차에 반영
+            source_wm = self._source_watermark(conn)
+            stored_wm = None if full else self._stored_watermark(conn, as_of_date)
+
+            if stored_wm is None:
+                event_codes = None
+                logger.info(f"기대효과 전체 집계: as_of={as_of_date}, lookback={self.lookback_days}")
+            else:
+                event_codes = self._changed_event_codes(conn, stored_wm)
+                if not event_codes:
+                    logger.info(f"기대효과 집계 변경 없음 (워터마크={stored_wm})")
+                    return 0
+                logger.info(f"기대효과 증분 집계: {len(event_codes)}개 이벤트 (워터마크={stored_wm})")
+
+            rows = []
+            for horizon in self.horizons:
+                samples = self._fetch_samples(conn, horizon, as_of_date, event_codes)
+                for event_code, returns in samples.items():
+                    summary = summarize_returns(returns)
+                    rows.append((
+                        event_code, horizon, self.lookback_days, as_of_date,
+                        summary["mean"], summary["median"], summary["std"],
+                        summary["q25"], summary["q75"], summary["iqr"],
+                        summary["count"], source_wm
+                    ))
+
+            saved = self._upsert(conn, rows)
+
+        logger.info(f"기대효과 집계 저장: {saved}행 (as_of={as_of_date})")
+        return saved
+
+    # --------------------------- internals ---------------------------
+
+    def _source_watermark(self, conn) -> Optional[datetime]:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT MAX(updated_at) FROM event_returns_history")
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    def _stored_watermark(self, conn, as_of_date: date) -> Optional[datetime]:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT MAX(source_updated_at)
+                FROM event_expectation_stats
+                WHERE as_of_date = %s
+                  AND lookback_days = %s
+            """, (as_of_date, self.lookback_days))
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    def _changed_event_codes(self, conn, since: datetime) -> List[str]:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT DISTINCT event_code
+                FROM event_returns_history
+                WHERE updated_at > %s
+            """, (since,))
+            return [r[0] for r in cursor.fetchall()]
+
+    def _fetch_samples(
+        self,
+        conn,
+        horizon: int,
+        as_of_date: date,
+        event_codes: Optional[Iterable[str]] = None
+    ) -> Dict[str, np.ndarray]:
+        """horizon 하나에 대해 윈도우 내 수익률을 한 번에 읽어 event_code 별로 분리"""
+        # event_date 는 VARCHAR(8) YYYYMMDD → 같은 형식 문자열로 비교
+        start = (as_of_date - timedelta(days=self.lookback_days)).strftime("%Y%m%d")
+        end = as_of_date.strftime("%Y%m%d")
+
+        sql = f"""
+            SELECT event_code, return_{horizon}d
+            FROM event_returns_history
+            WHERE return_{horizon}d IS NOT NULL
+              AND event_date >= %s
+              AND event_date <= %s
+        """
+        params: list = [start, end]
+        if event_codes is not None:
+            codes = list(event_codes)
+            sql += f" AND event_code IN ({','.join(['%s'] * len(codes))})"
+            params.extend(codes)
+
+        grouped: Dict[str, List[float]] = {}
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            for event_code, ret in cursor.fetchall():
+                grouped.setdefault(event_code, []).append(float(ret))
+
+        return {code: np.asarray(vals, dtype=np.float64) for code, vals in grouped.items()}
+
+    def _upsert(self, conn, rows: list) -> int:
+        if not rows:
+            return 0
+
+        sql = """
+            INSERT INTO event_expectation_stats
+            (event_code, horizon, lookback_days, as_of_date,
+             mean_return, median_return, std_return, q25, q75, iqr,
+             sample_count, source_updated_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                mean_return = VALUES(mean_return),
+                median_return = VALUES(median_return),
+                std_return = VALUES(std_return),
+                q25 = VALUES(q25),
+                q75 = VALUES(q75),
+                iqr = VALUES(iqr),
+                sample_count = VALUES(sample_count),
+                source_updated_at = VALUES(source_updated_at)
+        """
+        with conn.cursor() as cursor:
+            for i in range(0, len(rows), self.batch_size):
+                cursor.executemany(sql, rows[i:i + self.batch_size])
+                conn.commit()
+
+        return len(rows)
+
+
+def refresh_expectation_stats(
+    db_config: dict,
+    lookback_days: int = 365,
+    full: bool = False
+) -> int:
+
+    refresher = ExpectationStatsRefresher(db_config, lookback_days=lookback_days)
+    return refresher.refresh(full=full)
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    from dotenv import load_dotenv
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    load_dotenv()
+
+    db_config = {
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'user': os.getenv('DB_USERNAME'),
+        'password': os.getenv('DB_PASSWORD'),
+        'database': os.getenv('DB_DATABASE'),
+        'port': int(os.getenv('DB_PORT', 3306))
+    }
+
+    # python -m munci.signal_gap.models.expectation_refresh [full]
+    refresh_expectation_stats(db_config, full=(len(sys.argv) > 1 and sys.argv[1] == "full"))
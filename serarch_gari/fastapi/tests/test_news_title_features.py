@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from benchmarks.news_title_features import generate_keyphrases_loop, simhash64_loop
+from munci.news_es.utils import (
+    generate_keyphrases,
+    generate_keyphrases_batch,
+    simhash64,
+    simhash64_batch,
+    title_features_batch,
+)
+
+LONG_TITLE = " ".join(f"토큰{i} word{i % 7}" for i in range(400))
+
+TITLES = [
+    "",
+    None,
+    "!!! ... ???",                                  # 토큰 없음 (2글자 미만/구두점만)
+    "a b c",
+    "삼성전자",
+    "삼성전자 삼성전자",                              # 같은 토큰 반복
+    "삼성전자 삼성전자 삼성전자 실적 실적",
+    "Samsung SAMSUNG samsung HBM 공급 확대",         # 대소문자 섞임
+    "삼성전자, 3Q 영업이익 10조... 반도체 회복 [속보]",
+    LONG_TITLE,
+]
+
+
+@pytest.mark.parametrize("title", TITLES)
+def test_simhash64_matches_reference(title):
+    assert simhash64(title) == simhash64_loop(title)
+
+
+@pytest.mark.parametrize("title", TITLES)
+def test_keyphrases_match_reference(title):
+    assert generate_keyphrases(title) == generate_keyphrases_loop(title)
+    assert generate_keyphrases(title, max_n=5) == generate_keyphrases_loop(title, max_n=5)
+
+
+def test_batches_match_single_item():
+    assert simhash64_batch(TITLES) == [simhash64(t) for t in TITLES]
+    assert generate_keyphrases_batch(TITLES) == [generate_keyphrases(t) for t in TITLES]
+
+    keyphrases, hashes = title_features_batch(TITLES)
+    assert keyphrases == [generate_keyphrases(t) for t in TITLES]
+    assert hashes == [simhash64(t) for t in TITLES]
+
+
+def test_batch_of_empty_titles():
+    assert simhash64_batch(["", None, "?"]) == ["0x0", "0x0", "0x0"]
+    assert simhash64_batch([]) == []
+    assert title_features_batch([]) == ([], [])
+
+
+def test_random_batch_matches_reference():
+    rng = random.Random(0)
+    words = ["삼성전자", "SK하이닉스", "실적", "발표", "AI", "HBM", "2024", "x"] + [f"w{i}" for i in range(50)]
+    titles = [" ".join(rng.choice(words) for _ in range(rng.randint(0, 30))) for _ in range(300)]
+
+    assert simhash64_batch(titles) == [simhash64_loop(t) for t in titles]
+    assert generate_keyphrases_batch(titles) == [generate_keyphrases_loop(t) for t in titles]